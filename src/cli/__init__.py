@@ -4,11 +4,11 @@ This package provides the command-line interface:
 - main: Entry point and all CLI commands
 
 Commands are organized by function:
-- Encryption: encrypt, decrypt
+- Encryption: encrypt, decrypt, encrypt-batch, decrypt-batch
 - Cloud: upload, download
-- Media: resize, filter, info
+- Media: resize, filter, batch-resize, info
 - License: activate, status, deactivate
-- Medical: dicom-info, anonymize, convert, preprocess, predict, segment
+- Medical: dicom-info, anonymize, convert, inspect-and-convert, preprocess, predict, serve, segment
 
 Example:
     $ smp encrypt input.jpg output.enc
@@ -1,34 +1,43 @@
 """Cloud storage CLI commands."""
 
 import click
-from colorama import Fore, Style
+from pathlib import Path
+from src.cli.colors import CYAN, GREEN, RED, YELLOW, RESET
 from typing import Optional
 
 from src.config import settings
-from src.cloud_storage import CloudStorageManager
+
+# Premium features advertised when a free-tier user tries to upload
+_UPGRADE_FEATURES = (
+    "AWS S3, Google Drive, Dropbox connectors",
+    "GPU-accelerated processing",
+    "Batch operations",
+)
+_UPGRADE_FEATURES_TEXT = "\n".join(f"  • {feature}" for feature in _UPGRADE_FEATURES)
 
 
 @click.command()
-@click.argument('local_file', type=click.Path(exists=True))
+@click.argument('local_file', type=click.Path(exists=True, dir_okay=False, path_type=Path))
 @click.option('--remote-key', help='Remote object key')
 @click.option('--bucket', help='S3 bucket name')
-def upload(local_file: str, remote_key: Optional[str], bucket: Optional[str]):
+def upload(local_file: Path, remote_key: Optional[str], bucket: Optional[str]):
     """Upload an encrypted file to cloud storage."""
     from src.license_manager import get_license_manager, FeatureFlags
+    from src.cloud_storage import CloudStorageManager
 
     # Check license for cloud storage feature
     manager = get_license_manager()
     if not manager.check_feature(FeatureFlags.CLOUD_STORAGE):
-        click.echo(f"{Fore.RED}✗ Cloud storage requires a Pro or Enterprise license{Style.RESET_ALL}")
-        click.echo(f"\n{Fore.CYAN}💎 Upgrade to unlock:{Style.RESET_ALL}")
-        click.echo(f"  • AWS S3, Google Drive, Dropbox connectors")
-        click.echo(f"  • GPU-accelerated processing")
-        click.echo(f"  • Batch operations")
-        click.echo(f"\n{Fore.GREEN}Visit https://secure-media-processor.com/pricing{Style.RESET_ALL}")
-        click.echo(f"{Fore.YELLOW}Or activate your license: smp license activate YOUR-LICENSE-KEY{Style.RESET_ALL}")
+        click.echo("\n".join([
+            f"{RED}✗ Cloud storage requires a Pro or Enterprise license{RESET}",
+            f"\n{CYAN}💎 Upgrade to unlock:{RESET}",
+            _UPGRADE_FEATURES_TEXT,
+            f"\n{GREEN}Visit https://secure-media-processor.com/pricing{RESET}",
+            f"{YELLOW}Or activate your license: smp license activate YOUR-LICENSE-KEY{RESET}",
+        ]))
         raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}☁️  Uploading to cloud storage...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}☁️  Uploading to cloud storage...{RESET}")
 
     try:
         bucket_name = bucket or settings.aws_bucket_name
@@ -45,16 +54,18 @@ def upload(local_file: str, remote_key: Optional[str], bucket: Optional[str]):
         result = storage.upload_file(local_file, remote_key=remote_key)
 
         if result['success']:
-            click.echo(f"{Fore.GREEN}✓ File uploaded successfully!{Style.RESET_ALL}")
-            click.echo(f"  Remote key: {result['remote_key']}")
-            click.echo(f"  Size: {result['size']:,} bytes")
-            click.echo(f"  Checksum: {result['checksum']}")
+            click.echo("\n".join([
+                f"{GREEN}✓ File uploaded successfully!{RESET}",
+                f"  Remote key: {result['remote_key']}",
+                f"  Size: {result['size']:,} bytes",
+                f"  Checksum: {result['checksum']}",
+            ]))
         else:
-            click.echo(f"{Fore.RED}✗ Upload failed: {result['error']}{Style.RESET_ALL}")
+            click.echo(f"{RED}✗ Upload failed: {result['error']}{RESET}")
             raise click.Abort()
 
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Upload failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Upload failed: {e}{RESET}")
         raise click.Abort()
 
 
@@ -63,18 +74,21 @@ def upload(local_file: str, remote_key: Optional[str], bucket: Optional[str]):
 @click.argument('local_file', type=click.Path())
 @click.option('--bucket', help='S3 bucket name')
 @click.option('--verify/--no-verify', default=True, help='Verify checksum')
-def download(remote_key: str, local_file: str, bucket: Optional[str], verify: bool):
+@click.option('--fadvise/--no-fadvise', default=True,
+              help='Keep the downloaded file out of the page cache after verification')
+def download(remote_key: str, local_file: str, bucket: Optional[str], verify: bool, fadvise: bool):
     """Download an encrypted file from cloud storage."""
     from src.license_manager import get_license_manager, FeatureFlags
+    from src.cloud_storage import CloudStorageManager
 
     # Check license for cloud storage feature
     manager = get_license_manager()
     if not manager.check_feature(FeatureFlags.CLOUD_STORAGE):
-        click.echo(f"{Fore.RED}✗ Cloud storage requires a Pro or Enterprise license{Style.RESET_ALL}")
-        click.echo(f"\n{Fore.YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Cloud storage requires a Pro or Enterprise license{RESET}")
+        click.echo(f"\n{YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{RESET}")
         raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}☁️  Downloading from cloud storage...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}☁️  Downloading from cloud storage...{RESET}")
 
     try:
         bucket_name = bucket or settings.aws_bucket_name
@@ -88,17 +102,21 @@ def download(remote_key: str, local_file: str, bucket: Optional[str], verify: bo
             secret_key=settings.aws_secret_access_key
         )
 
-        result = storage.download_file(remote_key, local_file, verify_checksum=verify)
+        result = storage.download_file(
+            remote_key, local_file, verify_checksum=verify, fadvise=fadvise
+        )
 
         if result['success']:
-            click.echo(f"{Fore.GREEN}✓ File downloaded successfully!{Style.RESET_ALL}")
-            click.echo(f"  Local path: {result['local_path']}")
-            click.echo(f"  Size: {result['size']:,} bytes")
-            click.echo(f"  Checksum verified: {result['checksum_verified']}")
+            click.echo("\n".join([
+                f"{GREEN}✓ File downloaded successfully!{RESET}",
+                f"  Local path: {result['local_path']}",
+                f"  Size: {result['size']:,} bytes",
+                f"  Checksum verified: {result['checksum_verified']}",
+            ]))
         else:
-            click.echo(f"{Fore.RED}✗ Download failed: {result['error']}{Style.RESET_ALL}")
+            click.echo(f"{RED}✗ Download failed: {result['error']}{RESET}")
             raise click.Abort()
 
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Download failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Download failed: {e}{RESET}")
         raise click.Abort()
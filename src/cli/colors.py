@@ -0,0 +1,15 @@
+"""ANSI color constants for CLI output.
+
+Resolved once at import: raw escape sequences when stdout is a terminal,
+empty strings otherwise so redirected output carries no escape codes.
+"""
+
+import sys
+
+USE_COLOR = sys.stdout.isatty()
+
+CYAN = '\x1b[36m' if USE_COLOR else ''
+GREEN = '\x1b[32m' if USE_COLOR else ''
+RED = '\x1b[31m' if USE_COLOR else ''
+YELLOW = '\x1b[33m' if USE_COLOR else ''
+RESET = '\x1b[0m' if USE_COLOR else ''
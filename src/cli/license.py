@@ -1,7 +1,30 @@
 """License management CLI commands."""
 
 import click
-from colorama import Fore, Style
+from functools import lru_cache
+from typing import Iterable
+from src.cli.colors import CYAN, GREEN, RED, YELLOW, RESET
+
+# Premium features advertised to free-tier users by `license status`
+_PREMIUM_FEATURES = (
+    "Cloud storage (S3, Drive, Dropbox)",
+    "GPU-accelerated processing",
+    "Batch operations",
+    "Multi-cloud sync (Enterprise)",
+    "Priority support (Enterprise)",
+)
+_PREMIUM_FEATURES_TEXT = "\n".join(f"  • {feature}" for feature in _PREMIUM_FEATURES)
+
+
+@lru_cache(maxsize=None)
+def _feature_title(feature: str) -> str:
+    """Turn a feature flag value like 'cloud_storage' into 'Cloud Storage'."""
+    return feature.replace('_', ' ').title()
+
+
+def _feature_lines(features: Iterable[str]) -> str:
+    """Format enabled features as a single checklist block."""
+    return "\n".join(f"  ✓ {_feature_title(feature)}" for feature in features)
 
 
 @click.group()
@@ -17,37 +40,39 @@ def activate(license_key: str, email: str):
     """Activate a license key."""
     from src.license_manager import get_license_manager
 
-    click.echo(f"{Fore.CYAN}🔑 Activating license...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}🔑 Activating license...{RESET}")
 
     try:
         manager = get_license_manager()
         license_obj = manager.activate_license(license_key, email)
 
-        click.echo(f"{Fore.GREEN}✓ License activated successfully!{Style.RESET_ALL}\n")
-        click.echo(f"{Fore.YELLOW}License Type:{Style.RESET_ALL} {license_obj.license_type.value.upper()}")
-        click.echo(f"{Fore.YELLOW}Email:{Style.RESET_ALL} {license_obj.email}")
+        lines = [
+            f"{GREEN}✓ License activated successfully!{RESET}\n",
+            f"{YELLOW}License Type:{RESET} {license_obj.license_type.value.upper()}",
+            f"{YELLOW}Email:{RESET} {license_obj.email}",
+        ]
 
         if license_obj.expires_at:
             days_left = (license_obj.expires_at - license_obj.issued_at).days
-            click.echo(f"{Fore.YELLOW}Valid For:{Style.RESET_ALL} {days_left} days")
+            lines.append(f"{YELLOW}Valid For:{RESET} {days_left} days")
         else:
-            click.echo(f"{Fore.YELLOW}Valid For:{Style.RESET_ALL} Lifetime")
+            lines.append(f"{YELLOW}Valid For:{RESET} Lifetime")
 
-        click.echo(f"\n{Fore.GREEN}Enabled Features:{Style.RESET_ALL}")
+        lines.append(f"\n{GREEN}Enabled Features:{RESET}")
         if license_obj.features:
-            for feature in license_obj.features:
-                click.echo(f"  ✓ {feature.replace('_', ' ').title()}")
+            lines.append(_feature_lines(license_obj.features))
         else:
-            click.echo(f"  {Fore.YELLOW}(Free tier - local encryption only){Style.RESET_ALL}")
+            lines.append(f"  {YELLOW}(Free tier - local encryption only){RESET}")
 
-        click.echo(f"\n{Fore.CYAN}🎉 Thank you for supporting Secure Media Processor!{Style.RESET_ALL}")
+        lines.append(f"\n{CYAN}🎉 Thank you for supporting Secure Media Processor!{RESET}")
+        click.echo("\n".join(lines))
 
     except ValueError as e:
-        click.echo(f"{Fore.RED}✗ Activation failed: {e}{Style.RESET_ALL}")
-        click.echo(f"\n{Fore.YELLOW}Need help? Visit https://secure-media-processor.com/support{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Activation failed: {e}{RESET}")
+        click.echo(f"\n{YELLOW}Need help? Visit https://secure-media-processor.com/support{RESET}")
         raise click.Abort()
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Unexpected error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Unexpected error: {e}{RESET}")
         raise click.Abort()
 
 
@@ -56,44 +81,45 @@ def status():
     """Show current license status."""
     from src.license_manager import get_license_manager
 
-    click.echo(f"{Fore.CYAN}📋 License Status{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}📋 License Status{RESET}\n")
 
     try:
         manager = get_license_manager()
         info = manager.get_license_info()
 
         if info['active']:
-            click.echo(f"{Fore.GREEN}Status:{Style.RESET_ALL} ✓ Active")
-            click.echo(f"{Fore.YELLOW}Type:{Style.RESET_ALL} {info['type'].upper()}")
-            click.echo(f"{Fore.YELLOW}Email:{Style.RESET_ALL} {info['email']}")
+            lines = [
+                f"{GREEN}Status:{RESET} ✓ Active",
+                f"{YELLOW}Type:{RESET} {info['type'].upper()}",
+                f"{YELLOW}Email:{RESET} {info['email']}",
+            ]
 
             if info['days_remaining']:
-                color = Fore.RED if info['days_remaining'] < 30 else Fore.GREEN
-                click.echo(f"{Fore.YELLOW}Expires:{Style.RESET_ALL} {color}{info['days_remaining']} days{Style.RESET_ALL}")
+                color = RED if info['days_remaining'] < 30 else GREEN
+                lines.append(f"{YELLOW}Expires:{RESET} {color}{info['days_remaining']} days{RESET}")
             else:
-                click.echo(f"{Fore.YELLOW}Expires:{Style.RESET_ALL} {Fore.GREEN}Never (Lifetime){Style.RESET_ALL}")
+                lines.append(f"{YELLOW}Expires:{RESET} {GREEN}Never (Lifetime){RESET}")
 
-            click.echo(f"{Fore.YELLOW}Devices:{Style.RESET_ALL} {info['activated_devices']}/{info['max_devices']}")
+            lines.append(f"{YELLOW}Devices:{RESET} {info['activated_devices']}/{info['max_devices']}")
 
-            click.echo(f"\n{Fore.GREEN}Enabled Features:{Style.RESET_ALL}")
+            lines.append(f"\n{GREEN}Enabled Features:{RESET}")
             if info['features']:
-                for feature in info['features']:
-                    click.echo(f"  ✓ {feature.replace('_', ' ').title()}")
+                lines.append(_feature_lines(info['features']))
             else:
-                click.echo(f"  {Fore.YELLOW}(None - Free tier){Style.RESET_ALL}")
+                lines.append(f"  {YELLOW}(None - Free tier){RESET}")
         else:
-            click.echo(f"{Fore.YELLOW}Status:{Style.RESET_ALL} Free Tier")
-            click.echo(f"{Fore.YELLOW}Message:{Style.RESET_ALL} {info['message']}")
-            click.echo(f"\n{Fore.CYAN}💎 Upgrade to Pro or Enterprise for premium features:{Style.RESET_ALL}")
-            click.echo(f"  • Cloud storage (S3, Drive, Dropbox)")
-            click.echo(f"  • GPU-accelerated processing")
-            click.echo(f"  • Batch operations")
-            click.echo(f"  • Multi-cloud sync (Enterprise)")
-            click.echo(f"  • Priority support (Enterprise)")
-            click.echo(f"\n{Fore.GREEN}Visit https://secure-media-processor.com/pricing{Style.RESET_ALL}")
+            lines = [
+                f"{YELLOW}Status:{RESET} Free Tier",
+                f"{YELLOW}Message:{RESET} {info['message']}",
+                f"\n{CYAN}💎 Upgrade to Pro or Enterprise for premium features:{RESET}",
+                _PREMIUM_FEATURES_TEXT,
+                f"\n{GREEN}Visit https://secure-media-processor.com/pricing{RESET}",
+            ]
+
+        click.echo("\n".join(lines))
 
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Error: {e}{RESET}")
         raise click.Abort()
 
 
@@ -103,17 +129,17 @@ def deactivate():
     """Deactivate license on this device."""
     from src.license_manager import get_license_manager
 
-    click.echo(f"{Fore.CYAN}🔓 Deactivating license...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}🔓 Deactivating license...{RESET}")
 
     try:
         manager = get_license_manager()
         if manager.deactivate_license():
-            click.echo(f"{Fore.GREEN}✓ License deactivated successfully{Style.RESET_ALL}")
-            click.echo(f"\n{Fore.YELLOW}You can now activate this license on another device.{Style.RESET_ALL}")
-            click.echo(f"{Fore.YELLOW}Free tier features remain available.{Style.RESET_ALL}")
+            click.echo(f"{GREEN}✓ License deactivated successfully{RESET}")
+            click.echo(f"\n{YELLOW}You can now activate this license on another device.{RESET}")
+            click.echo(f"{YELLOW}Free tier features remain available.{RESET}")
         else:
-            click.echo(f"{Fore.YELLOW}No active license found{Style.RESET_ALL}")
+            click.echo(f"{YELLOW}No active license found{RESET}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Error: {e}{RESET}")
         raise click.Abort()
@@ -5,11 +5,16 @@ modular subcommand files.
 """
 
 import click
-from colorama import init
 import logging
+import sys
 
-# Initialize colorama
-init(autoreset=True)
+from src.cli.colors import USE_COLOR
+
+# Legacy Windows consoles need colorama to interpret ANSI escapes. Skip it
+# (and its import) when output is redirected or on other platforms.
+if USE_COLOR and sys.platform == 'win32':
+    import colorama
+    colorama.just_fix_windows_console()
 
 # Setup logging
 logging.basicConfig(
@@ -27,19 +32,22 @@ def cli():
 
 
 # Import and register commands from submodules
-from src.cli.crypto import encrypt, decrypt
+from src.cli.crypto import encrypt, decrypt, encrypt_batch, decrypt_batch
 from src.cli.cloud import upload, download
-from src.cli.media import resize, filter_image, info
+from src.cli.media import resize, filter_image, batch_resize, info
 from src.cli.license import license
 from src.cli.medical import medical
 
 # Register individual commands
 cli.add_command(encrypt)
 cli.add_command(decrypt)
+cli.add_command(encrypt_batch)
+cli.add_command(decrypt_batch)
 cli.add_command(upload)
 cli.add_command(download)
 cli.add_command(resize)
 cli.add_command(filter_image, name='filter')
+cli.add_command(batch_resize)
 cli.add_command(info)
 
 # Register command groups
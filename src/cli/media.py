@@ -1,18 +1,39 @@
 """Media processing CLI commands."""
 
 import click
-from colorama import Fore, Style
+import glob
+from functools import lru_cache
+from pathlib import Path
+from src.cli.colors import CYAN, GREEN, RED, YELLOW, RESET
 
-from src.gpu_processor import GPUMediaProcessor
+
+@lru_cache(maxsize=2)
+def _processor(gpu_enabled: bool = True):
+    """Return a process-lifetime GPUMediaProcessor for the given mode.
+
+    Cached on gpu_enabled so repeated commands in the same interpreter
+    reuse the initialized device context instead of warming it again.
+    """
+    from src.gpu_processor import GPUMediaProcessor
+
+    return GPUMediaProcessor(gpu_enabled=gpu_enabled)
+
+
+@lru_cache(maxsize=1)
+def _cached_device_info() -> dict:
+    """Probe the compute device once per process without building a processor."""
+    from src.gpu_processor import probe_device
+
+    return probe_device()
 
 
 @click.command()
-@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('input_file', type=click.Path(exists=True, path_type=Path))
 @click.argument('output_file', type=click.Path())
 @click.option('--width', type=int, required=True, help='Target width')
 @click.option('--height', type=int, required=True, help='Target height')
 @click.option('--gpu/--no-gpu', default=True, help='Use GPU acceleration')
-def resize(input_file: str, output_file: str, width: int, height: int, gpu: bool):
+def resize(input_file: Path, output_file: str, width: int, height: int, gpu: bool):
     """Resize an image using GPU acceleration."""
     from src.license_manager import get_license_manager, FeatureFlags
 
@@ -20,15 +41,15 @@ def resize(input_file: str, output_file: str, width: int, height: int, gpu: bool
     if gpu:
         manager = get_license_manager()
         if not manager.check_feature(FeatureFlags.GPU_PROCESSING):
-            click.echo(f"{Fore.RED}✗ GPU processing requires a Pro or Enterprise license{Style.RESET_ALL}")
-            click.echo(f"\n{Fore.YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{Style.RESET_ALL}")
-            click.echo(f"{Fore.YELLOW}Or use CPU: add --no-gpu flag{Style.RESET_ALL}")
+            click.echo(f"{RED}✗ GPU processing requires a Pro or Enterprise license{RESET}")
+            click.echo(f"\n{YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{RESET}")
+            click.echo(f"{YELLOW}Or use CPU: add --no-gpu flag{RESET}")
             raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}🖼️  Resizing image...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}🖼️  Resizing image...{RESET}")
 
     try:
-        processor = GPUMediaProcessor(gpu_enabled=gpu)
+        processor = _processor(gpu)
 
         result = processor.resize_image(
             input_file,
@@ -36,25 +57,27 @@ def resize(input_file: str, output_file: str, width: int, height: int, gpu: bool
             size=(width, height)
         )
 
-        click.echo(f"{Fore.GREEN}✓ Image resized successfully!{Style.RESET_ALL}")
-        click.echo(f"  Original size: {result['original_size']}")
-        click.echo(f"  New size: {result['new_size']}")
-        click.echo(f"  Device: {result['device']}")
-        click.echo(f"  Output: {result['output_path']}")
+        click.echo("\n".join([
+            f"{GREEN}✓ Image resized successfully!{RESET}",
+            f"  Original size: {result['original_size']}",
+            f"  New size: {result['new_size']}",
+            f"  Device: {result['device']}",
+            f"  Output: {result['output_path']}",
+        ]))
 
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Resize failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Resize failed: {e}{RESET}")
         raise click.Abort()
 
 
 @click.command('filter')
-@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('input_file', type=click.Path(exists=True, path_type=Path))
 @click.argument('output_file', type=click.Path())
 @click.option('--filter', 'filter_type', type=click.Choice(['blur', 'sharpen', 'edge']),
               default='blur', help='Filter type')
 @click.option('--intensity', type=float, default=1.0, help='Filter intensity')
 @click.option('--gpu/--no-gpu', default=True, help='Use GPU acceleration')
-def filter_image(input_file: str, output_file: str, filter_type: str, intensity: float, gpu: bool):
+def filter_image(input_file: Path, output_file: str, filter_type: str, intensity: float, gpu: bool):
     """Apply filters to an image."""
     from src.license_manager import get_license_manager, FeatureFlags
 
@@ -62,15 +85,15 @@ def filter_image(input_file: str, output_file: str, filter_type: str, intensity:
     if gpu:
         manager = get_license_manager()
         if not manager.check_feature(FeatureFlags.GPU_PROCESSING):
-            click.echo(f"{Fore.RED}✗ GPU processing requires a Pro or Enterprise license{Style.RESET_ALL}")
-            click.echo(f"\n{Fore.YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{Style.RESET_ALL}")
-            click.echo(f"{Fore.YELLOW}Or use CPU: add --no-gpu flag{Style.RESET_ALL}")
+            click.echo(f"{RED}✗ GPU processing requires a Pro or Enterprise license{RESET}")
+            click.echo(f"\n{YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{RESET}")
+            click.echo(f"{YELLOW}Or use CPU: add --no-gpu flag{RESET}")
             raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}🎨 Applying filter...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}🎨 Applying filter...{RESET}")
 
     try:
-        processor = GPUMediaProcessor(gpu_enabled=gpu)
+        processor = _processor(gpu)
 
         result = processor.apply_filter(
             input_file,
@@ -79,55 +102,132 @@ def filter_image(input_file: str, output_file: str, filter_type: str, intensity:
             intensity=intensity
         )
 
-        click.echo(f"{Fore.GREEN}✓ Filter applied successfully!{Style.RESET_ALL}")
-        click.echo(f"  Filter: {result['filter_type']}")
-        click.echo(f"  Intensity: {result['intensity']}")
-        click.echo(f"  Device: {result['device']}")
-        click.echo(f"  Output: {result['output_path']}")
+        click.echo("\n".join([
+            f"{GREEN}✓ Filter applied successfully!{RESET}",
+            f"  Filter: {result['filter_type']}",
+            f"  Intensity: {result['intensity']}",
+            f"  Device: {result['device']}",
+            f"  Output: {result['output_path']}",
+        ]))
 
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Filter failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}✗ Filter failed: {e}{RESET}")
         raise click.Abort()
 
 
-@click.command()
-def info():
-    """Display system and GPU information."""
-    click.echo(f"{Fore.CYAN}📊 System Information{Style.RESET_ALL}\n")
+@click.command('batch-resize')
+@click.argument('patterns', nargs=-1, required=True)
+@click.option('--output-dir', type=click.Path(file_okay=False), required=True,
+              help='Directory for resized images')
+@click.option('--width', type=int, required=True, help='Target width')
+@click.option('--height', type=int, required=True, help='Target height')
+@click.option('--gpu/--no-gpu', default=True, help='Use GPU acceleration')
+def batch_resize(patterns, output_dir: str, width: int, height: int, gpu: bool):
+    """Resize every image matching PATTERNS with a single processor."""
+    from src.license_manager import get_license_manager, FeatureFlags
+
+    manager = get_license_manager()
+    if not manager.check_feature(FeatureFlags.BATCH_PROCESSING):
+        click.echo(f"{RED}✗ Batch operations require a Pro or Enterprise license{RESET}")
+        click.echo(f"\n{YELLOW}Activate your license: smp license activate YOUR-LICENSE-KEY{RESET}")
+        raise click.Abort()
 
-    processor = GPUMediaProcessor()
-    device_info = processor.get_device_info()
+    if gpu and not manager.check_feature(FeatureFlags.GPU_PROCESSING):
+        click.echo(f"{RED}✗ GPU processing requires a Pro or Enterprise license{RESET}")
+        click.echo(f"{YELLOW}Or use CPU: add --no-gpu flag{RESET}")
+        raise click.Abort()
 
-    click.echo(f"{Fore.YELLOW}Device:{Style.RESET_ALL} {device_info['device']}")
-    click.echo(f"{Fore.YELLOW}Name:{Style.RESET_ALL} {device_info['name']}")
+    files = sorted({f for pattern in patterns for f in glob.glob(pattern)})
+    if not files:
+        click.echo(f"{YELLOW}No files matched{RESET}")
+        return
+
+    out_dir = Path(output_dir)
+    jobs = [(input_file, out_dir / Path(input_file).name) for input_file in files]
+
+    # Inputs from different directories can share a basename
+    sources = {}
+    for input_file, output_file in jobs:
+        sources.setdefault(output_file, []).append(input_file)
+    clashes = {out: inps for out, inps in sources.items() if len(inps) > 1}
+    if clashes:
+        for output_file, inputs in clashes.items():
+            click.echo(f"{RED}✗ {', '.join(inputs)} would all be written to {output_file}{RESET}")
+        raise click.Abort()
 
-    # Check for GPU types (CUDA, ROCM, MPS, XPU) - not 'GPU'
-    gpu_types = ['CUDA', 'ROCM', 'MPS', 'XPU']
-    if device_info['device'] in gpu_types:
-        # Show vendor if available
-        if 'vendor' in device_info:
-            click.echo(f"{Fore.YELLOW}Vendor:{Style.RESET_ALL} {device_info['vendor']}")
+    click.echo(f"{CYAN}🖼️  Resizing {len(files)} image(s)...{RESET}")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    processor = _processor(gpu)
+    failed = 0
 
-        # CUDA-specific info
-        if device_info['device'] == 'CUDA':
-            click.echo(f"{Fore.YELLOW}Total Memory:{Style.RESET_ALL} {device_info['memory_total']:.2f} GB")
-            click.echo(f"{Fore.YELLOW}Allocated Memory:{Style.RESET_ALL} {device_info['memory_allocated']:.2f} GB")
-            click.echo(f"{Fore.YELLOW}Cached Memory:{Style.RESET_ALL} {device_info['memory_cached']:.2f} GB")
-            click.echo(f"{Fore.YELLOW}CUDA Version:{Style.RESET_ALL} {device_info['cuda_version']}")
+    for input_file, output_file in jobs:
+        try:
+            processor.resize_image(input_file, output_file, size=(width, height))
+            click.echo(f"  ✓ {input_file} -> {output_file}")
+        except Exception as e:
+            failed += 1
+            click.echo(f"  {RED}✗ {input_file}: {e}{RESET}")
+
+    click.echo(f"\n{GREEN}Resized {len(files) - failed}/{len(files)} image(s){RESET}")
+    if failed:
+        raise click.Abort()
+
+
+def _cuda_info_lines(device_info: dict) -> list:
+    return [
+        f"{YELLOW}Total Memory:{RESET} {device_info['memory_total']:.2f} GB",
+        f"{YELLOW}Allocated Memory:{RESET} {device_info['memory_allocated']:.2f} GB",
+        f"{YELLOW}Cached Memory:{RESET} {device_info['memory_cached']:.2f} GB",
+        f"{YELLOW}CUDA Version:{RESET} {device_info['cuda_version']}",
+    ]
+
+
+def _rocm_info_lines(device_info: dict) -> list:
+    return [f"{YELLOW}ROCm Version:{RESET} {device_info.get('rocm_version', 'N/A')}"]
+
+
+def _mps_info_lines(device_info: dict) -> list:
+    return [f"{YELLOW}Architecture:{RESET} {device_info.get('architecture', 'Apple Silicon')}"]
+
+
+def _xpu_info_lines(device_info: dict) -> list:
+    return [f"{YELLOW}Architecture:{RESET} {device_info.get('architecture', 'Intel Arc')}"]
 
-        # ROCm-specific info
-        elif device_info['device'] == 'ROCM':
-            click.echo(f"{Fore.YELLOW}ROCm Version:{Style.RESET_ALL} {device_info.get('rocm_version', 'N/A')}")
 
-        # Apple MPS-specific info
-        elif device_info['device'] == 'MPS':
-            click.echo(f"{Fore.YELLOW}Architecture:{Style.RESET_ALL} {device_info.get('architecture', 'Apple Silicon')}")
+# Device-specific detail lines for `smp info`, keyed by device type
+_DEVICE_INFO_LINES = {
+    'CUDA': _cuda_info_lines,
+    'ROCM': _rocm_info_lines,
+    'MPS': _mps_info_lines,
+    'XPU': _xpu_info_lines,
+}
 
-        # Intel XPU-specific info
-        elif device_info['device'] == 'XPU':
-            click.echo(f"{Fore.YELLOW}Architecture:{Style.RESET_ALL} {device_info.get('architecture', 'Intel Arc')}")
+# GPU device types (CUDA, ROCM, MPS, XPU) - not 'GPU'
+_GPU_TYPES = frozenset(_DEVICE_INFO_LINES)
+
+
+@click.command()
+def info():
+    """Display system and GPU information."""
+    device_info = _cached_device_info()
+    device = device_info['device']
+
+    lines = [
+        f"{CYAN}📊 System Information{RESET}\n",
+        f"{YELLOW}Device:{RESET} {device}",
+        f"{YELLOW}Name:{RESET} {device_info['name']}",
+    ]
+
+    if device in _GPU_TYPES:
+        # Show vendor if available
+        if 'vendor' in device_info:
+            lines.append(f"{YELLOW}Vendor:{RESET} {device_info['vendor']}")
+        lines.extend(_DEVICE_INFO_LINES[device](device_info))
 
     # CPU mode - show note if PyTorch not available
-    elif device_info['device'] == 'CPU':
+    elif device == 'CPU':
         if not device_info.get('pytorch_available', True):
-            click.echo(f"{Fore.YELLOW}Note:{Style.RESET_ALL} {device_info.get('note', 'GPU acceleration not available')}")
+            lines.append(f"{YELLOW}Note:{RESET} {device_info.get('note', 'GPU acceleration not available')}")
+
+    click.echo("\n".join(lines))
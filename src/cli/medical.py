@@ -1,10 +1,190 @@
 """Medical imaging CLI commands."""
 
 import click
-from colorama import Fore, Style
+import importlib.util
+import os
+import stat
+from functools import lru_cache
+from itertools import islice
+from src.cli.colors import CYAN, GREEN, RED, YELLOW, RESET
 from pathlib import Path
-from typing import Optional
-import numpy as np
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# PNG outputs here are intermediate artifacts; favour encode speed over size
+_PNG_COMPRESS_LEVEL = 1
+
+
+def _to_uint8(image: 'np.ndarray') -> 'np.ndarray':
+    """Min-max scale an image to 0-255 for saving as 8-bit.
+
+    Works in a single float32 scratch buffer with in-place arithmetic so
+    large volumes are not copied once per operator.
+    """
+    import numpy as np
+
+    lo = float(image.min())
+    hi = float(image.max())
+    scaled = np.subtract(image, lo, dtype=np.float32)
+    scaled *= 255.0 / (hi - lo + 1e-8)
+    return scaled.astype(np.uint8)
+
+
+@lru_cache(maxsize=1)
+def _dicom_processor():
+    """Return a process-lifetime DICOMProcessor shared by all commands."""
+    from src.dicom_processor import DICOMProcessor
+
+    return DICOMProcessor()
+
+
+@lru_cache(maxsize=1)
+def _read_dicom_cached(path: str, mtime_ns: int):
+    return _dicom_processor().read_dicom(path)
+
+
+def _read_once(path: str):
+    """Read a DICOM file, reusing the last read if the file is unchanged.
+
+    Keyed by path and modification time so commands that need both the
+    metadata and the pixels of one file parse it only once.
+
+    Returns:
+        Tuple of (pixel_array, metadata) as returned by read_dicom
+    """
+    path = os.path.abspath(path)
+    return _read_dicom_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _dicom_file_lines(metadata) -> list:
+    """Format the single-file report shown by dicom-info."""
+    lines = [
+        f"{GREEN}DICOM File Information{RESET}\n",
+        f"{YELLOW}Patient:{RESET}",
+        f"  ID: {metadata.patient_id or 'N/A'}",
+        f"  Name: {metadata.patient_name or 'N/A'}",
+        f"  Sex: {metadata.patient_sex or 'N/A'}",
+        f"  Age: {metadata.patient_age or 'N/A'}",
+        f"\n{YELLOW}Study:{RESET}",
+        f"  Date: {metadata.study_date or 'N/A'}",
+        f"  Description: {metadata.study_description or 'N/A'}",
+        f"\n{YELLOW}Series:{RESET}",
+        f"  Modality: {metadata.modality or 'N/A'}",
+        f"  Description: {metadata.series_description or 'N/A'}",
+        f"\n{YELLOW}Image:{RESET}",
+        f"  Dimensions: {metadata.rows} x {metadata.columns}",
+        f"  Pixel Spacing: {metadata.pixel_spacing or 'N/A'}",
+        f"  Slice Thickness: {metadata.slice_thickness or 'N/A'}",
+    ]
+
+    if metadata.modality == 'MR':
+        lines.extend([
+            f"\n{YELLOW}MRI Parameters:{RESET}",
+            f"  Field Strength: {metadata.magnetic_field_strength or 'N/A'} T",
+            f"  Echo Time (TE): {metadata.echo_time or 'N/A'} ms",
+            f"  Repetition Time (TR): {metadata.repetition_time or 'N/A'} ms",
+            f"  Flip Angle: {metadata.flip_angle or 'N/A'} degrees",
+        ])
+
+    return lines
+
+
+@lru_cache(maxsize=4)
+def _get_pipeline(model: str, model_type: str, use_gpu: bool, quantize: str = 'none',
+                  ort_single_shot: bool = False):
+    """Return a cached CancerPredictionPipeline for a model.
+
+    Building a pipeline loads weights and initializes the device, so
+    repeated predictions in one process (e.g. `medical serve`) reuse it.
+    """
+    from src.ml_inference import (
+        CancerPredictionPipeline, ModelConfig, ModelType, PredictionType, QuantizationMode
+    )
+
+    type_map = {
+        'pytorch': ModelType.PYTORCH,
+        'onnx': ModelType.ONNX,
+        'torchscript': ModelType.TORCHSCRIPT
+    }
+
+    config = ModelConfig(
+        model_path=model,
+        model_type=type_map[model_type],
+        prediction_type=PredictionType.BINARY,
+        use_gpu=use_gpu,
+        class_names=["No Cancer", "Cancer"],
+        quantization=QuantizationMode(quantize),
+        ort_single_shot=ort_single_shot
+    )
+
+    return CancerPredictionPipeline(config, use_preprocessing=True)
+
+
+def _run_prediction(pipeline, input_path: str, generate_heatmap: bool = False) -> dict:
+    """Run a pipeline on a DICOM file/series or a standard image."""
+    input_path_obj = Path(input_path)
+    if input_path_obj.suffix.lower() in ['.dcm', '.dicom'] or input_path_obj.is_dir():
+        return pipeline.predict_from_dicom(input_path, generate_report=True)
+
+    # Load as numpy/image; the pipeline casts to float itself, so pass uint8
+    image = _load_grayscale(input_path, as_float=False)
+    return pipeline.predict_single(image, generate_heatmap=generate_heatmap)
+
+
+def _load_grayscale(input_path: str, as_float: bool = True) -> 'np.ndarray':
+    """Load a standard image as a grayscale plane.
+
+    Decodes straight to a single-channel array with OpenCV, falling back
+    to PIL for formats OpenCV cannot read.
+
+    Args:
+        input_path: Path to the image
+        as_float: Cast to float32; otherwise keep the decoded uint8 data
+    """
+    import numpy as np
+    import cv2
+
+    arr = cv2.imread(str(input_path), cv2.IMREAD_GRAYSCALE)
+    if arr is None:
+        from PIL import Image
+        arr = np.asarray(Image.open(input_path).convert('L'))
+    return arr.astype(np.float32, copy=False) if as_float else arr
+
+
+def _check_model_runtime(model_type: str, gpu: bool) -> bool:
+    """Abort if the model runtime is missing; return whether GPU can be used."""
+    from src.ml_inference import check_ml_available
+
+    ml_status = check_ml_available()
+    if model_type in ['pytorch', 'torchscript'] and not ml_status['pytorch']:
+        click.echo(f"{RED}PyTorch not available. Install with: pip install torch{RESET}")
+        raise click.Abort()
+    if model_type == 'onnx' and not ml_status['onnx']:
+        click.echo(f"{RED}ONNX Runtime not available. Install with: pip install onnxruntime{RESET}")
+        raise click.Abort()
+
+    if gpu and not ml_status['gpu']:
+        click.echo(f"{YELLOW}GPU not available, using CPU{RESET}")
+        return False
+    return gpu
+
+
+def _input_is_dir(path: str, param_hint: str) -> bool:
+    """Stat a command input once, returning whether it is a directory.
+
+    Used instead of click.Path(exists=True) so the existence and directory
+    checks share a single stat, made only after cheaper checks pass.
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        raise click.BadParameter(f"Path '{path}' does not exist.", param_hint=param_hint) from None
+    except OSError as e:
+        raise click.BadParameter(
+            f"Path '{path}' cannot be accessed: {e.strerror or e}", param_hint=param_hint
+        ) from None
 
 
 @click.group()
@@ -14,160 +194,192 @@ def medical():
 
 
 @medical.command('dicom-info')
-@click.argument('path', type=click.Path(exists=True))
+@click.argument('path', type=click.Path())
 @click.option('--series', is_flag=True, help='List all series in directory')
 def dicom_info(path: str, series: bool):
     """Display DICOM file or series information."""
-    from src.dicom_processor import DICOMProcessor, check_dicom_available
+    from src.dicom_processor import check_dicom_available
 
     if not check_dicom_available():
-        click.echo(f"{Fore.RED}DICOM support not available. Install with: pip install pydicom{Style.RESET_ALL}")
+        click.echo(f"{RED}DICOM support not available. Install with: pip install pydicom{RESET}")
         raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}Reading DICOM data...{Style.RESET_ALL}\n")
+    is_dir = _input_is_dir(path, "'PATH'")
+
+    click.echo(f"{CYAN}Reading DICOM data...{RESET}\n")
 
     try:
-        processor = DICOMProcessor()
-        path_obj = Path(path)
+        processor = _dicom_processor()
 
-        if series or path_obj.is_dir():
+        if series or is_dir:
             # List all series
             series_list = processor.get_series_list(path)
 
             if not series_list:
-                click.echo(f"{Fore.YELLOW}No DICOM series found in directory{Style.RESET_ALL}")
+                click.echo(f"{YELLOW}No DICOM series found in directory{RESET}")
                 return
 
-            click.echo(f"{Fore.GREEN}Found {len(series_list)} series:{Style.RESET_ALL}\n")
+            lines = [f"{GREEN}Found {len(series_list)} series:{RESET}\n"]
 
             for i, s in enumerate(series_list, 1):
-                click.echo(f"{Fore.YELLOW}Series {i}:{Style.RESET_ALL}")
-                click.echo(f"  UID: {s['series_uid'][:50]}...")
-                click.echo(f"  Modality: {s['modality']}")
-                click.echo(f"  Description: {s['series_description'] or 'N/A'}")
-                click.echo(f"  Patient ID: {s['patient_id']}")
-                click.echo(f"  Study Date: {s['study_date']}")
-                click.echo(f"  Slices: {s['num_slices']}")
-                click.echo()
+                lines.extend([
+                    f"{YELLOW}Series {i}:{RESET}",
+                    f"  UID: {s['series_uid'][:50]}...",
+                    f"  Modality: {s['modality']}",
+                    f"  Description: {s['series_description'] or 'N/A'}",
+                    f"  Patient ID: {s['patient_id']}",
+                    f"  Study Date: {s['study_date']}",
+                    f"  Slices: {s['num_slices']}",
+                    "",
+                ])
+
+            click.echo("\n".join(lines))
         else:
             # Single file info
-            pixel_array, metadata = processor.read_dicom(path)
-
-            click.echo(f"{Fore.GREEN}DICOM File Information{Style.RESET_ALL}\n")
-
-            click.echo(f"{Fore.YELLOW}Patient:{Style.RESET_ALL}")
-            click.echo(f"  ID: {metadata.patient_id or 'N/A'}")
-            click.echo(f"  Name: {metadata.patient_name or 'N/A'}")
-            click.echo(f"  Sex: {metadata.patient_sex or 'N/A'}")
-            click.echo(f"  Age: {metadata.patient_age or 'N/A'}")
+            _, metadata = _read_once(path)
+            lines = _dicom_file_lines(metadata)
 
-            click.echo(f"\n{Fore.YELLOW}Study:{Style.RESET_ALL}")
-            click.echo(f"  Date: {metadata.study_date or 'N/A'}")
-            click.echo(f"  Description: {metadata.study_description or 'N/A'}")
-
-            click.echo(f"\n{Fore.YELLOW}Series:{Style.RESET_ALL}")
-            click.echo(f"  Modality: {metadata.modality or 'N/A'}")
-            click.echo(f"  Description: {metadata.series_description or 'N/A'}")
-
-            click.echo(f"\n{Fore.YELLOW}Image:{Style.RESET_ALL}")
-            click.echo(f"  Dimensions: {metadata.rows} x {metadata.columns}")
-            click.echo(f"  Pixel Spacing: {metadata.pixel_spacing or 'N/A'}")
-            click.echo(f"  Slice Thickness: {metadata.slice_thickness or 'N/A'}")
-
-            if metadata.modality == 'MR':
-                click.echo(f"\n{Fore.YELLOW}MRI Parameters:{Style.RESET_ALL}")
-                click.echo(f"  Field Strength: {metadata.magnetic_field_strength or 'N/A'} T")
-                click.echo(f"  Echo Time (TE): {metadata.echo_time or 'N/A'} ms")
-                click.echo(f"  Repetition Time (TR): {metadata.repetition_time or 'N/A'} ms")
-                click.echo(f"  Flip Angle: {metadata.flip_angle or 'N/A'} degrees")
+            click.echo("\n".join(lines))
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Error reading DICOM: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Error reading DICOM: {e}{RESET}")
         raise click.Abort()
 
 
 @medical.command('anonymize')
-@click.argument('input_path', type=click.Path(exists=True))
+@click.argument('input_path', type=click.Path())
 @click.argument('output_path', type=click.Path())
 @click.option('--keep-uids', is_flag=True, help='Keep original study/series UIDs')
 def anonymize_dicom(input_path: str, output_path: str, keep_uids: bool):
     """Anonymize DICOM file for HIPAA compliance."""
-    from src.dicom_processor import DICOMProcessor, check_dicom_available
+    from src.dicom_processor import check_dicom_available
 
     if not check_dicom_available():
-        click.echo(f"{Fore.RED}DICOM support not available. Install with: pip install pydicom{Style.RESET_ALL}")
+        click.echo(f"{RED}DICOM support not available. Install with: pip install pydicom{RESET}")
         raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}Anonymizing DICOM file...{Style.RESET_ALL}")
+    _input_is_dir(input_path, "'INPUT_PATH'")
+
+    click.echo(f"{CYAN}Anonymizing DICOM file...{RESET}")
 
     try:
-        processor = DICOMProcessor()
+        processor = _dicom_processor()
         result = processor.anonymize_dicom(input_path, output_path, keep_study_uid=keep_uids)
 
-        click.echo(f"{Fore.GREEN}File anonymized successfully!{Style.RESET_ALL}")
-        click.echo(f"  Output: {result['output']}")
-        click.echo(f"  New Patient ID: {result['new_patient_id']}")
-        click.echo(f"  Fields removed: {len(result['removed_fields'])}")
+        removed = result['removed_fields']
+        lines = [
+            f"{GREEN}File anonymized successfully!{RESET}",
+            f"  Output: {result['output']}",
+            f"  New Patient ID: {result['new_patient_id']}",
+            f"  Fields removed: {len(removed)}",
+        ]
+
+        if removed:
+            lines.append(f"\n{YELLOW}Removed/anonymized fields:{RESET}")
+            lines.extend(f"    - {field}" for field in islice(removed, 10))
+            if len(removed) > 10:
+                lines.append(f"    ... and {len(removed) - 10} more")
 
-        if result['removed_fields']:
-            click.echo(f"\n{Fore.YELLOW}Removed/anonymized fields:{Style.RESET_ALL}")
-            for field in result['removed_fields'][:10]:
-                click.echo(f"    - {field}")
-            if len(result['removed_fields']) > 10:
-                click.echo(f"    ... and {len(result['removed_fields']) - 10} more")
+        click.echo("\n".join(lines))
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Anonymization failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Anonymization failed: {e}{RESET}")
         raise click.Abort()
 
 
 @medical.command('convert')
-@click.argument('input_path', type=click.Path(exists=True))
+@click.argument('input_path', type=click.Path())
 @click.argument('output_path', type=click.Path())
 @click.option('--format', 'output_format', type=click.Choice(['png', 'nifti']),
               default='png', help='Output format')
 @click.option('--window-center', type=float, help='Window center for contrast')
 @click.option('--window-width', type=float, help='Window width for contrast')
+@click.option('--gpu/--no-gpu', default=True,
+              help='Decode compressed series on the GPU (NIfTI, requires nvImageCodec)')
 def convert_dicom(input_path: str, output_path: str, output_format: str,
-                  window_center: Optional[float], window_width: Optional[float]):
+                  window_center: Optional[float], window_width: Optional[float], gpu: bool):
     """Convert DICOM to PNG or NIfTI format."""
-    from src.dicom_processor import DICOMProcessor, check_dicom_available
+    from src.dicom_processor import check_dicom_available
 
     if not check_dicom_available():
-        click.echo(f"{Fore.RED}DICOM support not available. Install with: pip install pydicom{Style.RESET_ALL}")
+        click.echo(f"{RED}DICOM support not available. Install with: pip install pydicom{RESET}")
         raise click.Abort()
 
-    click.echo(f"{Fore.CYAN}Converting DICOM to {output_format.upper()}...{Style.RESET_ALL}")
+    _input_is_dir(input_path, "'INPUT_PATH'")
+
+    click.echo(f"{CYAN}Converting DICOM to {output_format.upper()}...{RESET}")
 
     try:
-        processor = DICOMProcessor()
+        processor = _dicom_processor()
 
         if output_format == 'png':
-            result = processor.convert_to_png(
-                input_path, output_path,
+            pixel_array, metadata = _read_once(input_path)
+            output = processor.save_png(
+                pixel_array, output_path,
                 window_center=window_center,
-                window_width=window_width
+                window_width=window_width,
+                compress_level=_PNG_COMPRESS_LEVEL
             )
-            click.echo(f"{Fore.GREEN}Converted to PNG successfully!{Style.RESET_ALL}")
-            click.echo(f"  Output: {result['output']}")
-            click.echo(f"  Size: {result['size']}")
-            click.echo(f"  Modality: {result['modality']}")
+            click.echo(f"{GREEN}Converted to PNG successfully!{RESET}")
+            click.echo(f"  Output: {output}")
+            click.echo(f"  Size: {pixel_array.shape}")
+            click.echo(f"  Modality: {metadata.modality}")
 
         elif output_format == 'nifti':
-            result = processor.convert_to_nifti(input_path, output_path)
-            click.echo(f"{Fore.GREEN}Converted to NIfTI successfully!{Style.RESET_ALL}")
+            result = processor.convert_to_nifti(input_path, output_path, gpu_decode=gpu)
+            click.echo(f"{GREEN}Converted to NIfTI successfully!{RESET}")
             click.echo(f"  Output: {result['output']}")
             click.echo(f"  Volume shape: {result['volume_shape']}")
             click.echo(f"  Voxel spacing: {result['voxel_spacing']}")
             click.echo(f"  Slices: {result['num_slices']}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Conversion failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Conversion failed: {e}{RESET}")
+        raise click.Abort()
+
+
+@medical.command('inspect-and-convert')
+@click.argument('input_path', type=click.Path())
+@click.argument('output_path', type=click.Path())
+@click.option('--window-center', type=float, help='Window center for contrast')
+@click.option('--window-width', type=float, help='Window width for contrast')
+def inspect_and_convert(input_path: str, output_path: str,
+                        window_center: Optional[float], window_width: Optional[float]):
+    """Show DICOM file information and convert it to PNG in one read."""
+    from src.dicom_processor import check_dicom_available
+
+    if not check_dicom_available():
+        click.echo(f"{RED}DICOM support not available. Install with: pip install pydicom{RESET}")
+        raise click.Abort()
+
+    if _input_is_dir(input_path, "'INPUT_PATH'"):
+        raise click.BadParameter("expected a single DICOM file", param_hint="'INPUT_PATH'")
+
+    click.echo(f"{CYAN}Reading DICOM data...{RESET}\n")
+
+    try:
+        pixel_array, metadata = _read_once(input_path)
+        output = _dicom_processor().save_png(
+            pixel_array, output_path,
+            window_center=window_center,
+            window_width=window_width,
+            compress_level=_PNG_COMPRESS_LEVEL
+        )
+
+        lines = _dicom_file_lines(metadata)
+        lines.extend([
+            f"\n{GREEN}Converted to PNG successfully!{RESET}",
+            f"  Output: {output}",
+        ])
+        click.echo("\n".join(lines))
+
+    except Exception as e:
+        click.echo(f"{RED}Conversion failed: {e}{RESET}")
         raise click.Abort()
 
 
 @medical.command('preprocess')
-@click.argument('input_path', type=click.Path(exists=True))
+@click.argument('input_path', type=click.Path())
 @click.argument('output_path', type=click.Path())
 @click.option('--bias-correction/--no-bias-correction', default=True,
               help='Apply N4 bias field correction')
@@ -175,35 +387,52 @@ def convert_dicom(input_path: str, output_path: str, output_format: str,
 @click.option('--normalize', type=click.Choice(['zscore', 'minmax', 'percentile']),
               default='zscore', help='Normalization method')
 @click.option('--enhance-contrast', is_flag=True, help='Apply CLAHE contrast enhancement')
+@click.option('--gpu/--no-gpu', default=True, help='Run CLAHE on the GPU (requires cucim)')
+@click.option('--middle-slice-only/--full-volume', default=None,
+              help='Preprocess only the middle slice of a volume (default for image outputs)')
 def preprocess_medical(input_path: str, output_path: str, bias_correction: bool,
-                       denoise: bool, normalize: str, enhance_contrast: bool):
+                       denoise: bool, normalize: str, enhance_contrast: bool, gpu: bool,
+                       middle_slice_only: Optional[bool]):
     """Preprocess medical image for ML analysis."""
-    from src.dicom_processor import DICOMProcessor, check_dicom_available
+    is_dir = _input_is_dir(input_path, "'INPUT_PATH'")
+
+    import numpy as np
+    from src.dicom_processor import check_dicom_available
     from src.medical_preprocessing import (
         MedicalImagePreprocessor, PreprocessingConfig, NormalizationMethod
     )
 
-    click.echo(f"{Fore.CYAN}Preprocessing medical image...{Style.RESET_ALL}")
+    click.echo(f"{CYAN}Preprocessing medical image...{RESET}")
+
+    output_path_obj = Path(output_path)
+    if middle_slice_only is None:
+        # Image outputs only show the middle slice of a volume
+        middle_slice_only = output_path_obj.suffix.lower() != '.npy'
 
     try:
         # Load image (DICOM or standard format)
         input_path_obj = Path(input_path)
 
-        if input_path_obj.suffix.lower() in ['.dcm', '.dicom'] or input_path_obj.is_dir():
+        if input_path_obj.suffix.lower() in ['.dcm', '.dicom'] or is_dir:
             if not check_dicom_available():
-                click.echo(f"{Fore.RED}DICOM support not available{Style.RESET_ALL}")
+                click.echo(f"{RED}DICOM support not available{RESET}")
                 raise click.Abort()
 
-            processor = DICOMProcessor()
-            if input_path_obj.is_dir():
+            processor = _dicom_processor()
+            if is_dir and middle_slice_only:
+                # Read just the middle slice of the series
+                series = processor.open_dicom_series(input_path)
+                image = series[len(series) // 2]
+            elif is_dir:
                 volume = processor.read_dicom_series(input_path)
                 image = volume.pixel_data
             else:
                 image, _ = processor.read_dicom(input_path)
         else:
-            from PIL import Image
-            img = Image.open(input_path).convert('L')
-            image = np.array(img, dtype=np.float32)
+            image = _load_grayscale(input_path)
+
+        if middle_slice_only and image.ndim == 3:
+            image = image[image.shape[0] // 2]
 
         # Configure preprocessing
         norm_method = {
@@ -217,7 +446,8 @@ def preprocess_medical(input_path: str, output_path: str, bias_correction: bool,
             normalization_method=norm_method,
             denoise=denoise,
             bias_correction=bias_correction,
-            enhance_contrast=enhance_contrast
+            enhance_contrast=enhance_contrast,
+            use_gpu=gpu
         )
 
         # Run preprocessing
@@ -225,7 +455,6 @@ def preprocess_medical(input_path: str, output_path: str, bias_correction: bool,
         result = preprocessor.preprocess(image)
 
         # Save result
-        output_path_obj = Path(output_path)
         output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
         if output_path_obj.suffix.lower() == '.npy':
@@ -236,124 +465,130 @@ def preprocess_medical(input_path: str, output_path: str, bias_correction: bool,
             img_data = result.data
             if img_data.ndim == 3:
                 img_data = img_data[img_data.shape[0] // 2]  # Middle slice
-            img_data = ((img_data - img_data.min()) / (img_data.max() - img_data.min() + 1e-8) * 255).astype(np.uint8)
-            Image.fromarray(img_data).save(output_path)
+            Image.fromarray(_to_uint8(img_data)).save(output_path, compress_level=_PNG_COMPRESS_LEVEL)
 
-        click.echo(f"{Fore.GREEN}Preprocessing complete!{Style.RESET_ALL}")
+        click.echo(f"{GREEN}Preprocessing complete!{RESET}")
         click.echo(f"  Output: {output_path}")
         click.echo(f"  Original shape: {result.original_shape}")
         click.echo(f"  Final shape: {result.final_shape}")
-        click.echo(f"\n{Fore.YELLOW}Steps applied:{Style.RESET_ALL}")
+        click.echo(f"\n{YELLOW}Steps applied:{RESET}")
         for step in result.steps_applied:
             click.echo(f"    - {step}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Preprocessing failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Preprocessing failed: {e}{RESET}")
         raise click.Abort()
 
 
 @medical.command('predict')
-@click.argument('input_path', type=click.Path(exists=True))
-@click.option('--model', type=click.Path(exists=True), required=True,
+@click.argument('input_path', type=click.Path())
+@click.option('--model', type=click.Path(), required=True,
               help='Path to trained model (.pt, .pth, or .onnx)')
 @click.option('--model-type', type=click.Choice(['pytorch', 'onnx', 'torchscript']),
               default='pytorch', help='Model type')
 @click.option('--gpu/--no-gpu', default=True, help='Use GPU for inference')
+@click.option('--quantize', type=click.Choice(['none', 'int8', 'fp16']), default='none',
+              help='Reduced-precision inference (int8 runs on CPU)')
+@click.option('--ort-single-shot', is_flag=True,
+              help='Skip ONNX Runtime memory arenas for a one-off run (ONNX only)')
 @click.option('--generate-heatmap', is_flag=True, help='Generate attention heatmap')
 @click.option('--output-report', type=click.Path(), help='Save report to file')
-def predict_cancer(input_path: str, model: str, model_type: str, gpu: bool,
-                   generate_heatmap: bool, output_report: Optional[str]):
+def predict_cancer(input_path: str, model: str, model_type: str, gpu: bool, quantize: str,
+                   ort_single_shot: bool, generate_heatmap: bool, output_report: Optional[str]):
     """Run cancer prediction on MRI image/volume."""
-    from src.ml_inference import (
-        CancerPredictionPipeline, ModelConfig, ModelType, PredictionType, check_ml_available
-    )
-
-    # Check ML availability
-    ml_status = check_ml_available()
-    if model_type in ['pytorch', 'torchscript'] and not ml_status['pytorch']:
-        click.echo(f"{Fore.RED}PyTorch not available. Install with: pip install torch{Style.RESET_ALL}")
-        raise click.Abort()
-    if model_type == 'onnx' and not ml_status['onnx']:
-        click.echo(f"{Fore.RED}ONNX Runtime not available. Install with: pip install onnxruntime{Style.RESET_ALL}")
-        raise click.Abort()
-
-    if gpu and not ml_status['gpu']:
-        click.echo(f"{Fore.YELLOW}GPU not available, using CPU{Style.RESET_ALL}")
-        gpu = False
+    _input_is_dir(input_path, "'INPUT_PATH'")
+    _input_is_dir(model, "'--model'")
+    gpu = _check_model_runtime(model_type, gpu)
 
-    click.echo(f"{Fore.CYAN}Running cancer prediction...{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Running cancer prediction...{RESET}\n")
 
     try:
-        # Configure model
-        type_map = {
-            'pytorch': ModelType.PYTORCH,
-            'onnx': ModelType.ONNX,
-            'torchscript': ModelType.TORCHSCRIPT
-        }
-
-        config = ModelConfig(
-            model_path=model,
-            model_type=type_map[model_type],
-            prediction_type=PredictionType.BINARY,
-            use_gpu=gpu,
-            class_names=["No Cancer", "Cancer"]
-        )
-
-        # Create pipeline
-        pipeline = CancerPredictionPipeline(config, use_preprocessing=True)
-
-        # Check if DICOM
-        input_path_obj = Path(input_path)
-        if input_path_obj.suffix.lower() in ['.dcm', '.dicom'] or input_path_obj.is_dir():
-            result = pipeline.predict_from_dicom(input_path, generate_report=True)
-        else:
-            # Load as numpy/image
-            from PIL import Image
-            img = Image.open(input_path).convert('L')
-            image = np.array(img, dtype=np.float32)
-            result = pipeline.predict_single(image, generate_heatmap=generate_heatmap)
+        pipeline = _get_pipeline(model, model_type, gpu, quantize, ort_single_shot)
+        result = _run_prediction(pipeline, input_path, generate_heatmap)
 
         # Display results
-        click.echo(f"{Fore.GREEN}{'=' * 50}{Style.RESET_ALL}")
-        click.echo(f"{Fore.GREEN}PREDICTION RESULTS{Style.RESET_ALL}")
-        click.echo(f"{Fore.GREEN}{'=' * 50}{Style.RESET_ALL}\n")
+        click.echo(f"{GREEN}{'=' * 50}{RESET}")
+        click.echo(f"{GREEN}PREDICTION RESULTS{RESET}")
+        click.echo(f"{GREEN}{'=' * 50}{RESET}\n")
 
         if 'final_probability' in result:
             prob = result['final_probability']
             label = result['predicted_label']
             conf = result.get('confidence', prob if prob > 0.5 else 1 - prob)
 
-            color = Fore.RED if label == 'Cancer' else Fore.GREEN
-            click.echo(f"{Fore.YELLOW}Prediction:{Style.RESET_ALL} {color}{label}{Style.RESET_ALL}")
-            click.echo(f"{Fore.YELLOW}Cancer Probability:{Style.RESET_ALL} {prob * 100:.1f}%")
-            click.echo(f"{Fore.YELLOW}Confidence:{Style.RESET_ALL} {conf * 100:.1f}%")
+            color = RED if label == 'Cancer' else GREEN
+            click.echo(f"{YELLOW}Prediction:{RESET} {color}{label}{RESET}")
+            click.echo(f"{YELLOW}Cancer Probability:{RESET} {prob * 100:.1f}%")
+            click.echo(f"{YELLOW}Confidence:{RESET} {conf * 100:.1f}%")
 
             if 'most_suspicious_slice' in result:
-                click.echo(f"{Fore.YELLOW}Most Suspicious Slice:{Style.RESET_ALL} #{result['most_suspicious_slice'] + 1}")
-                click.echo(f"{Fore.YELLOW}Total Slices:{Style.RESET_ALL} {result['num_slices']}")
+                click.echo(f"{YELLOW}Most Suspicious Slice:{RESET} #{result['most_suspicious_slice'] + 1}")
+                click.echo(f"{YELLOW}Total Slices:{RESET} {result['num_slices']}")
         else:
             pred = result.get('prediction', {})
-            click.echo(f"{Fore.YELLOW}Prediction:{Style.RESET_ALL} {pred.get('predicted_label', 'N/A')}")
-            click.echo(f"{Fore.YELLOW}Confidence:{Style.RESET_ALL} {pred.get('confidence', 0) * 100:.1f}%")
+            click.echo(f"{YELLOW}Prediction:{RESET} {pred.get('predicted_label', 'N/A')}")
+            click.echo(f"{YELLOW}Confidence:{RESET} {pred.get('confidence', 0) * 100:.1f}%")
 
         # Save report if requested
         if output_report and 'report' in result:
             Path(output_report).write_text(result['report'])
-            click.echo(f"\n{Fore.GREEN}Report saved to: {output_report}{Style.RESET_ALL}")
+            click.echo(f"\n{GREEN}Report saved to: {output_report}{RESET}")
 
         # Print full report to console
         if 'report' in result:
             click.echo(f"\n{result['report']}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Prediction failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Prediction failed: {e}{RESET}")
         raise click.Abort()
 
 
+@medical.command('serve')
+@click.option('--model', type=click.Path(), required=True,
+              help='Path to trained model (.pt, .pth, or .onnx)')
+@click.option('--model-type', type=click.Choice(['pytorch', 'onnx', 'torchscript']),
+              default='pytorch', help='Model type')
+@click.option('--gpu/--no-gpu', default=True, help='Use GPU for inference')
+@click.option('--quantize', type=click.Choice(['none', 'int8', 'fp16']), default='none',
+              help='Reduced-precision inference (int8 runs on CPU)')
+def serve_predictions(model: str, model_type: str, gpu: bool, quantize: str):
+    """Run cancer prediction on each path read from stdin.
+
+    The model is loaded once and reused for every input, avoiding the
+    per-invocation weight load and device warmup of `medical predict`.
+
+    Example:
+        find scans/ -name '*.dcm' | smp medical serve --model model.onnx --model-type onnx
+    """
+    _input_is_dir(model, "'--model'")
+    gpu = _check_model_runtime(model_type, gpu)
+    pipeline = _get_pipeline(model, model_type, gpu, quantize)
+
+    click.echo(f"{CYAN}Model loaded, reading paths from stdin...{RESET}", err=True)
+
+    for line in click.get_text_stream('stdin'):
+        input_path = line.strip()
+        if not input_path:
+            continue
+
+        try:
+            result = _run_prediction(pipeline, input_path)
+            if 'final_probability' in result:
+                label = result['predicted_label']
+                prob = result['final_probability']
+            else:
+                pred = result.get('prediction', {})
+                label = pred.get('predicted_label', 'N/A')
+                prob = pred.get('probabilities', {}).get('Cancer', 0.0)
+            click.echo(f"{input_path}\t{label}\t{prob * 100:.1f}%")
+        except Exception as e:
+            click.echo(f"{input_path}\t{RED}error: {e}{RESET}")
+
+
 @medical.command('segment')
-@click.argument('input_path', type=click.Path(exists=True))
+@click.argument('input_path', type=click.Path())
 @click.argument('output_path', type=click.Path())
-@click.option('--model', type=click.Path(exists=True), help='Path to trained U-Net model (.pt or .pth)')
+@click.option('--model', type=click.Path(), help='Path to trained U-Net model (.pt or .pth)')
 @click.option('--variant', type=click.Choice(['standard', 'attention', 'residual']),
               default='standard', help='U-Net architecture variant')
 @click.option('--threshold', type=float, default=0.5, help='Binary mask threshold (0-1)')
@@ -364,6 +599,11 @@ def predict_cancer(input_path: str, model: str, model_type: str, gpu: bool,
 def segment_image(input_path: str, output_path: str, model: Optional[str], variant: str,
                   threshold: float, gpu: bool, save_probability: bool, output_format: str):
     """Run U-Net segmentation on medical image for tumor/lesion detection."""
+    _input_is_dir(input_path, "'INPUT_PATH'")
+    if model:
+        _input_is_dir(model, "'--model'")
+
+    import numpy as np
     from src.unet_segmentation import (
         UNetSegmentation, SegmentationConfig, UNetVariant, check_segmentation_available
     )
@@ -371,14 +611,14 @@ def segment_image(input_path: str, output_path: str, model: Optional[str], varia
     # Check dependencies
     seg_status = check_segmentation_available()
     if not seg_status['pytorch']:
-        click.echo(f"{Fore.RED}PyTorch not available. Install with: pip install torch{Style.RESET_ALL}")
+        click.echo(f"{RED}PyTorch not available. Install with: pip install torch{RESET}")
         raise click.Abort()
 
     if gpu and not seg_status['gpu']:
-        click.echo(f"{Fore.YELLOW}GPU not available, using CPU{Style.RESET_ALL}")
+        click.echo(f"{YELLOW}GPU not available, using CPU{RESET}")
         gpu = False
 
-    click.echo(f"{Fore.CYAN}Running U-Net segmentation...{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Running U-Net segmentation...{RESET}\n")
 
     try:
         # Configure segmentation
@@ -401,10 +641,10 @@ def segment_image(input_path: str, output_path: str, model: Optional[str], varia
         # Load model if provided
         if model:
             pipeline.load_model(model)
-            click.echo(f"{Fore.GREEN}Loaded model:{Style.RESET_ALL} {model}")
+            click.echo(f"{GREEN}Loaded model:{RESET} {model}")
         else:
             pipeline.create_model()
-            click.echo(f"{Fore.YELLOW}Using untrained model (demo mode){Style.RESET_ALL}")
+            click.echo(f"{YELLOW}Using untrained model (demo mode){RESET}")
 
         # Load input image
         input_path_obj = Path(input_path)
@@ -412,7 +652,7 @@ def segment_image(input_path: str, output_path: str, model: Optional[str], varia
         if input_path_obj.suffix.lower() in ['.dcm', '.dicom'] or input_path_obj.is_dir():
             from src.dicom_processor import DICOMProcessor, check_dicom_available
             if not check_dicom_available():
-                click.echo(f"{Fore.RED}DICOM support not available{Style.RESET_ALL}")
+                click.echo(f"{RED}DICOM support not available{RESET}")
                 raise click.Abort()
 
             result_dict = pipeline.segment_from_dicom(input_path, preprocess=True)
@@ -420,7 +660,7 @@ def segment_image(input_path: str, output_path: str, model: Optional[str], varia
             if 'results' in result_dict:
                 # Volume segmentation
                 results = result_dict['results']
-                click.echo(f"\n{Fore.GREEN}Volume Segmentation Complete{Style.RESET_ALL}")
+                click.echo(f"\n{GREEN}Volume Segmentation Complete{RESET}")
                 click.echo(f"  Slices processed: {result_dict['num_slices']}")
                 click.echo(f"  Total segmented pixels: {result_dict['total_volume_pixels']:,}")
                 click.echo(f"  Slice with max area: #{result_dict['max_area_slice'] + 1}")
@@ -453,36 +693,35 @@ def segment_image(input_path: str, output_path: str, model: Optional[str], varia
                 _save_segmentation_result(result, output_path, output_format, save_probability)
         else:
             # Load standard image
-            from PIL import Image
-            img = Image.open(input_path).convert('L')
-            image = np.array(img, dtype=np.float32)
+            image = _load_grayscale(input_path)
 
             # Run segmentation
             result = pipeline.segment(image)
             _save_segmentation_result(result, output_path, output_format, save_probability)
 
-        click.echo(f"\n{Fore.GREEN}Segmentation complete!{Style.RESET_ALL}")
+        click.echo(f"\n{GREEN}Segmentation complete!{RESET}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Segmentation failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Segmentation failed: {e}{RESET}")
         raise click.Abort()
 
 
 def _save_segmentation_result(result, output_path: str, output_format: str, save_probability: bool):
     """Helper to save segmentation result."""
+    import numpy as np
     from PIL import Image
 
     output_path_obj = Path(output_path)
     output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    click.echo(f"\n{Fore.GREEN}Segmentation Results{Style.RESET_ALL}")
+    click.echo(f"\n{GREEN}Segmentation Results{RESET}")
     click.echo(f"  Regions found: {result.num_regions}")
     click.echo(f"  Total area: {result.total_area:,} pixels")
     click.echo(f"  Threshold: {result.metadata.get('threshold', 0.5)}")
     click.echo(f"  Device: {result.metadata.get('device', 'N/A')}")
 
     if result.regions:
-        click.echo(f"\n{Fore.YELLOW}Region Details:{Style.RESET_ALL}")
+        click.echo(f"\n{YELLOW}Region Details:{RESET}")
         for i, region in enumerate(result.regions[:5], 1):
             click.echo(f"  Region {i}: area={region['area']:,} px, centroid={region.get('centroid', 'N/A')}")
         if len(result.regions) > 5:
@@ -506,15 +745,19 @@ def _save_segmentation_result(result, output_path: str, output_format: str, save
 
 
 @medical.command('evaluate')
-@click.argument('prediction_path', type=click.Path(exists=True))
-@click.argument('ground_truth_path', type=click.Path(exists=True))
+@click.argument('prediction_path', type=click.Path())
+@click.argument('ground_truth_path', type=click.Path())
 @click.option('--surface-metrics', is_flag=True, help='Include Hausdorff and surface distance metrics')
 def evaluate_segmentation(prediction_path: str, ground_truth_path: str, surface_metrics: bool):
     """Evaluate segmentation against ground truth mask."""
+    _input_is_dir(prediction_path, "'PREDICTION_PATH'")
+    _input_is_dir(ground_truth_path, "'GROUND_TRUTH_PATH'")
+
+    import numpy as np
     from src.unet_segmentation import SegmentationMetrics
     from PIL import Image
 
-    click.echo(f"{Fore.CYAN}Evaluating segmentation...{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Evaluating segmentation...{RESET}\n")
 
     try:
         # Load masks
@@ -534,21 +777,21 @@ def evaluate_segmentation(prediction_path: str, ground_truth_path: str, surface_
         # Calculate metrics
         metrics = SegmentationMetrics.evaluate(pred, gt, include_surface_metrics=surface_metrics)
 
-        click.echo(f"{Fore.GREEN}{'=' * 50}{Style.RESET_ALL}")
-        click.echo(f"{Fore.GREEN}SEGMENTATION METRICS{Style.RESET_ALL}")
-        click.echo(f"{Fore.GREEN}{'=' * 50}{Style.RESET_ALL}\n")
+        click.echo(f"{GREEN}{'=' * 50}{RESET}")
+        click.echo(f"{GREEN}SEGMENTATION METRICS{RESET}")
+        click.echo(f"{GREEN}{'=' * 50}{RESET}\n")
 
-        click.echo(f"{Fore.YELLOW}Overlap Metrics:{Style.RESET_ALL}")
+        click.echo(f"{YELLOW}Overlap Metrics:{RESET}")
         click.echo(f"  Dice Coefficient: {metrics['dice']:.4f}")
         click.echo(f"  IoU (Jaccard):    {metrics['iou']:.4f}")
 
-        click.echo(f"\n{Fore.YELLOW}Classification Metrics:{Style.RESET_ALL}")
+        click.echo(f"\n{YELLOW}Classification Metrics:{RESET}")
         click.echo(f"  Precision:    {metrics['precision']:.4f}")
         click.echo(f"  Recall:       {metrics['recall']:.4f}")
         click.echo(f"  Specificity:  {metrics['specificity']:.4f}")
 
         if surface_metrics:
-            click.echo(f"\n{Fore.YELLOW}Surface Metrics:{Style.RESET_ALL}")
+            click.echo(f"\n{YELLOW}Surface Metrics:{RESET}")
             hd = metrics.get('hausdorff_distance', float('inf'))
             asd = metrics.get('average_surface_distance', float('inf'))
             click.echo(f"  Hausdorff Distance: {hd:.2f} px" if hd != float('inf') else "  Hausdorff Distance: N/A")
@@ -557,18 +800,18 @@ def evaluate_segmentation(prediction_path: str, ground_truth_path: str, surface_
         # Quality assessment
         dice = metrics['dice']
         if dice >= 0.9:
-            quality = f"{Fore.GREEN}Excellent{Style.RESET_ALL}"
+            quality = f"{GREEN}Excellent{RESET}"
         elif dice >= 0.8:
-            quality = f"{Fore.GREEN}Good{Style.RESET_ALL}"
+            quality = f"{GREEN}Good{RESET}"
         elif dice >= 0.7:
-            quality = f"{Fore.YELLOW}Acceptable{Style.RESET_ALL}"
+            quality = f"{YELLOW}Acceptable{RESET}"
         else:
-            quality = f"{Fore.RED}Poor{Style.RESET_ALL}"
+            quality = f"{RED}Poor{RESET}"
 
-        click.echo(f"\n{Fore.YELLOW}Overall Quality:{Style.RESET_ALL} {quality}")
+        click.echo(f"\n{YELLOW}Overall Quality:{RESET} {quality}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Evaluation failed: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Evaluation failed: {e}{RESET}")
         raise click.Abort()
 
 
@@ -584,7 +827,7 @@ def evaluate_segmentation(prediction_path: str, ground_truth_path: str, surface_
               help='Operations to perform')
 @click.option('--output', '-O', type=click.Path(), help='Output directory for results')
 @click.option('--user-id', default='cli-user', help='User ID for audit logging')
-@click.option('--model', type=click.Path(exists=True), help='Path to ML model')
+@click.option('--model', type=click.Path(), help='Path to ML model')
 @click.option('--zero-knowledge', is_flag=True, help='Use zero-knowledge transfer mode')
 @click.option('--keep-data', is_flag=True, help='Do not securely delete data after processing')
 def process_study(remote_path: str, provider: str, bucket: str, region: str,
@@ -602,15 +845,18 @@ def process_study(remote_path: str, provider: str, bucket: str, region: str,
     """
     from src.medical import MedicalPipeline
 
-    click.echo(f"{Fore.CYAN}Secure Medical Imaging Pipeline{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Secure Medical Imaging Pipeline{RESET}\n")
 
     if not bucket:
-        click.echo(f"{Fore.RED}Error: --bucket is required{Style.RESET_ALL}")
+        click.echo(f"{RED}Error: --bucket is required{RESET}")
         raise click.Abort()
 
+    if model:
+        _input_is_dir(model, "'--model'")
+
     try:
         # Initialize pipeline
-        click.echo(f"{Fore.YELLOW}Initializing secure pipeline...{Style.RESET_ALL}")
+        click.echo(f"{YELLOW}Initializing secure pipeline...{RESET}")
         pipeline = MedicalPipeline(
             cloud_config={
                 'provider': provider,
@@ -624,7 +870,7 @@ def process_study(remote_path: str, provider: str, bucket: str, region: str,
         )
 
         # Process study
-        click.echo(f"{Fore.YELLOW}Processing study: {remote_path}{Style.RESET_ALL}")
+        click.echo(f"{YELLOW}Processing study: {remote_path}{RESET}")
         click.echo(f"  Operations: {', '.join(operations)}")
         click.echo(f"  Transfer mode: {'zero-knowledge' if zero_knowledge else 'standard'}")
         click.echo()
@@ -639,42 +885,42 @@ def process_study(remote_path: str, provider: str, bucket: str, region: str,
         )
 
         # Display results
-        click.echo(f"\n{Fore.GREEN}{'=' * 50}{Style.RESET_ALL}")
-        click.echo(f"{Fore.GREEN}PROCESSING COMPLETE{Style.RESET_ALL}")
-        click.echo(f"{Fore.GREEN}{'=' * 50}{Style.RESET_ALL}\n")
+        click.echo(f"\n{GREEN}{'=' * 50}{RESET}")
+        click.echo(f"{GREEN}PROCESSING COMPLETE{RESET}")
+        click.echo(f"{GREEN}{'=' * 50}{RESET}\n")
 
-        click.echo(f"{Fore.YELLOW}Study ID:{Style.RESET_ALL} {results.study_id}")
-        click.echo(f"{Fore.YELLOW}Operations:{Style.RESET_ALL} {', '.join(results.operations_performed)}")
-        click.echo(f"{Fore.YELLOW}Processing Time:{Style.RESET_ALL} {results.processing_time_seconds:.2f}s")
+        click.echo(f"{YELLOW}Study ID:{RESET} {results.study_id}")
+        click.echo(f"{YELLOW}Operations:{RESET} {', '.join(results.operations_performed)}")
+        click.echo(f"{YELLOW}Processing Time:{RESET} {results.processing_time_seconds:.2f}s")
 
         if results.cancer_probability is not None:
             prob = results.cancer_probability
             pred = results.cancer_prediction
-            color = Fore.RED if pred == 'positive' else Fore.GREEN
+            color = RED if pred == 'positive' else GREEN
 
-            click.echo(f"\n{Fore.YELLOW}Cancer Prediction:{Style.RESET_ALL}")
-            click.echo(f"  Probability: {color}{prob:.2%}{Style.RESET_ALL}")
-            click.echo(f"  Prediction: {color}{pred}{Style.RESET_ALL}")
+            click.echo(f"\n{YELLOW}Cancer Prediction:{RESET}")
+            click.echo(f"  Probability: {color}{prob:.2%}{RESET}")
+            click.echo(f"  Prediction: {color}{pred}{RESET}")
             if results.confidence_score:
                 click.echo(f"  Confidence: {results.confidence_score:.2%}")
 
         if output:
-            click.echo(f"\n{Fore.YELLOW}Results saved to:{Style.RESET_ALL} {output}")
+            click.echo(f"\n{YELLOW}Results saved to:{RESET} {output}")
 
         # Cleanup status
         if not keep_data:
-            click.echo(f"\n{Fore.GREEN}Sensitive data securely deleted{Style.RESET_ALL}")
+            click.echo(f"\n{GREEN}Sensitive data securely deleted{RESET}")
         else:
-            click.echo(f"\n{Fore.YELLOW}Data kept at:{Style.RESET_ALL} {results.local_paths}")
+            click.echo(f"\n{YELLOW}Data kept at:{RESET} {results.local_paths}")
 
         # Audit info
         audit = pipeline.get_audit_summary()
-        click.echo(f"\n{Fore.YELLOW}Audit Log:{Style.RESET_ALL}")
+        click.echo(f"\n{YELLOW}Audit Log:{RESET}")
         click.echo(f"  Entries: {audit.get('total_entries', 'N/A')}")
         click.echo(f"  Integrity: {'Verified' if audit.get('integrity_verified') else 'N/A'}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Error: {e}{RESET}")
         raise click.Abort()
 
 
@@ -701,7 +947,7 @@ def secure_download(remote_path: str, local_path: str, provider: str,
     from src.core import SecureTransferPipeline, MediaEncryptor, AuditLogger, TransferMode
     from src.connectors import S3Connector, GoogleDriveConnector, DropboxConnector
 
-    click.echo(f"{Fore.CYAN}Secure Download{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Secure Download{RESET}\n")
 
     try:
         # Initialize components
@@ -738,14 +984,14 @@ def secure_download(remote_path: str, local_path: str, provider: str,
             mode=mode
         )
 
-        click.echo(f"\n{Fore.GREEN}Download Complete{Style.RESET_ALL}")
+        click.echo(f"\n{GREEN}Download Complete{RESET}")
         click.echo(f"  Files: {manifest.file_count}")
         click.echo(f"  Bytes: {manifest.total_bytes:,}")
         click.echo(f"  Destination: {manifest.destination}")
         click.echo(f"  Integrity: {'Verified' if pipeline.verify_integrity(manifest) else 'FAILED'}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Error: {e}{RESET}")
         raise click.Abort()
 
 
@@ -766,7 +1012,7 @@ def secure_delete(path: str, recursive: bool, passes: int):
     """
     from src.core import SecureTransferPipeline
 
-    click.echo(f"{Fore.CYAN}Secure Deletion{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Secure Deletion{RESET}\n")
 
     try:
         pipeline = SecureTransferPipeline(secure_delete_passes=passes)
@@ -777,10 +1023,10 @@ def secure_delete(path: str, recursive: bool, passes: int):
 
         pipeline.secure_delete(path, recursive=recursive)
 
-        click.echo(f"\n{Fore.GREEN}Secure deletion complete{Style.RESET_ALL}")
+        click.echo(f"\n{GREEN}Secure deletion complete{RESET}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Error: {e}{RESET}")
         raise click.Abort()
 
 
@@ -801,7 +1047,7 @@ def audit_export(output_path: str, start_date: Optional[str], end_date: Optional
     """
     from src.core import AuditLogger
 
-    click.echo(f"{Fore.CYAN}Exporting Audit Log{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Exporting Audit Log{RESET}\n")
 
     try:
         audit = AuditLogger(
@@ -818,16 +1064,16 @@ def audit_export(output_path: str, start_date: Optional[str], end_date: Optional
         # Verify integrity
         integrity_ok = audit.verify_integrity()
 
-        click.echo(f"{Fore.GREEN}Export Complete{Style.RESET_ALL}")
+        click.echo(f"{GREEN}Export Complete{RESET}")
         click.echo(f"  Entries exported: {count}")
         click.echo(f"  Output: {output_path}")
         click.echo(f"  Integrity verified: {'Yes' if integrity_ok else 'NO - POSSIBLE TAMPERING'}")
 
         if not integrity_ok:
-            click.echo(f"\n{Fore.RED}WARNING: Audit log integrity check failed!{Style.RESET_ALL}")
+            click.echo(f"\n{RED}WARNING: Audit log integrity check failed!{RESET}")
 
     except Exception as e:
-        click.echo(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        click.echo(f"{RED}Error: {e}{RESET}")
         raise click.Abort()
 
 
@@ -838,50 +1084,45 @@ def medical_info():
     from src.ml_inference import check_ml_available
     from src.unet_segmentation import check_segmentation_available
 
-    click.echo(f"{Fore.CYAN}Medical Imaging Capabilities{Style.RESET_ALL}\n")
+    click.echo(f"{CYAN}Medical Imaging Capabilities{RESET}\n")
 
     # DICOM support
     dicom_available = check_dicom_available()
-    status = f"{Fore.GREEN}Available{Style.RESET_ALL}" if dicom_available else f"{Fore.RED}Not installed{Style.RESET_ALL}"
-    click.echo(f"{Fore.YELLOW}DICOM Support:{Style.RESET_ALL} {status}")
+    status = f"{GREEN}Available{RESET}" if dicom_available else f"{RED}Not installed{RESET}"
+    click.echo(f"{YELLOW}DICOM Support:{RESET} {status}")
     if not dicom_available:
         click.echo(f"  Install with: pip install pydicom")
 
     # ML support
     ml_status = check_ml_available()
-    click.echo(f"\n{Fore.YELLOW}ML Inference:{Style.RESET_ALL}")
+    click.echo(f"\n{YELLOW}ML Inference:{RESET}")
 
-    pytorch_status = f"{Fore.GREEN}Available{Style.RESET_ALL}" if ml_status['pytorch'] else f"{Fore.RED}Not installed{Style.RESET_ALL}"
+    pytorch_status = f"{GREEN}Available{RESET}" if ml_status['pytorch'] else f"{RED}Not installed{RESET}"
     click.echo(f"  PyTorch: {pytorch_status}")
 
-    onnx_status = f"{Fore.GREEN}Available{Style.RESET_ALL}" if ml_status['onnx'] else f"{Fore.RED}Not installed{Style.RESET_ALL}"
+    onnx_status = f"{GREEN}Available{RESET}" if ml_status['onnx'] else f"{RED}Not installed{RESET}"
     click.echo(f"  ONNX Runtime: {onnx_status}")
 
-    gpu_status = f"{Fore.GREEN}Available{Style.RESET_ALL}" if ml_status['gpu'] else f"{Fore.YELLOW}CPU only{Style.RESET_ALL}"
+    gpu_status = f"{GREEN}Available{RESET}" if ml_status['gpu'] else f"{YELLOW}CPU only{RESET}"
     click.echo(f"  GPU Acceleration: {gpu_status}")
 
     # U-Net Segmentation
     seg_status = check_segmentation_available()
-    click.echo(f"\n{Fore.YELLOW}U-Net Segmentation:{Style.RESET_ALL}")
-    click.echo(f"  PyTorch: {f'{Fore.GREEN}Available{Style.RESET_ALL}' if seg_status['pytorch'] else f'{Fore.RED}Not installed{Style.RESET_ALL}'}")
-    click.echo(f"  scipy: {f'{Fore.GREEN}Available{Style.RESET_ALL}' if seg_status['scipy'] else f'{Fore.RED}Not installed{Style.RESET_ALL}'}")
-    click.echo(f"  scikit-image: {f'{Fore.GREEN}Available{Style.RESET_ALL}' if seg_status['scikit-image'] else f'{Fore.RED}Not installed{Style.RESET_ALL}'}")
-    click.echo(f"  GPU: {f'{Fore.GREEN}Available{Style.RESET_ALL}' if seg_status['gpu'] else f'{Fore.YELLOW}CPU only{Style.RESET_ALL}'}")
+    click.echo(f"\n{YELLOW}U-Net Segmentation:{RESET}")
+    click.echo(f"  PyTorch: {f'{GREEN}Available{RESET}' if seg_status['pytorch'] else f'{RED}Not installed{RESET}'}")
+    click.echo(f"  scipy: {f'{GREEN}Available{RESET}' if seg_status['scipy'] else f'{RED}Not installed{RESET}'}")
+    click.echo(f"  scikit-image: {f'{GREEN}Available{RESET}' if seg_status['scikit-image'] else f'{RED}Not installed{RESET}'}")
+    click.echo(f"  GPU: {f'{GREEN}Available{RESET}' if seg_status['gpu'] else f'{YELLOW}CPU only{RESET}'}")
 
     # Preprocessing dependencies
-    click.echo(f"\n{Fore.YELLOW}Preprocessing:{Style.RESET_ALL}")
+    click.echo(f"\n{YELLOW}Preprocessing:{RESET}")
 
-    try:
-        import scipy
-        click.echo(f"  scipy: {Fore.GREEN}Available{Style.RESET_ALL}")
-    except ImportError:
-        click.echo(f"  scipy: {Fore.RED}Not installed{Style.RESET_ALL}")
-
-    try:
-        import skimage
-        click.echo(f"  scikit-image: {Fore.GREEN}Available{Style.RESET_ALL}")
-    except ImportError:
-        click.echo(f"  scikit-image: {Fore.RED}Not installed{Style.RESET_ALL}")
+    # find_spec checks installation without executing the package
+    for label, module in (('scipy', 'scipy'), ('scikit-image', 'skimage')):
+        if importlib.util.find_spec(module) is not None:
+            click.echo(f"  {label}: {GREEN}Available{RESET}")
+        else:
+            click.echo(f"  {label}: {RED}Not installed{RESET}")
 
-    click.echo(f"\n{Fore.CYAN}Install all medical dependencies:{Style.RESET_ALL}")
+    click.echo(f"\n{CYAN}Install all medical dependencies:{RESET}")
     click.echo(f"  pip install pydicom nibabel scipy scikit-image torch")
@@ -37,6 +37,9 @@ class GoogleDriveConnector(CloudConnector):
     Note: Requires Google Cloud credentials with Drive API access.
     """
     
+    # googleapiclient's httplib2 transport is not thread-safe
+    max_transfer_workers = 1
+
     def __init__(
         self,
         credentials_path: Optional[Union[str, Path]] = None,
@@ -268,8 +271,7 @@ class GoogleDriveConnector(CloudConnector):
             # Verify checksum if requested
             checksum_verified = False
             if verify_checksum and stored_checksum:
-                local_checksum = self._calculate_checksum(local_path)
-                if local_checksum != stored_checksum:
+                if not self._verify_checksum(local_path, stored_checksum):
                     local_path.unlink()  # Delete corrupted file
                     return {
                         'success': False,
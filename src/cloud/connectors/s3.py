@@ -5,11 +5,12 @@ the CloudConnector interface.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
 from datetime import datetime, timezone
 import logging
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .base import CloudConnector
@@ -66,7 +67,13 @@ class S3Connector(CloudConnector):
                 session_kwargs['aws_access_key_id'] = self.access_key
                 session_kwargs['aws_secret_access_key'] = self.secret_key
             
-            self.s3_client = boto3.client('s3', **session_kwargs)
+            # One pooled client is reused by every call and thread; size the
+            # pool so concurrent transfers keep their connections alive
+            self.s3_client = boto3.client(
+                's3',
+                config=Config(max_pool_connections=self._http_pool_size()),
+                **session_kwargs
+            )
             self.s3_resource = boto3.resource('s3', **session_kwargs)
             
             # Test connection by checking if bucket exists
@@ -87,7 +94,9 @@ class S3Connector(CloudConnector):
         Returns:
             bool: True if disconnection successful.
         """
-        # Clear client and resource objects
+        # Close pooled connections and clear client and resource objects
+        if self.s3_client is not None and hasattr(self.s3_client, 'close'):
+            self.s3_client.close()
         self.s3_client = None
         self.s3_resource = None
         self._connected = False
@@ -188,6 +197,48 @@ class S3Connector(CloudConnector):
                 'error': str(e)
             }
     
+    def _mpu_create(self, remote_path: str, metadata: Dict[str, str]) -> str:
+        """Start an S3 multipart upload with server-side encryption."""
+        response = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=remote_path,
+            Metadata=metadata,
+            ServerSideEncryption=self.encryption
+        )
+        return response['UploadId']
+
+    def _mpu_put_part(self, remote_path: str, upload_id: str,
+                      part_number: int, data: bytes) -> str:
+        """Upload one part and return its ETag."""
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=remote_path,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data
+        )
+        return response['ETag']
+
+    def _mpu_complete(self, remote_path: str, upload_id: str,
+                      parts: List[Tuple[int, str]]) -> None:
+        """Assemble the uploaded parts into the final object."""
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=remote_path,
+            UploadId=upload_id,
+            MultipartUpload={
+                'Parts': [{'PartNumber': number, 'ETag': etag} for number, etag in parts]
+            }
+        )
+
+    def _mpu_abort(self, remote_path: str, upload_id: str) -> None:
+        """Discard the parts of a failed multipart upload."""
+        self.s3_client.abort_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=remote_path,
+            UploadId=upload_id
+        )
+    
     def download_file(
         self,
         remote_path: str,
@@ -243,8 +294,7 @@ class S3Connector(CloudConnector):
             # Verify checksum if requested
             checksum_verified = False
             if verify_checksum and stored_checksum:
-                local_checksum = self._calculate_checksum(local_path)
-                if local_checksum != stored_checksum:
+                if not self._verify_checksum(local_path, stored_checksum):
                     local_path.unlink()  # Delete corrupted file
                     return {
                         'success': False,
@@ -314,6 +364,9 @@ class S3Connector(CloudConnector):
     
     def list_files(self, prefix: str = '') -> List[Dict[str, Any]]:
         """List files in S3 bucket.
+
+        Builds the whole listing in memory; use iter_files() to stream
+        large buckets.
         
         Args:
             prefix: Filter results by key prefix.
@@ -321,37 +374,54 @@ class S3Connector(CloudConnector):
         Returns:
             List of file information dictionaries.
         """
+        try:
+            return list(self.iter_files(prefix))
+
+        except ClientError as e:
+            logger.error(f"S3 list operation failed: {e}")
+            return []
+
+    def iter_files(self, prefix: str = '') -> Iterator[Dict[str, Any]]:
+        """Stream objects in S3 bucket one page at a time.
+
+        Follows ListObjectsV2 continuation tokens, holding only the current
+        page (up to 1000 keys) in memory.
+
+        Args:
+            prefix: Filter results by key prefix.
+
+        Yields:
+            File information dictionaries, as returned by list_files().
+
+        Raises:
+            ClientError: If a page request fails part-way through.
+        """
         if not self._connected:
             logger.error("Not connected to S3")
-            return []
+            return
 
         # Check rate limit before API call
         try:
             self._check_rate_limit("list_files")
         except RuntimeError as e:
             logger.error(f"Rate limit exceeded: {e}")
-            return []
+            return
+
+        request = {'Bucket': self.bucket_name, 'Prefix': prefix}
+        while True:
+            response = self.s3_client.list_objects_v2(**request)
 
-        try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
-            
-            files = []
             for obj in response.get('Contents', []):
-                files.append({
+                yield {
                     'path': obj['Key'],
                     'size': obj['Size'],
                     'last_modified': obj['LastModified'].isoformat(),
                     'checksum': obj.get('ETag', '').strip('"')
-                })
-            
-            return files
-            
-        except ClientError as e:
-            logger.error(f"S3 list operation failed: {e}")
-            return []
+                }
+
+            if not response.get('IsTruncated'):
+                break
+            request['ContinuationToken'] = response['NextContinuationToken']
     
     def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
         """Get metadata for a file in S3.
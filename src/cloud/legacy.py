@@ -1,7 +1,10 @@
 """Cloud storage module for secure media backup and synchronization."""
 
+import io
 import os
+import stat
 import hashlib
+import tempfile
 from pathlib import Path
 from typing import Union, Optional, Dict, List
 from datetime import datetime
@@ -9,10 +12,24 @@ import json
 import boto3
 from botocore.exceptions import ClientError
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.file_io import fadvise_sequential, fadvise_dontneed
 
 
 logger = logging.getLogger(__name__)
 
+# Files up to this size are read once and hashed from memory before being
+# handed to S3; larger files are hashed in a separate streaming pass so
+# memory use stays bounded.
+SINGLE_PASS_UPLOAD_MAX = 64 * 1024 * 1024
+
+# Verified downloads larger than one range are fetched with parallel ranged
+# GETs so hashing of completed ranges overlaps the remaining transfers.
+RANGE_DOWNLOAD_CHUNK = 16 * 1024 * 1024
+RANGE_DOWNLOAD_WORKERS = 8
+
 
 class CloudStorageManager:
     """Manage cloud storage operations for encrypted media files."""
@@ -42,26 +59,33 @@ class CloudStorageManager:
         self.s3_client = boto3.client('s3', **session_kwargs)
         self.s3_resource = boto3.resource('s3', **session_kwargs)
         
-    def _calculate_checksum(self, file_path: Union[str, Path]) -> str:
+    def _calculate_checksum(self, file_path: Union[str, Path], fadvise: bool = False) -> str:
         """Calculate SHA-256 checksum of a file.
         
         Args:
             file_path: Path to the file.
+            fadvise: Hint sequential access and drop the file from the page
+                cache after hashing.
             
         Returns:
             Hexadecimal checksum string.
         """
         sha256_hash = hashlib.sha256()
         with open(file_path, 'rb') as f:
+            if fadvise:
+                fadvise_sequential(f)
             for byte_block in iter(lambda: f.read(4096), b""):
                 sha256_hash.update(byte_block)
+            if fadvise:
+                fadvise_dontneed(f)
         return sha256_hash.hexdigest()
     
     def upload_file(self, 
                     file_path: Union[str, Path],
                     remote_key: Optional[str] = None,
                     metadata: Optional[Dict[str, str]] = None,
-                    encryption: str = 'AES256') -> Dict[str, any]:
+                    encryption: str = 'AES256',
+                    file_size: Optional[int] = None) -> Dict[str, any]:
         """Upload a file to cloud storage.
         
         Args:
@@ -69,21 +93,31 @@ class CloudStorageManager:
             remote_key: S3 object key (uses filename if not provided).
             metadata: Additional metadata to attach to the file.
             encryption: Server-side encryption method ('AES256' or 'aws:kms').
+            file_size: Size of the file if the caller already stat'ed it.
             
         Returns:
             Dictionary containing upload information.
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if file_size is None:
+            try:
+                file_size = file_path.stat().st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}") from None
         
         # Use filename as key if not provided
         if remote_key is None:
             remote_key = file_path.name
         
-        # Calculate checksum
-        checksum = self._calculate_checksum(file_path)
+        # Calculate checksum, reusing the same read for the upload body
+        # when the file is small enough to hold in memory
+        body = None
+        if file_size <= SINGLE_PASS_UPLOAD_MAX:
+            body = file_path.read_bytes()
+            checksum = hashlib.sha256(body).hexdigest()
+        else:
+            checksum = self._calculate_checksum(file_path)
         
         # Prepare metadata
         file_metadata = metadata or {}
@@ -98,12 +132,20 @@ class CloudStorageManager:
                 'ServerSideEncryption': encryption
             }
             
-            self.s3_client.upload_file(
-                str(file_path),
-                self.bucket_name,
-                remote_key,
-                ExtraArgs=extra_args
-            )
+            if body is not None:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(body),
+                    self.bucket_name,
+                    remote_key,
+                    ExtraArgs=extra_args
+                )
+            else:
+                self.s3_client.upload_file(
+                    str(file_path),
+                    self.bucket_name,
+                    remote_key,
+                    ExtraArgs=extra_args
+                )
             
             logger.info(f"Successfully uploaded {file_path} to {remote_key}")
             
@@ -111,7 +153,7 @@ class CloudStorageManager:
                 'success': True,
                 'remote_key': remote_key,
                 'checksum': checksum,
-                'size': file_path.stat().st_size,
+                'size': file_size,
                 'timestamp': file_metadata['upload_time']
             }
             
@@ -125,13 +167,16 @@ class CloudStorageManager:
     def download_file(self,
                       remote_key: str,
                       local_path: Union[str, Path],
-                      verify_checksum: bool = True) -> Dict[str, any]:
+                      verify_checksum: bool = True,
+                      fadvise: bool = False) -> Dict[str, any]:
         """Download a file from cloud storage.
         
         Args:
             remote_key: S3 object key.
             local_path: Path where the file will be saved.
             verify_checksum: Whether to verify file integrity after download.
+            fadvise: Drop the downloaded file from the page cache once it
+                has been verified.
             
         Returns:
             Dictionary containing download information.
@@ -149,20 +194,30 @@ class CloudStorageManager:
             )
             
             stored_checksum = response.get('Metadata', {}).get('checksum')
+            object_size = response.get('ContentLength', 0)
             
-            # Download file
-            self.s3_client.download_file(
-                self.bucket_name,
-                remote_key,
-                str(local_path)
-            )
+            if (verify_checksum and stored_checksum and hasattr(os, 'pwrite')
+                    and object_size > RANGE_DOWNLOAD_CHUNK):
+                # Hash ranges as they arrive instead of re-reading the file
+                local_checksum = self._download_ranges(
+                    remote_key, local_path, object_size, etag=response.get('ETag'),
+                    fadvise=fadvise
+                )
+            else:
+                # Download file
+                self.s3_client.download_file(
+                    self.bucket_name,
+                    remote_key,
+                    str(local_path)
+                )
+                local_checksum = None
+                if verify_checksum and stored_checksum:
+                    local_checksum = self._calculate_checksum(local_path, fadvise=fadvise)
             
             # Verify checksum if requested
-            if verify_checksum and stored_checksum:
-                local_checksum = self._calculate_checksum(local_path)
-                if local_checksum != stored_checksum:
-                    local_path.unlink()  # Delete corrupted file
-                    raise ValueError("Checksum verification failed")
+            if local_checksum is not None and local_checksum != stored_checksum:
+                local_path.unlink()  # Delete corrupted file
+                raise ValueError("Checksum verification failed")
             
             logger.info(f"Successfully downloaded {remote_key} to {local_path}")
             
@@ -180,6 +235,77 @@ class CloudStorageManager:
                 'error': str(e)
             }
     
+    def _download_ranges(self, remote_key: str, local_path: Path, size: int,
+                         etag: Optional[str] = None, fadvise: bool = False) -> str:
+        """Download an object with parallel ranged GETs.
+        
+        Each worker writes its range in place with pwrite while the caller
+        feeds completed ranges to SHA-256 in order, keeping at most two
+        ranges per worker in memory. Ranges go to a temporary file next to
+        local_path that replaces it only once every range has arrived, so
+        a failed range never leaves a partly zero-filled file behind.
+        
+        Args:
+            remote_key: S3 object key.
+            local_path: Path where the file will be saved.
+            size: Object size in bytes.
+            etag: ETag from head_object; every range is requested with
+                If-Match on it, so an overwrite during the download fails
+                the request instead of splicing two versions together.
+            fadvise: Drop the written file from the page cache afterwards.
+            
+        Returns:
+            Hexadecimal SHA-256 checksum of the downloaded data.
+        """
+        sha256_hash = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(
+            dir=local_path.parent, prefix=f".{local_path.name}.", suffix='.part'
+        )
+        
+        try:
+            with open(fd, 'wb') as f:
+                f.truncate(size)
+                
+                request = {'Bucket': self.bucket_name, 'Key': remote_key}
+                if etag:
+                    request['IfMatch'] = etag
+                
+                def fetch(start: int) -> bytes:
+                    end = min(start + RANGE_DOWNLOAD_CHUNK, size) - 1
+                    response = self.s3_client.get_object(
+                        Range=f"bytes={start}-{end}", **request
+                    )
+                    data = response['Body'].read()
+                    # pwrite may write less than asked; loop until the range is in
+                    view = memoryview(data)
+                    written = 0
+                    while written < len(view):
+                        written += os.pwrite(fd, view[written:], start + written)
+                    return data
+                
+                pending = deque()
+                with ThreadPoolExecutor(max_workers=RANGE_DOWNLOAD_WORKERS) as executor:
+                    try:
+                        for start in range(0, size, RANGE_DOWNLOAD_CHUNK):
+                            pending.append(executor.submit(fetch, start))
+                            if len(pending) >= RANGE_DOWNLOAD_WORKERS * 2:
+                                sha256_hash.update(pending.popleft().result())
+                        while pending:
+                            sha256_hash.update(pending.popleft().result())
+                    except BaseException:
+                        for future in pending:
+                            future.cancel()
+                        raise
+                
+                if fadvise:
+                    fadvise_dontneed(f)
+            os.replace(temp_path, local_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        
+        return sha256_hash.hexdigest()
+    
     def delete_file(self, remote_key: str) -> Dict[str, any]:
         """Delete a file from cloud storage.
         
@@ -263,7 +389,14 @@ class CloudStorageManager:
         
         # Upload all files in directory
         for file_path in local_dir.rglob('*'):
-            if file_path.is_file():
+            # One stat per entry serves both the regular-file check and the
+            # size; entries that vanish mid-walk or dangling symlinks are
+            # skipped, as is_file() would
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
                 # Calculate relative path for remote key
                 relative_path = file_path.relative_to(local_dir)
                 remote_key = f"{remote_prefix}/{relative_path}".strip('/')
@@ -271,7 +404,8 @@ class CloudStorageManager:
                 result = self.upload_file(
                     file_path,
                     remote_key=remote_key,
-                    encryption=encryption
+                    encryption=encryption,
+                    file_size=file_stat.st_size
                 )
                 
                 if result['success']:
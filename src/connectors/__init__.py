@@ -63,10 +63,11 @@ from .connector_manager import ConnectorManager
 
 # Azure connector is optional (requires azure-storage-blob)
 try:
-    from .azure_blob_connector import AzureBlobConnector
+    from .azure_blob_connector import AzureBlobConnector, AsyncAzureBlobConnector
     AZURE_AVAILABLE = True
 except ImportError:
     AzureBlobConnector = None  # type: ignore
+    AsyncAzureBlobConnector = None  # type: ignore
     AZURE_AVAILABLE = False
 
 
@@ -77,6 +78,7 @@ __all__ = [
     'DropboxConnector',
     'OneDriveConnector',
     'AzureBlobConnector',
+    'AsyncAzureBlobConnector',
     'ConnectorManager',
     'AZURE_AVAILABLE',
 ]
@@ -5,28 +5,248 @@ the CloudConnector interface for secure cloud file operations.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
-from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union, Any
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+import asyncio
+import ctypes
+import hashlib
+import inspect
+import io
 import logging
+import mimetypes
+import mmap
+import threading
+import time
+
+from importlib.util import find_spec
+from urllib.parse import quote
+
+from .base_connector import CloudConnector
+
+# The Azure SDK (and requests for the HTTP pool) takes a noticeable share of
+# startup time, so only probe for it here; the names below are bound by
+# _import_azure() when the first connector is created. find_spec raises
+# ValueError for a module already in sys.modules without a __spec__.
+try:
+    AZURE_AVAILABLE = (
+        find_spec('azure.storage.blob') is not None
+        and find_spec('requests') is not None
+    )
+except (ImportError, ValueError):
+    AZURE_AVAILABLE = False
 
 try:
+    AZURE_AIO_AVAILABLE = AZURE_AVAILABLE and find_spec('aiohttp') is not None
+except (ImportError, ValueError):
+    AZURE_AIO_AVAILABLE = False
+
+BlobServiceClient = ContainerClient = BlobClient = None
+ContentSettings = ExponentialRetry = None
+generate_blob_sas = BlobSasPermissions = None
+AzureError = HttpResponseError = ResourceNotFoundError = None
+ResourceExistsError = ClientAuthenticationError = None
+requests = HTTPAdapter = None
+AsyncBlobServiceClient = None
+
+
+def _import_azure(aio: bool = False) -> None:
+    """Import the Azure SDK and bind its names at module level.
+
+    Repeat calls only hit the ``sys.modules`` cache.
+
+    Args:
+        aio: Also import the asyncio client.
+    """
+    global BlobServiceClient, ContainerClient, BlobClient
+    global ContentSettings, ExponentialRetry, generate_blob_sas, BlobSasPermissions
+    global AzureError, HttpResponseError, ResourceNotFoundError
+    global ResourceExistsError, ClientAuthenticationError
+    global requests, HTTPAdapter, AsyncBlobServiceClient
+
     from azure.storage.blob import BlobServiceClient, ContainerClient, BlobClient
-    from azure.storage.blob import ContentSettings
+    from azure.storage.blob import ContentSettings, ExponentialRetry
+    from azure.storage.blob import generate_blob_sas, BlobSasPermissions
     from azure.core.exceptions import (
         AzureError,
+        HttpResponseError,
         ResourceNotFoundError,
         ResourceExistsError,
         ClientAuthenticationError
     )
-    AZURE_AVAILABLE = True
-except ImportError:
-    AZURE_AVAILABLE = False
+    import requests
+    from requests.adapters import HTTPAdapter
 
-from .base_connector import CloudConnector
+    if aio:
+        from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
 
 
 logger = logging.getLogger(__name__)
 
+# Blobs up to this size go up in a single Put Blob request; larger ones are
+# split into blocks that are staged in parallel and committed with Put Block
+# List.
+DEFAULT_SINGLE_PUT_THRESHOLD = 256 * 1024 * 1024
+DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+# Bounds for the adaptive block size: each staged block that beats the
+# running average throughput grows the next block by 25%, each slower one
+# shrinks it by 25%.
+MIN_BLOCK_SIZE = 256 * 1024
+# Blocks a committed blob may have (service limit); blocks are never made so
+# small that the rest of the file would need more than this
+MAX_BLOCKS_PER_BLOB = 50000
+MAX_ADAPTIVE_BLOCK_SIZE = 100 * 1024 * 1024
+BLOCK_SIZE_STEP = 1.25
+THROUGHPUT_EWMA_ALPHA = 0.2
+# The first GET of a download fetches this much; the rest is fetched in
+# parallel ranged GETs.
+MAX_SINGLE_GET_SIZE = 32 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+# Whole-file transfers allowed at once per connector; more than a few only
+# splits the link between them and stretches tail latency
+DEFAULT_MAX_PARALLEL_TRANSFERS = 3
+# Attempts per request (each block or range retries on its own) with
+# exponential backoff starting at one second
+DEFAULT_MAX_RETRIES = 5
+# Sub-requests per Blob Batch call (service maximum)
+DELETE_BATCH_SIZE = 256
+# Blobs requested per List Blobs call when paging through a container
+LIST_PAGE_SIZE = 5000
+# Asynchronous (server-side) copies are polled with exponential backoff
+# until they leave the 'pending' state or the timeout passes
+COPY_POLL_INITIAL_DELAY = 0.5
+COPY_POLL_MAX_DELAY = 30.0
+COPY_POLL_TIMEOUT = 3600.0
+# Lifetime of the read SAS that authorizes the source of a synchronous copy
+COPY_SOURCE_SAS_MINUTES = 15
+# BlobClient objects kept per connector, most recently used first out last
+BLOB_CLIENT_CACHE_SIZE = 1024
+# SAS URLs kept per connector; expiries are rounded up to this granularity so
+# repeated shares of a blob within it reuse one signature
+SAS_URL_CACHE_SIZE = 256
+SAS_EXPIRY_GRANULARITY = timedelta(minutes=5)
+# Kept-alive connections shared by every operation on a connector, so small
+# metadata and list calls skip the TCP/TLS handshake
+HTTP_POOL_SIZE = 32
+
+
+# Content types for the extensions this tool uploads most, checked before
+# falling back to the mimetypes database
+_FAST_MIME = {
+    '.dcm': 'application/dicom',
+    '.dicom': 'application/dicom',
+    '.nii': 'application/octet-stream',
+    '.enc': 'application/octet-stream',
+    '.bin': 'application/octet-stream',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.tif': 'image/tiff',
+    '.tiff': 'image/tiff',
+    '.pdf': 'application/pdf',
+    '.mp4': 'video/mp4',
+    '.json': 'application/json',
+    '.txt': 'text/plain',
+    '.csv': 'text/csv',
+}
+
+
+@lru_cache(maxsize=256)
+def _guess_content_type(suffixes: str) -> str:
+    """Look up the content type for a file's combined extensions."""
+    content_type, _ = mimetypes.guess_type(f"file{suffixes}")
+    return content_type or 'application/octet-stream'
+
+
+def _wipe(buf: bytearray) -> None:
+    """Overwrite a buffer with zeros in place."""
+    if buf:
+        view = (ctypes.c_char * len(buf)).from_buffer(buf)
+        ctypes.memset(ctypes.addressof(view), 0, len(buf))
+        del view
+
+
+class _SecretStr:
+    """Descriptor keeping a credential in a bytearray that can be zeroed.
+
+    Assigning a new value (including None) zeroes the previous buffer, so
+    clearing the attribute scrubs the connector's copy deterministically.
+    The caller's original str and the str returned on each read are
+    ordinary immutable objects, so for those this is best effort.
+    """
+
+    def __set_name__(self, owner, name):
+        self.attr = f'_{name}_buf'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        buf = obj.__dict__.get(self.attr)
+        return buf.decode() if buf is not None else None
+
+    def __set__(self, obj, value: Optional[str]) -> None:
+        old = obj.__dict__.get(self.attr)
+        if old is not None:
+            _wipe(old)
+        obj.__dict__[self.attr] = bytearray(value.encode()) if value else None
+
+
+class _HashingReader(io.RawIOBase):
+    """Read-only file wrapper that feeds every byte read into SHA-256.
+
+    Reports itself as non-seekable so the SDK reads blocks strictly in
+    order, which keeps the digest equal to the file's checksum.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.hasher = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self._raw.readinto(buffer)
+        if n:
+            self.hasher.update(memoryview(buffer)[:n])
+        return n
+
+
+def _rate_limited(operation: str):
+    """Decorate a connector method with a rate-limit check.
+
+    The limiter is only consulted when the connector has one, so the
+    common unlimited case costs a single attribute test. A limiter timeout
+    is reported as a failed result dict, like any other operation error.
+
+    Args:
+        operation: Operation name used in rate-limit logs and errors.
+    """
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+            @wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if self._rate_limiter is not None:
+                    try:
+                        await self._acheck_rate_limit(operation)
+                    except RuntimeError as e:
+                        return {'success': False, 'error': str(e)}
+                return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self._rate_limiter is not None:
+                try:
+                    self._check_rate_limit(operation)
+                except RuntimeError as e:
+                    return {'success': False, 'error': str(e)}
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class AzureBlobConnector(CloudConnector):
     """Azure Blob Storage cloud connector.
@@ -51,6 +271,12 @@ class AzureBlobConnector(CloudConnector):
         >>> result = connector.upload_file("scan.dcm", "studies/patient123/scan.dcm")
     """
 
+    # Credentials live in zeroable buffers; see _SecretStr
+    connection_string = _SecretStr()
+    account_key = _SecretStr()
+    sas_token = _SecretStr()
+    _sas_account_key = _SecretStr()
+
     def __init__(
         self,
         container_name: str,
@@ -58,7 +284,12 @@ class AzureBlobConnector(CloudConnector):
         account_name: Optional[str] = None,
         account_key: Optional[str] = None,
         sas_token: Optional[str] = None,
-        rate_limiter = None
+        rate_limiter = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_parallel_transfers: int = DEFAULT_MAX_PARALLEL_TRANSFERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        single_put_threshold: int = DEFAULT_SINGLE_PUT_THRESHOLD,
+        block_size: int = DEFAULT_BLOCK_SIZE
     ):
         """Initialize Azure Blob Storage connector.
 
@@ -74,6 +305,16 @@ class AzureBlobConnector(CloudConnector):
             account_key: Azure Storage account key.
             sas_token: Shared Access Signature token for delegated access.
             rate_limiter: Optional RateLimiter instance for API throttling.
+            max_concurrency: Parallel block uploads and ranged downloads
+                per transfer.
+            max_parallel_transfers: Uploads/downloads allowed to run at
+                once; further callers wait for a slot.
+            max_retries: Retries per failed request, with exponential
+                backoff.
+            single_put_threshold: Largest file uploaded with a single Put
+                Blob request (read into memory and hashed up front).
+            block_size: Initial block size for larger, multi-block uploads;
+                adapted to measured throughput as blocks are staged.
 
         Raises:
             ImportError: If azure-storage-blob package is not installed.
@@ -85,6 +326,7 @@ class AzureBlobConnector(CloudConnector):
                 "Install with: pip install azure-storage-blob"
             )
 
+        _import_azure(aio=isinstance(self, AsyncAzureBlobConnector))
         super().__init__(rate_limiter=rate_limiter)
 
         self.container_name = container_name
@@ -92,6 +334,15 @@ class AzureBlobConnector(CloudConnector):
         self.account_name = account_name
         self.account_key = account_key
         self.sas_token = sas_token
+        self.max_concurrency = max_concurrency
+        self.max_parallel_transfers = max_parallel_transfers
+        self.max_retries = max_retries
+        self.single_put_threshold = single_put_threshold
+        self.block_size = block_size
+        self._block_size = block_size
+        self._throughput_ewma: Optional[float] = None
+        self._block_size_lock = threading.Lock()
+        self._transfer_semaphore = threading.Semaphore(max_parallel_transfers)
 
         # Validate authentication
         if not connection_string and not account_name:
@@ -105,8 +356,103 @@ class AzureBlobConnector(CloudConnector):
                 "When using account_name, must also provide account_key or sas_token"
             )
 
+        # Parse SAS signing credentials once rather than per SAS URL
+        self._sas_account_name = account_name
+        self._sas_account_key = account_key
+        if connection_string and not account_key:
+            parts = dict(part.split('=', 1) for part in connection_string.split(';') if '=' in part)
+            self._sas_account_name = parts.get('AccountName')
+            self._sas_account_key = parts.get('AccountKey')
+
         self.blob_service_client: Optional[BlobServiceClient] = None
         self.container_client: Optional[ContainerClient] = None
+        self._session = None
+        # Plain LRU dict rather than functools.lru_cache on a bound method,
+        # which would keep the connector alive in a reference cycle and
+        # delay the credential wipe in __del__
+        self._blob_clients: "OrderedDict[str, Any]" = OrderedDict()
+        self._blob_clients_lock = threading.Lock()
+        self._sas_urls: "OrderedDict[tuple, str]" = OrderedDict()
+        self._sas_urls_lock = threading.Lock()
+
+    def _get_blob_client(self, remote_path: str):
+        """Return a cached BlobClient for a blob in the container.
+
+        BlobClient objects are thread-safe, so one per path is shared by
+        all operations instead of rebuilding the URL and pipeline binding
+        on every call.
+        """
+        with self._blob_clients_lock:
+            client = self._blob_clients.get(remote_path)
+            if client is not None:
+                self._blob_clients.move_to_end(remote_path)
+                return client
+
+            client = self.container_client.get_blob_client(remote_path)
+            self._blob_clients[remote_path] = client
+            if len(self._blob_clients) > BLOB_CLIENT_CACHE_SIZE:
+                self._blob_clients.popitem(last=False)
+            return client
+
+    def _clear_blob_clients(self) -> None:
+        """Drop cached BlobClients bound to the current container client."""
+        with self._blob_clients_lock:
+            self._blob_clients.clear()
+
+    def _clear_sas_urls(self) -> None:
+        """Drop cached SAS URLs."""
+        with self._sas_urls_lock:
+            self._sas_urls.clear()
+
+    def _close_session(self) -> None:
+        """Close the HTTP session and its pooled connections, if any."""
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+            self._session = None
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Transfer sizes and retry policy shared by sync and aio clients."""
+        return {
+            'max_single_put_size': self.single_put_threshold,
+            'max_block_size': self.block_size,
+            'max_single_get_size': MAX_SINGLE_GET_SIZE,
+            'retry_policy': ExponentialRetry(
+                initial_backoff=1,
+                increment_base=2,
+                retry_total=self.max_retries
+            )
+        }
+
+    def _create_service_client(self, client_cls, **client_kwargs):
+        """Build a service client using the configured authentication.
+
+        Args:
+            client_cls: Sync or aio BlobServiceClient class.
+            **client_kwargs: Transport and transfer options for the client.
+
+        Returns:
+            A client_cls instance.
+        """
+        if self.connection_string:
+            # Connection string auth (most common)
+            return client_cls.from_connection_string(
+                self.connection_string,
+                **client_kwargs
+            )
+
+        account_url = f"https://{self.account_name}.blob.core.windows.net"
+        if self.account_key:
+            # Account key auth
+            return client_cls(
+                account_url=account_url,
+                credential=self.account_key,
+                **client_kwargs
+            )
+
+        # SAS token auth: append SAS token to URL
+        sas_url = f"{account_url}?{self.sas_token.lstrip('?')}"
+        return client_cls(account_url=sas_url, **client_kwargs)
 
     def connect(self) -> bool:
         """Establish connection to Azure Blob Storage.
@@ -114,30 +460,31 @@ class AzureBlobConnector(CloudConnector):
         Returns:
             bool: True if connection successful, False otherwise.
         """
+        # One long-lived session per connector; the pool is at least as
+        # large as the transfer concurrency so parallel block transfers do
+        # not wait on "connection pool is full". Retries are left to the
+        # SDK's own retry policy.
+        pool_size = max(HTTP_POOL_SIZE, self.max_concurrency)
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=0
+        )
+        session.mount('https://', adapter)
+        self._close_session()
+        self._session = session
+
         try:
-            if self.connection_string:
-                # Connection string auth (most common)
-                self.blob_service_client = BlobServiceClient.from_connection_string(
-                    self.connection_string
-                )
-            elif self.account_key:
-                # Account key auth
-                account_url = f"https://{self.account_name}.blob.core.windows.net"
-                self.blob_service_client = BlobServiceClient(
-                    account_url=account_url,
-                    credential=self.account_key
-                )
-            elif self.sas_token:
-                # SAS token auth
-                account_url = f"https://{self.account_name}.blob.core.windows.net"
-                # Append SAS token to URL
-                sas_url = f"{account_url}?{self.sas_token.lstrip('?')}"
-                self.blob_service_client = BlobServiceClient(account_url=sas_url)
+            self.blob_service_client = self._create_service_client(
+                BlobServiceClient, session=session, **self._client_options()
+            )
 
             # Get container client
             self.container_client = self.blob_service_client.get_container_client(
                 self.container_name
             )
+            self._clear_blob_clients()
 
             # Test connection by checking if container exists
             if not self.container_client.exists():
@@ -169,6 +516,9 @@ class AzureBlobConnector(CloudConnector):
         Returns:
             bool: True if disconnection successful.
         """
+        self._close_session()
+        self._clear_blob_clients()
+        self._clear_sas_urls()
         self.blob_service_client = None
         self.container_client = None
         self._connected = False
@@ -179,7 +529,8 @@ class AzureBlobConnector(CloudConnector):
         """Securely clear credentials from memory when object is destroyed.
 
         This prevents credential leakage through process memory dumps.
-        Called automatically when the object is garbage collected.
+        Called automatically when the object is garbage collected. Clearing
+        each credential zeroes its buffer before the reference is dropped.
         """
         # Clear Azure credentials
         if hasattr(self, 'connection_string') and self.connection_string:
@@ -188,18 +539,21 @@ class AzureBlobConnector(CloudConnector):
             self.account_key = None
         if hasattr(self, 'sas_token') and self.sas_token:
             self.sas_token = None
+        if hasattr(self, '_sas_account_key') and self._sas_account_key:
+            self._sas_account_key = None
+        if hasattr(self, '_sas_urls'):
+            self._sas_urls.clear()
 
-        # Clear client objects
-        if hasattr(self, 'blob_service_client'):
-            self.blob_service_client = None
-        if hasattr(self, 'container_client'):
-            self.container_client = None
+        # Release pooled connections
+        self._close_session()
 
+    @_rate_limited("upload_file")
     def upload_file(
         self,
         file_path: Union[str, Path],
         remote_path: str,
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        staging_source: Optional[Union[str, Path]] = None
     ) -> Dict[str, Any]:
         """Upload a file to Azure Blob Storage.
 
@@ -207,6 +561,10 @@ class AzureBlobConnector(CloudConnector):
             file_path: Path to the local file.
             remote_path: Blob name/path in the container.
             metadata: Optional metadata to attach to the blob.
+            staging_source: File to copy to file_path before uploading,
+                copied in-kernel rather than through Python buffers. Only
+                useful when file_path is a spool on another filesystem;
+                otherwise upload the source path directly.
 
         Returns:
             Dictionary containing upload result information.
@@ -222,40 +580,49 @@ class AzureBlobConnector(CloudConnector):
 
         file_path = Path(file_path)
 
+        if staging_source is not None:
+            from ..core.file_io import copy_file
+            try:
+                copy_file(staging_source, file_path)
+            except OSError as e:
+                return {'success': False, 'error': f'Staging failed: {e}'}
+
         if not file_path.exists():
             return {'success': False, 'error': f'File not found: {file_path}'}
 
-        # Check rate limit before API call
-        try:
-            self._check_rate_limit("upload_file")
-        except RuntimeError as e:
-            return {'success': False, 'error': str(e)}
-
         try:
-            # Calculate checksum
-            checksum = self._calculate_checksum(file_path)
-
             # Prepare metadata
             blob_metadata = metadata or {}
-            blob_metadata['checksum'] = checksum
             blob_metadata['upload_time'] = datetime.now(timezone.utc).isoformat()
             blob_metadata['original_name'] = file_path.name
 
             # Get blob client
-            blob_client = self.container_client.get_blob_client(remote_path)
+            blob_client = self._get_blob_client(remote_path)
 
             # Detect content type
             content_type = self._get_content_type(file_path)
             content_settings = ContentSettings(content_type=content_type)
 
-            # Upload file
-            with open(file_path, 'rb') as data:
-                blob_client.upload_blob(
-                    data,
-                    overwrite=True,
-                    metadata=blob_metadata,
-                    content_settings=content_settings
-                )
+            file_size = file_path.stat().st_size
+            with self._transfer_semaphore:
+                if file_size <= self.single_put_threshold:
+                    # Small enough for one Put Blob: read and hash it up
+                    # front so the checksum goes out with the upload
+                    data = file_path.read_bytes()
+                    checksum = hashlib.sha256(data).hexdigest()
+                    blob_metadata['checksum'] = checksum
+                    blob_client.upload_blob(
+                        data,
+                        length=file_size,
+                        overwrite=True,
+                        metadata=blob_metadata,
+                        content_settings=content_settings,
+                        validate_content=True
+                    )
+                else:
+                    checksum = self._upload_blocks(
+                        blob_client, file_path, blob_metadata, content_settings
+                    )
 
             logger.info(
                 f"Successfully uploaded {file_path} to "
@@ -266,7 +633,7 @@ class AzureBlobConnector(CloudConnector):
                 'success': True,
                 'remote_path': remote_path,
                 'checksum': checksum,
-                'size': file_path.stat().st_size,
+                'size': file_size,
                 'timestamp': blob_metadata['upload_time']
             }
 
@@ -277,6 +644,7 @@ class AzureBlobConnector(CloudConnector):
                 'error': str(e)
             }
 
+    @_rate_limited("download_file")
     def download_file(
         self,
         remote_path: str,
@@ -307,30 +675,39 @@ class AzureBlobConnector(CloudConnector):
         # Create parent directory if needed
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check rate limit before API call
-        try:
-            self._check_rate_limit("download_file")
-        except RuntimeError as e:
-            return {'success': False, 'error': str(e)}
-
         try:
             # Get blob client
-            blob_client = self.container_client.get_blob_client(remote_path)
+            blob_client = self._get_blob_client(remote_path)
 
             # Get blob properties to retrieve metadata
             properties = blob_client.get_blob_properties()
             stored_checksum = properties.metadata.get('checksum') if properties.metadata else None
+            validate, verify = self._download_verification(
+                properties, stored_checksum, verify_checksum
+            )
 
-            # Download file
-            with open(local_path, 'wb') as download_file:
-                download_stream = blob_client.download_blob()
-                download_file.write(download_stream.readall())
+            # Stream the blob to disk so peak memory stays around
+            # max_block_size * max_concurrency rather than the blob size
+            hasher = hashlib.sha256()
+            with self._transfer_semaphore, open(local_path, 'wb') as download_file:
+                download_stream = blob_client.download_blob(
+                    max_concurrency=self.max_concurrency,
+                    validate_content=validate
+                )
+                if verify:
+                    # Chunks arrive in order, so they can be hashed as they
+                    # are written instead of reading the file back
+                    for chunk in download_stream.chunks():
+                        hasher.update(chunk)
+                        download_file.write(chunk)
+                else:
+                    # Ranges are written in parallel straight into the file
+                    download_stream.readinto(download_file)
 
             # Verify checksum if requested
-            checksum_verified = False
-            if verify_checksum and stored_checksum:
-                local_checksum = self._calculate_checksum(local_path)
-                if local_checksum != stored_checksum:
+            checksum_verified = validate
+            if verify:
+                if hasher.hexdigest() != stored_checksum:
                     local_path.unlink()  # Delete corrupted file
                     return {
                         'success': False,
@@ -363,6 +740,160 @@ class AzureBlobConnector(CloudConnector):
                 'error': str(e)
             }
 
+    @staticmethod
+    def _download_verification(properties, stored_checksum, verify_checksum: bool):
+        """Choose how a download is verified.
+
+        Blobs carrying a Content-MD5 are checked by the SDK with the
+        transactional MD5 the service returns for each range, so no local
+        hashing is needed. Blobs without one fall back to hashing the
+        stream against the checksum stored in the metadata.
+
+        Args:
+            properties: Blob properties.
+            stored_checksum: SHA-256 checksum from the blob metadata, if any.
+            verify_checksum: Whether verification was requested.
+
+        Returns:
+            Tuple of (validate_content, verify_stored_checksum).
+        """
+        if not verify_checksum:
+            return False, False
+        content_settings = properties.content_settings
+        if content_settings is not None and content_settings.content_md5:
+            return True, False
+        return False, bool(stored_checksum)
+
+    def _upload_blocks(
+        self,
+        blob_client,
+        file_path: Path,
+        blob_metadata: Dict[str, str],
+        content_settings
+    ) -> str:
+        """Upload a file as staged blocks sized by measured throughput.
+
+        The file is memory-mapped and blocks are handed to the SDK as
+        memoryview slices, so block data goes from the page cache to the
+        socket without being copied onto the Python heap. Blocks are hashed
+        in order, staged by up to max_concurrency workers, and committed
+        with the checksum in the blob metadata.
+
+        Args:
+            blob_client: Client for the destination blob.
+            file_path: Path to the local file.
+            blob_metadata: Metadata to commit with the blob; the checksum
+                is added to it.
+            content_settings: Content settings to commit with the blob.
+
+        Returns:
+            Hexadecimal SHA-256 checksum of the file.
+        """
+        hasher = hashlib.sha256()
+        block_ids = []
+        pending = deque()
+
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            # Each in-flight slice is paired with its future and released
+            # once staged; every slice must be released, even on failure,
+            # before the mapping can close
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                    try:
+                        offset = 0
+                        while offset < len(view):
+                            size = self._next_block_size(len(view) - offset, len(block_ids))
+                            block = view[offset:offset + size]
+                            offset += len(block)
+                            hasher.update(block)
+                            # IDs must all have the same length within a blob
+                            block_id = f"{len(block_ids):08d}"
+                            block_ids.append(block_id)
+                            pending.append((
+                                executor.submit(self._stage_block, blob_client, block_id, block),
+                                block
+                            ))
+                            if len(pending) >= self.max_concurrency:
+                                self._finish_block(pending.popleft())
+                        while pending:
+                            self._finish_block(pending.popleft())
+                    except BaseException:
+                        for future, _ in pending:
+                            future.cancel()
+                        raise
+            finally:
+                # The executor has shut down, so no worker still reads these
+                for _, block in pending:
+                    block.release()
+                block = None
+
+        checksum = hasher.hexdigest()
+        blob_metadata['checksum'] = checksum
+        blob_client.commit_block_list(
+            block_ids,
+            metadata=blob_metadata,
+            content_settings=content_settings
+        )
+        return checksum
+
+    def _next_block_size(self, remaining: int, staged: int) -> int:
+        """Return the adaptive block size, raised if needed to fit the block limit.
+
+        Args:
+            remaining: Bytes of the file not yet split into blocks.
+            staged: Blocks already split off.
+
+        Returns:
+            Size in bytes for the next block.
+        """
+        blocks_left = max(1, MAX_BLOCKS_PER_BLOB - staged)
+        return max(self._block_size, -(-remaining // blocks_left))
+
+    @staticmethod
+    def _finish_block(entry) -> None:
+        """Wait for a staged block, then release its slice of the mapping."""
+        future, block = entry
+        try:
+            future.result()
+        finally:
+            block.release()
+
+    def _stage_block(self, blob_client, block_id: str, data: memoryview) -> None:
+        """Stage one block and feed its throughput to the block sizer."""
+        start = time.monotonic()
+        blob_client.stage_block(block_id, data, length=len(data))
+        elapsed = time.monotonic() - start
+        if elapsed > 0:
+            self._record_block_throughput(len(data) / elapsed)
+
+    def _record_block_throughput(self, rate: float) -> None:
+        """Grow or shrink the next block size based on a throughput sample.
+
+        Blocks that beat the running average suggest the link can take
+        larger requests; slower ones (including those the SDK had to
+        retry) shrink the block so a retry costs less. The average is kept
+        for the connector's lifetime, so long-running processes converge
+        on their link's best size.
+
+        Args:
+            rate: Bytes per second achieved by the last staged block.
+        """
+        with self._block_size_lock:
+            if self._throughput_ewma is None:
+                self._throughput_ewma = rate
+                return
+
+            if rate > self._throughput_ewma:
+                size = int(self._block_size * BLOCK_SIZE_STEP)
+            else:
+                size = int(self._block_size / BLOCK_SIZE_STEP)
+            self._block_size = max(MIN_BLOCK_SIZE, min(MAX_ADAPTIVE_BLOCK_SIZE, size))
+
+            self._throughput_ewma += THROUGHPUT_EWMA_ALPHA * (rate - self._throughput_ewma)
+
+    @_rate_limited("delete_file")
     def delete_file(self, remote_path: str) -> Dict[str, Any]:
         """Delete a file from Azure Blob Storage.
 
@@ -381,14 +912,8 @@ class AzureBlobConnector(CloudConnector):
         except ValueError as e:
             return {'success': False, 'error': str(e)}
 
-        # Check rate limit before API call
-        try:
-            self._check_rate_limit("delete_file")
-        except RuntimeError as e:
-            return {'success': False, 'error': str(e)}
-
         try:
-            blob_client = self.container_client.get_blob_client(remote_path)
+            blob_client = self._get_blob_client(remote_path)
             blob_client.delete_blob()
 
             logger.info(
@@ -414,45 +939,185 @@ class AzureBlobConnector(CloudConnector):
                 'error': str(e)
             }
 
+    def delete_files(self, remote_paths: List[str]) -> List[Dict[str, Any]]:
+        """Delete many blobs using Blob Batch requests.
+
+        Sends up to 256 deletes per HTTP request instead of one request per
+        blob. Invalid paths are reported without being sent.
+
+        Args:
+            remote_paths: Blob names/paths to delete.
+
+        Returns:
+            One result per input path, in order, shaped like delete_file()
+            results.
+        """
+        if not self._connected:
+            return [
+                {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+                for _ in remote_paths
+            ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(remote_paths)
+        to_delete = []
+        validate = self._validate_remote_path
+        for i, remote_path in enumerate(remote_paths):
+            # Validate remote path to prevent directory traversal
+            try:
+                validate(remote_path)
+                to_delete.append((i, remote_path))
+            except ValueError as e:
+                results[i] = {'success': False, 'error': str(e)}
+
+        # One rate-limit token covers the whole batch
+        try:
+            self._check_rate_limit("delete_files")
+        except RuntimeError as e:
+            return [
+                result or {'success': False, 'error': str(e)}
+                for result in results
+            ]
+
+        batch_result = self._batch_delete_result
+        for start in range(0, len(to_delete), DELETE_BATCH_SIZE):
+            batch = to_delete[start:start + DELETE_BATCH_SIZE]
+            try:
+                responses = self.container_client.delete_blobs(
+                    *(path for _, path in batch),
+                    raise_on_any_failure=False
+                )
+                for (i, path), response in zip(batch, responses):
+                    results[i] = batch_result(path, response.status_code)
+            except AzureError as e:
+                logger.error(f"Azure Blob batch deletion failed: {e}")
+                for i, _ in batch:
+                    if results[i] is None:
+                        results[i] = {'success': False, 'error': str(e)}
+
+        logger.info(
+            f"Batch deleted {sum(1 for r in results if r['success'])} of "
+            f"{len(remote_paths)} blobs from azure://{self.container_name}"
+        )
+        return results
+
+    @staticmethod
+    def _batch_delete_result(remote_path: str, status_code: int) -> Dict[str, Any]:
+        """Convert one Blob Batch sub-response into a delete result."""
+        if status_code == 404:
+            # Consider deletion of non-existent blob as success
+            return {
+                'success': True,
+                'remote_path': remote_path,
+                'warning': 'Blob did not exist'
+            }
+        if 200 <= status_code < 300:
+            return {'success': True, 'remote_path': remote_path}
+        return {
+            'success': False,
+            'error': f'Delete failed with HTTP {status_code}: {remote_path}'
+        }
+
     def list_files(self, prefix: str = '') -> List[Dict[str, Any]]:
         """List blobs in Azure container.
 
+        Builds the whole listing in memory; use iter_files() to stream
+        large containers.
+
         Args:
             prefix: Filter results by blob name prefix.
 
         Returns:
             List of file information dictionaries.
         """
+        try:
+            return list(self.iter_files(prefix))
+
+        except AzureError as e:
+            logger.error(f"Azure Blob list operation failed: {e}")
+            return []
+
+    def iter_files(
+        self,
+        prefix: str = '',
+        page_size: int = LIST_PAGE_SIZE,
+        include_metadata: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream blobs in Azure container one page at a time.
+
+        Only one page of results is held in memory, so callers can walk
+        containers with millions of blobs. The base listing already carries
+        size, etag and content type; no extra datasets are requested unless
+        include_metadata is set.
+
+        Args:
+            prefix: Filter results by blob name prefix.
+            page_size: Blobs requested per List Blobs call.
+            include_metadata: Also fetch custom metadata, returned under
+                'metadata' in each entry.
+
+        Yields:
+            File information dictionaries, as returned by list_files().
+
+        Raises:
+            AzureError: If a page request fails part-way through.
+        """
         if not self._connected:
             logger.error("Not connected to Azure Blob Storage")
-            return []
+            return
 
         # Check rate limit before API call
         try:
             self._check_rate_limit("list_files")
         except RuntimeError as e:
             logger.error(f"Rate limit exceeded: {e}")
-            return []
+            return
+
+        pages = self.container_client.list_blobs(
+            name_starts_with=prefix or None,
+            include=['metadata'] if include_metadata else None,
+            results_per_page=page_size
+        ).by_page()
+        blob_entry = self._blob_entry
+        for page in pages:
+            for blob in page:
+                yield blob_entry(blob, include_metadata)
+
+    def iter_file_names(
+        self,
+        prefix: str = '',
+        page_size: int = LIST_PAGE_SIZE
+    ) -> Iterator[str]:
+        """Stream blob names only.
 
-        try:
-            blobs = self.container_client.list_blobs(name_starts_with=prefix or None)
+        Skips deserializing blob properties, which makes this the cheapest
+        way to walk a large container when only names are needed.
 
-            files = []
-            for blob in blobs:
-                files.append({
-                    'path': blob.name,
-                    'size': blob.size,
-                    'last_modified': blob.last_modified.isoformat() if blob.last_modified else None,
-                    'checksum': blob.etag.strip('"') if blob.etag else None,
-                    'content_type': blob.content_settings.content_type if blob.content_settings else None
-                })
+        Args:
+            prefix: Filter results by blob name prefix.
+            page_size: Blobs requested per List Blobs call.
 
-            return files
+        Yields:
+            Blob names.
 
-        except AzureError as e:
-            logger.error(f"Azure Blob list operation failed: {e}")
-            return []
+        Raises:
+            AzureError: If a page request fails part-way through.
+        """
+        if not self._connected:
+            logger.error("Not connected to Azure Blob Storage")
+            return
 
+        try:
+            self._check_rate_limit("list_files")
+        except RuntimeError as e:
+            logger.error(f"Rate limit exceeded: {e}")
+            return
+
+        yield from self.container_client.list_blob_names(
+            name_starts_with=prefix or None,
+            results_per_page=page_size
+        )
+
+    @_rate_limited("get_file_metadata")
     def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
         """Get metadata for a blob in Azure Storage.
 
@@ -471,26 +1136,11 @@ class AzureBlobConnector(CloudConnector):
         except ValueError as e:
             return {'success': False, 'error': str(e)}
 
-        # Check rate limit before API call
-        try:
-            self._check_rate_limit("get_file_metadata")
-        except RuntimeError as e:
-            return {'success': False, 'error': str(e)}
-
         try:
-            blob_client = self.container_client.get_blob_client(remote_path)
+            blob_client = self._get_blob_client(remote_path)
             properties = blob_client.get_blob_properties()
 
-            return {
-                'success': True,
-                'size': properties.size,
-                'last_modified': properties.last_modified.isoformat() if properties.last_modified else None,
-                'metadata': dict(properties.metadata) if properties.metadata else {},
-                'checksum': properties.etag.strip('"') if properties.etag else None,
-                'content_type': properties.content_settings.content_type if properties.content_settings else None,
-                'creation_time': properties.creation_time.isoformat() if properties.creation_time else None,
-                'blob_type': properties.blob_type
-            }
+            return self._properties_result(properties)
 
         except ResourceNotFoundError:
             logger.error(f"Blob not found: {remote_path}")
@@ -505,6 +1155,39 @@ class AzureBlobConnector(CloudConnector):
                 'error': str(e)
             }
 
+    @staticmethod
+    def _blob_entry(blob, include_metadata: bool = False) -> Dict[str, Any]:
+        """Convert a listed blob into a list_files entry."""
+        # Runs once per listed blob: read each property a single time
+        last_modified = blob.last_modified
+        etag = blob.etag
+        content_settings = blob.content_settings
+        entry = {
+            'path': blob.name,
+            'size': blob.size,
+            'last_modified': last_modified.isoformat() if last_modified else None,
+            'checksum': etag.strip('"') if etag else None,
+            'content_type': content_settings.content_type if content_settings else None
+        }
+        if include_metadata:
+            metadata = blob.metadata
+            entry['metadata'] = dict(metadata) if metadata else {}
+        return entry
+
+    @staticmethod
+    def _properties_result(properties) -> Dict[str, Any]:
+        """Convert blob properties into a get_file_metadata result."""
+        return {
+            'success': True,
+            'size': properties.size,
+            'last_modified': properties.last_modified.isoformat() if properties.last_modified else None,
+            'metadata': dict(properties.metadata) if properties.metadata else {},
+            'checksum': properties.etag.strip('"') if properties.etag else None,
+            'content_type': properties.content_settings.content_type if properties.content_settings else None,
+            'creation_time': properties.creation_time.isoformat() if properties.creation_time else None,
+            'blob_type': properties.blob_type
+        }
+
     def _get_content_type(self, file_path: Path) -> str:
         """Determine content type based on file extension.
 
@@ -514,15 +1197,13 @@ class AzureBlobConnector(CloudConnector):
         Returns:
             MIME type string.
         """
-        import mimetypes
-
-        content_type, _ = mimetypes.guess_type(str(file_path))
+        content_type = _FAST_MIME.get(file_path.suffix.lower())
+        if content_type:
+            return content_type
 
-        # Default to binary if unknown
-        if not content_type:
-            content_type = 'application/octet-stream'
-
-        return content_type
+        # Every suffix counts for names like scan.tar.gz; unknown types
+        # default to binary
+        return _guess_content_type(''.join(file_path.suffixes).lower())
 
     def generate_sas_url(
         self,
@@ -557,9 +1238,6 @@ class AzureBlobConnector(CloudConnector):
             return {'success': False, 'error': str(e)}
 
         try:
-            from azure.storage.blob import generate_blob_sas, BlobSasPermissions
-            from datetime import timedelta
-
             # Can only generate SAS if we have account key
             if not self.account_key and not self.connection_string:
                 return {
@@ -567,15 +1245,7 @@ class AzureBlobConnector(CloudConnector):
                     'error': 'SAS generation requires account_key or connection_string'
                 }
 
-            # Parse account details from connection string if needed
-            account_name = self.account_name
-            account_key = self.account_key
-
-            if self.connection_string and not account_key:
-                # Extract from connection string
-                parts = dict(part.split('=', 1) for part in self.connection_string.split(';') if '=' in part)
-                account_name = parts.get('AccountName')
-                account_key = parts.get('AccountKey')
+            account_name, account_key = self._sas_credentials()
 
             if not account_name or not account_key:
                 return {
@@ -583,30 +1253,45 @@ class AzureBlobConnector(CloudConnector):
                     'error': 'Could not extract account credentials for SAS generation'
                 }
 
-            # Set expiry time
+            # Set expiry time, rounded up so that requests close together
+            # share a signature (never cut short of the requested lifetime)
             expiry = datetime.now(timezone.utc) + timedelta(hours=expiry_hours)
+            expiry += -(expiry - datetime.min.replace(tzinfo=timezone.utc)) % SAS_EXPIRY_GRANULARITY
+
+            cache_key = (remote_path, expiry, read_only)
+            with self._sas_urls_lock:
+                sas_url = self._sas_urls.get(cache_key)
+                if sas_url is not None:
+                    self._sas_urls.move_to_end(cache_key)
+
+            if sas_url is None:
+                # Set permissions
+                if read_only:
+                    permissions = BlobSasPermissions(read=True)
+                else:
+                    permissions = BlobSasPermissions(read=True, write=True)
+
+                # Generate SAS token
+                sas_token = generate_blob_sas(
+                    account_name=account_name,
+                    container_name=self.container_name,
+                    blob_name=remote_path,
+                    account_key=account_key,
+                    permission=permissions,
+                    expiry=expiry
+                )
 
-            # Set permissions
-            if read_only:
-                permissions = BlobSasPermissions(read=True)
-            else:
-                permissions = BlobSasPermissions(read=True, write=True)
-
-            # Generate SAS token
-            sas_token = generate_blob_sas(
-                account_name=account_name,
-                container_name=self.container_name,
-                blob_name=remote_path,
-                account_key=account_key,
-                permission=permissions,
-                expiry=expiry
-            )
+                # Construct full URL; the blob name is percent-encoded so
+                # characters such as '#', '?' and spaces survive
+                sas_url = (
+                    f"https://{account_name}.blob.core.windows.net/"
+                    f"{self.container_name}/{quote(remote_path, safe='/')}?{sas_token}"
+                )
 
-            # Construct full URL
-            sas_url = (
-                f"https://{account_name}.blob.core.windows.net/"
-                f"{self.container_name}/{remote_path}?{sas_token}"
-            )
+                with self._sas_urls_lock:
+                    self._sas_urls[cache_key] = sas_url
+                    if len(self._sas_urls) > SAS_URL_CACHE_SIZE:
+                        self._sas_urls.popitem(last=False)
 
             logger.info(f"Generated SAS URL for blob: {remote_path}, expires: {expiry}")
 
@@ -617,11 +1302,6 @@ class AzureBlobConnector(CloudConnector):
                 'permissions': 'read' if read_only else 'read/write'
             }
 
-        except ImportError:
-            return {
-                'success': False,
-                'error': 'SAS generation requires azure-storage-blob>=12.0.0'
-            }
         except AzureError as e:
             logger.error(f"Failed to generate SAS URL: {e}")
             return {
@@ -629,6 +1309,59 @@ class AzureBlobConnector(CloudConnector):
                 'error': str(e)
             }
 
+    def _sas_credentials(self):
+        """Return (account_name, account_key) usable for signing SAS tokens.
+
+        Either value is None if the configured authentication has no
+        account key.
+        """
+        return self._sas_account_name, self._sas_account_key
+
+    def _copy_source_url(self, source_blob) -> Optional[str]:
+        """Return a short-lived read SAS URL for a copy source.
+
+        Synchronous copies read the source like an anonymous client, so a
+        private blob needs a SAS. Returns None when no account key is
+        available to sign one.
+        """
+        account_name, account_key = self._sas_credentials()
+        if not account_name or not account_key:
+            return None
+
+        sas_token = generate_blob_sas(
+            account_name=account_name,
+            container_name=self.container_name,
+            blob_name=source_blob.blob_name,
+            account_key=account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.now(timezone.utc) + timedelta(minutes=COPY_SOURCE_SAS_MINUTES)
+        )
+        return f"{source_blob.url}?{sas_token}"
+
+    def _wait_for_copy(self, dest_blob, copy_props: Dict[str, Any]):
+        """Poll a pending server-side copy until it finishes.
+
+        Args:
+            dest_blob: Client for the copy destination.
+            copy_props: Result of start_copy_from_url.
+
+        Returns:
+            Tuple of (copy_id, copy_status); the status is still 'pending'
+            if COPY_POLL_TIMEOUT passed first.
+        """
+        copy_id = copy_props.get('copy_id')
+        status = copy_props.get('copy_status')
+        delay = COPY_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + COPY_POLL_TIMEOUT
+
+        while status == 'pending' and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, COPY_POLL_MAX_DELAY)
+            copy = dest_blob.get_blob_properties().copy
+            copy_id, status = copy.id, copy.status
+
+        return copy_id, status
+
     def copy_blob(
         self,
         source_path: str,
@@ -636,12 +1369,18 @@ class AzureBlobConnector(CloudConnector):
     ) -> Dict[str, Any]:
         """Copy a blob within the same container.
 
+        Uses a synchronous server-side copy (one request, no polling) when
+        the source can be authorized with a SAS, and falls back to an
+        asynchronous copy polled to completion otherwise, e.g. for
+        sources over the 256 MiB synchronous copy limit.
+
         Args:
             source_path: Source blob name/path.
             destination_path: Destination blob name/path.
 
         Returns:
-            Dictionary containing copy result.
+            Dictionary containing copy result, including copy_id and
+            copy_status.
         """
         if not self._connected:
             return {'success': False, 'error': 'Not connected to Azure Blob Storage'}
@@ -654,11 +1393,671 @@ class AzureBlobConnector(CloudConnector):
             return {'success': False, 'error': str(e)}
 
         try:
-            source_blob = self.container_client.get_blob_client(source_path)
-            dest_blob = self.container_client.get_blob_client(destination_path)
+            source_blob = self._get_blob_client(source_path)
+            dest_blob = self._get_blob_client(destination_path)
+
+            copy_props = None
+            source_url = self._copy_source_url(source_blob)
+            if source_url:
+                try:
+                    copy_props = dest_blob.start_copy_from_url(source_url, requires_sync=True)
+                except ResourceNotFoundError:
+                    raise
+                except HttpResponseError as e:
+                    logger.debug(f"Synchronous copy not possible, falling back: {e}")
+
+            if copy_props is None:
+                copy_props = dest_blob.start_copy_from_url(source_blob.url)
+
+            copy_id, copy_status = self._wait_for_copy(dest_blob, copy_props)
+
+            if copy_status != 'success':
+                logger.error(
+                    f"Azure Blob copy from {source_path} to {destination_path} "
+                    f"ended with status {copy_status}"
+                )
+                return {
+                    'success': False,
+                    'error': f'Copy {copy_status}',
+                    'copy_id': copy_id,
+                    'copy_status': copy_status
+                }
+
+            logger.info(
+                f"Successfully copied blob from {source_path} to {destination_path}"
+            )
+
+            return {
+                'success': True,
+                'source_path': source_path,
+                'destination_path': destination_path,
+                'copy_id': copy_id,
+                'copy_status': copy_status
+            }
+
+        except ResourceNotFoundError:
+            return {
+                'success': False,
+                'error': f'Source blob not found: {source_path}'
+            }
+        except AzureError as e:
+            logger.error(f"Azure Blob copy failed: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+
+class AsyncAzureBlobConnector(AzureBlobConnector):
+    """Asyncio variant of AzureBlobConnector.
+
+    Network methods are coroutines backed by azure.storage.blob.aio, so many
+    blob operations can be awaited together (e.g. with asyncio.gather) and
+    finish in roughly the time of the slowest one. One service client is
+    kept for the life of the connection; call disconnect() or aclose() to
+    release it.
+
+    Requires the aiohttp package.
+
+    Example:
+        >>> connector = AsyncAzureBlobConnector(
+        ...     connection_string="DefaultEndpointsProtocol=https;...",
+        ...     container_name="medical-data"
+        ... )
+        >>> await connector.connect()
+        >>> results = await asyncio.gather(*(
+        ...     connector.download_file(name, f"study/{name}") for name in names
+        ... ))
+        >>> await connector.aclose()
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the async connector.
+
+        Takes the same arguments as AzureBlobConnector.
+
+        Raises:
+            ImportError: If the azure-storage-blob aio client is unavailable.
+        """
+        if not AZURE_AIO_AVAILABLE:
+            raise ImportError(
+                "AsyncAzureBlobConnector requires azure-storage-blob with aiohttp. "
+                "Install with: pip install azure-storage-blob aiohttp"
+            )
+
+        super().__init__(*args, **kwargs)
+
+        # asyncio primitives bind to the running loop, so this one is
+        # created in connect()
+        self._async_transfer_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _acheck_rate_limit(self, operation: str) -> None:
+        """Check the rate limit without blocking the event loop."""
+        if self._rate_limiter:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._check_rate_limit, operation)
+
+    async def connect(self) -> bool:
+        """Establish connection to Azure Blob Storage.
+
+        Returns:
+            bool: True if connection successful, False otherwise.
+        """
+        await self.aclose()
+        self._async_transfer_semaphore = asyncio.Semaphore(self.max_parallel_transfers)
+
+        try:
+            self.blob_service_client = self._create_service_client(
+                AsyncBlobServiceClient, **self._client_options()
+            )
+            self.container_client = self.blob_service_client.get_container_client(
+                self.container_name
+            )
+
+            # Test connection by checking if container exists
+            if not await self.container_client.exists():
+                logger.warning(
+                    f"Container '{self.container_name}' does not exist. "
+                    "Creating container..."
+                )
+                await self.container_client.create_container()
 
-            # Start copy operation
-            dest_blob.start_copy_from_url(source_blob.url)
+            self._connected = True
+            logger.info(
+                f"Successfully connected to Azure Blob Storage container: "
+                f"{self.container_name}"
+            )
+            return True
+
+        except ClientAuthenticationError as e:
+            logger.error(f"Authentication failed for Azure Blob Storage: {e}")
+            self._connected = False
+            return False
+        except AzureError as e:
+            logger.error(f"Failed to connect to Azure Blob Storage: {e}")
+            self._connected = False
+            return False
+
+    async def aclose(self) -> None:
+        """Close the service client and its connection pool."""
+        if self.blob_service_client is not None:
+            await self.blob_service_client.close()
+        self._clear_blob_clients()
+        self._clear_sas_urls()
+        self.blob_service_client = None
+        self.container_client = None
+        self._connected = False
+
+    async def disconnect(self) -> bool:
+        """Disconnect from Azure Blob Storage.
+
+        Returns:
+            bool: True if disconnection successful.
+        """
+        await self.aclose()
+        logger.info("Disconnected from Azure Blob Storage")
+        return True
+
+    @_rate_limited("upload_file")
+    async def upload_file(
+        self,
+        file_path: Union[str, Path],
+        remote_path: str,
+        metadata: Optional[Dict[str, str]] = None,
+        staging_source: Optional[Union[str, Path]] = None
+    ) -> Dict[str, Any]:
+        """Upload a file to Azure Blob Storage.
+
+        Args:
+            file_path: Path to the local file.
+            remote_path: Blob name/path in the container.
+            metadata: Optional metadata to attach to the blob.
+            staging_source: File to copy to file_path before uploading,
+                copied in-kernel rather than through Python buffers. Only
+                useful when file_path is a spool on another filesystem;
+                otherwise upload the source path directly.
+
+        Returns:
+            Dictionary containing upload result information.
+        """
+        if not self._connected:
+            return {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+
+        # Validate remote path to prevent directory traversal
+        try:
+            self._validate_remote_path(remote_path)
+        except ValueError as e:
+            return {'success': False, 'error': str(e)}
+
+        file_path = Path(file_path)
+        # File reads and hashing run on the default executor so they do not
+        # stall other coroutines
+        loop = asyncio.get_running_loop()
+
+        if staging_source is not None:
+            from ..core.file_io import copy_file
+            try:
+                await loop.run_in_executor(None, copy_file, staging_source, file_path)
+            except OSError as e:
+                return {'success': False, 'error': f'Staging failed: {e}'}
+
+        if not file_path.exists():
+            return {'success': False, 'error': f'File not found: {file_path}'}
+
+        try:
+            # Prepare metadata
+            blob_metadata = metadata or {}
+            blob_metadata['upload_time'] = datetime.now(timezone.utc).isoformat()
+            blob_metadata['original_name'] = file_path.name
+
+            blob_client = self._get_blob_client(remote_path)
+            content_settings = ContentSettings(
+                content_type=self._get_content_type(file_path)
+            )
+
+            file_size = file_path.stat().st_size
+            async with self._async_transfer_semaphore:
+                if file_size <= self.single_put_threshold:
+                    data, checksum = await loop.run_in_executor(
+                        None, self._read_with_checksum, file_path
+                    )
+                    blob_metadata['checksum'] = checksum
+                    await blob_client.upload_blob(
+                        data,
+                        length=file_size,
+                        overwrite=True,
+                        metadata=blob_metadata,
+                        content_settings=content_settings,
+                        validate_content=True
+                    )
+                else:
+                    with open(file_path, 'rb') as f:
+                        data = _HashingReader(f)
+                        await blob_client.upload_blob(
+                            data,
+                            length=file_size,
+                            overwrite=True,
+                            metadata=blob_metadata,
+                            content_settings=content_settings,
+                            max_concurrency=self.max_concurrency
+                        )
+
+                    checksum = data.hasher.hexdigest()
+                    blob_metadata['checksum'] = checksum
+                    await blob_client.set_blob_metadata(blob_metadata)
+
+            logger.info(
+                f"Successfully uploaded {file_path} to "
+                f"azure://{self.container_name}/{remote_path}"
+            )
+
+            return {
+                'success': True,
+                'remote_path': remote_path,
+                'checksum': checksum,
+                'size': file_size,
+                'timestamp': blob_metadata['upload_time']
+            }
+
+        except AzureError as e:
+            logger.error(f"Azure Blob upload failed: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @_rate_limited("download_file")
+    async def download_file(
+        self,
+        remote_path: str,
+        local_path: Union[str, Path],
+        verify_checksum: bool = True
+    ) -> Dict[str, Any]:
+        """Download a file from Azure Blob Storage.
+
+        Args:
+            remote_path: Blob name/path in the container.
+            local_path: Local path where file will be saved.
+            verify_checksum: Whether to verify file integrity.
+
+        Returns:
+            Dictionary containing download result information.
+        """
+        if not self._connected:
+            return {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+
+        # Validate remote path to prevent directory traversal
+        try:
+            self._validate_remote_path(remote_path)
+        except ValueError as e:
+            return {'success': False, 'error': str(e)}
+
+        local_path = Path(local_path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            blob_client = self._get_blob_client(remote_path)
+
+            properties = await blob_client.get_blob_properties()
+            stored_checksum = properties.metadata.get('checksum') if properties.metadata else None
+            validate, verify = self._download_verification(
+                properties, stored_checksum, verify_checksum
+            )
+
+            hasher = hashlib.sha256()
+            async with self._async_transfer_semaphore:
+                with open(local_path, 'wb') as download_file:
+                    download_stream = await blob_client.download_blob(
+                        max_concurrency=self.max_concurrency,
+                        validate_content=validate
+                    )
+                    if verify:
+                        async for chunk in download_stream.chunks():
+                            hasher.update(chunk)
+                            download_file.write(chunk)
+                    else:
+                        await download_stream.readinto(download_file)
+
+            checksum_verified = validate
+            if verify:
+                if hasher.hexdigest() != stored_checksum:
+                    local_path.unlink()  # Delete corrupted file
+                    return {
+                        'success': False,
+                        'error': 'Checksum verification failed'
+                    }
+                checksum_verified = True
+
+            logger.info(
+                f"Successfully downloaded azure://{self.container_name}/{remote_path} "
+                f"to {local_path}"
+            )
+
+            return {
+                'success': True,
+                'local_path': str(local_path),
+                'size': local_path.stat().st_size,
+                'checksum_verified': checksum_verified
+            }
+
+        except ResourceNotFoundError:
+            logger.error(f"Blob not found: {remote_path}")
+            return {
+                'success': False,
+                'error': f'Blob not found: {remote_path}'
+            }
+        except AzureError as e:
+            logger.error(f"Azure Blob download failed: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @_rate_limited("delete_file")
+    async def delete_file(self, remote_path: str) -> Dict[str, Any]:
+        """Delete a file from Azure Blob Storage.
+
+        Args:
+            remote_path: Blob name/path to delete.
+
+        Returns:
+            Dictionary containing deletion result.
+        """
+        if not self._connected:
+            return {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+
+        try:
+            self._validate_remote_path(remote_path)
+        except ValueError as e:
+            return {'success': False, 'error': str(e)}
+
+        try:
+            await self._get_blob_client(remote_path).delete_blob()
+
+            logger.info(
+                f"Successfully deleted azure://{self.container_name}/{remote_path}"
+            )
+
+            return {
+                'success': True,
+                'remote_path': remote_path
+            }
+
+        except ResourceNotFoundError:
+            logger.warning(f"Blob not found for deletion: {remote_path}")
+            return {
+                'success': True,  # Consider deletion of non-existent blob as success
+                'remote_path': remote_path,
+                'warning': 'Blob did not exist'
+            }
+        except AzureError as e:
+            logger.error(f"Azure Blob deletion failed: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def delete_files(self, remote_paths: List[str]) -> List[Dict[str, Any]]:
+        """Delete many blobs using Blob Batch requests.
+
+        Args:
+            remote_paths: Blob names/paths to delete.
+
+        Returns:
+            One result per input path, in order, shaped like delete_file()
+            results.
+        """
+        if not self._connected:
+            return [
+                {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+                for _ in remote_paths
+            ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(remote_paths)
+        to_delete = []
+        validate = self._validate_remote_path
+        for i, remote_path in enumerate(remote_paths):
+            try:
+                validate(remote_path)
+                to_delete.append((i, remote_path))
+            except ValueError as e:
+                results[i] = {'success': False, 'error': str(e)}
+
+        try:
+            await self._acheck_rate_limit("delete_files")
+        except RuntimeError as e:
+            return [
+                result or {'success': False, 'error': str(e)}
+                for result in results
+            ]
+
+        batch_result = self._batch_delete_result
+        for start in range(0, len(to_delete), DELETE_BATCH_SIZE):
+            batch = to_delete[start:start + DELETE_BATCH_SIZE]
+            try:
+                responses = await self.container_client.delete_blobs(
+                    *(path for _, path in batch),
+                    raise_on_any_failure=False
+                )
+                statuses = [response.status_code async for response in responses]
+                for (i, path), status_code in zip(batch, statuses):
+                    results[i] = batch_result(path, status_code)
+            except AzureError as e:
+                logger.error(f"Azure Blob batch deletion failed: {e}")
+                for i, _ in batch:
+                    if results[i] is None:
+                        results[i] = {'success': False, 'error': str(e)}
+
+        logger.info(
+            f"Batch deleted {sum(1 for r in results if r['success'])} of "
+            f"{len(remote_paths)} blobs from azure://{self.container_name}"
+        )
+        return results
+
+    async def list_files(self, prefix: str = '') -> List[Dict[str, Any]]:
+        """List blobs in Azure container.
+
+        Args:
+            prefix: Filter results by blob name prefix.
+
+        Returns:
+            List of file information dictionaries.
+        """
+        try:
+            return [entry async for entry in self.iter_files(prefix)]
+
+        except AzureError as e:
+            logger.error(f"Azure Blob list operation failed: {e}")
+            return []
+
+    async def iter_files(
+        self,
+        prefix: str = '',
+        page_size: int = LIST_PAGE_SIZE,
+        include_metadata: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream blobs in Azure container one page at a time.
+
+        Args:
+            prefix: Filter results by blob name prefix.
+            page_size: Blobs requested per List Blobs call.
+            include_metadata: Also fetch custom metadata, returned under
+                'metadata' in each entry.
+
+        Yields:
+            File information dictionaries, as returned by list_files().
+
+        Raises:
+            AzureError: If a page request fails part-way through.
+        """
+        if not self._connected:
+            logger.error("Not connected to Azure Blob Storage")
+            return
+
+        try:
+            await self._acheck_rate_limit("list_files")
+        except RuntimeError as e:
+            logger.error(f"Rate limit exceeded: {e}")
+            return
+
+        pages = self.container_client.list_blobs(
+            name_starts_with=prefix or None,
+            include=['metadata'] if include_metadata else None,
+            results_per_page=page_size
+        ).by_page()
+        blob_entry = self._blob_entry
+        async for page in pages:
+            async for blob in page:
+                yield blob_entry(blob, include_metadata)
+
+    async def iter_file_names(
+        self,
+        prefix: str = '',
+        page_size: int = LIST_PAGE_SIZE
+    ) -> AsyncIterator[str]:
+        """Stream blob names only.
+
+        Args:
+            prefix: Filter results by blob name prefix.
+            page_size: Blobs requested per List Blobs call.
+
+        Yields:
+            Blob names.
+
+        Raises:
+            AzureError: If a page request fails part-way through.
+        """
+        if not self._connected:
+            logger.error("Not connected to Azure Blob Storage")
+            return
+
+        try:
+            await self._acheck_rate_limit("list_files")
+        except RuntimeError as e:
+            logger.error(f"Rate limit exceeded: {e}")
+            return
+
+        async for name in self.container_client.list_blob_names(
+            name_starts_with=prefix or None,
+            results_per_page=page_size
+        ):
+            yield name
+
+    @_rate_limited("get_file_metadata")
+    async def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
+        """Get metadata for a blob in Azure Storage.
+
+        Args:
+            remote_path: Blob name/path.
+
+        Returns:
+            Dictionary containing blob metadata.
+        """
+        if not self._connected:
+            return {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+
+        try:
+            self._validate_remote_path(remote_path)
+        except ValueError as e:
+            return {'success': False, 'error': str(e)}
+
+        try:
+            blob_client = self._get_blob_client(remote_path)
+            return self._properties_result(await blob_client.get_blob_properties())
+
+        except ResourceNotFoundError:
+            logger.error(f"Blob not found: {remote_path}")
+            return {
+                'success': False,
+                'error': f'Blob not found: {remote_path}'
+            }
+        except AzureError as e:
+            logger.error(f"Failed to get Azure Blob metadata: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    async def _wait_for_copy(self, dest_blob, copy_props: Dict[str, Any]):
+        """Poll a pending server-side copy without blocking the event loop.
+
+        Args:
+            dest_blob: Async client for the copy destination.
+            copy_props: Result of start_copy_from_url.
+
+        Returns:
+            Tuple of (copy_id, copy_status); the status is still 'pending'
+            if COPY_POLL_TIMEOUT passed first.
+        """
+        copy_id = copy_props.get('copy_id')
+        status = copy_props.get('copy_status')
+        delay = COPY_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + COPY_POLL_TIMEOUT
+
+        while status == 'pending' and time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, COPY_POLL_MAX_DELAY)
+            copy = (await dest_blob.get_blob_properties()).copy
+            copy_id, status = copy.id, copy.status
+
+        return copy_id, status
+
+    async def copy_blob(
+        self,
+        source_path: str,
+        destination_path: str
+    ) -> Dict[str, Any]:
+        """Copy a blob within the same container.
+
+        Args:
+            source_path: Source blob name/path.
+            destination_path: Destination blob name/path.
+
+        Returns:
+            Dictionary containing copy result, including copy_id and
+            copy_status.
+        """
+        if not self._connected:
+            return {'success': False, 'error': 'Not connected to Azure Blob Storage'}
+
+        try:
+            self._validate_remote_path(source_path)
+            self._validate_remote_path(destination_path)
+        except ValueError as e:
+            return {'success': False, 'error': str(e)}
+
+        try:
+            source_blob = self._get_blob_client(source_path)
+            dest_blob = self._get_blob_client(destination_path)
+
+            copy_props = None
+            source_url = self._copy_source_url(source_blob)
+            if source_url:
+                try:
+                    copy_props = await dest_blob.start_copy_from_url(
+                        source_url, requires_sync=True
+                    )
+                except ResourceNotFoundError:
+                    raise
+                except HttpResponseError as e:
+                    logger.debug(f"Synchronous copy not possible, falling back: {e}")
+
+            if copy_props is None:
+                copy_props = await dest_blob.start_copy_from_url(source_blob.url)
+
+            copy_id, copy_status = await self._wait_for_copy(dest_blob, copy_props)
+
+            if copy_status != 'success':
+                logger.error(
+                    f"Azure Blob copy from {source_path} to {destination_path} "
+                    f"ended with status {copy_status}"
+                )
+                return {
+                    'success': False,
+                    'error': f'Copy {copy_status}',
+                    'copy_id': copy_id,
+                    'copy_status': copy_status
+                }
 
             logger.info(
                 f"Successfully copied blob from {source_path} to {destination_path}"
@@ -667,7 +2066,9 @@ class AzureBlobConnector(CloudConnector):
             return {
                 'success': True,
                 'source_path': source_path,
-                'destination_path': destination_path
+                'destination_path': destination_path,
+                'copy_id': copy_id,
+                'copy_status': copy_status
             }
 
         except ResourceNotFoundError:
@@ -8,6 +8,8 @@ supports multiple simultaneous connections.
 from typing import Dict, List, Optional, Union, Any
 from pathlib import Path
 import logging
+import os
+import tempfile
 
 from .base_connector import CloudConnector
 from .s3_connector import S3Connector
@@ -321,9 +323,6 @@ class ConnectorManager:
         Returns:
             Dictionary with sync results for each target.
         """
-        import tempfile
-        import os
-
         source = self.get_connector(source_connector)
         if not source:
             return {'success': False, 'error': f'Source connector {source_connector} not found'}
@@ -7,6 +7,7 @@ the CloudConnector interface.
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 from datetime import datetime
+import hashlib
 import logging
 
 try:
@@ -17,7 +18,7 @@ try:
 except ImportError:
     DROPBOX_AVAILABLE = False
 
-from .base_connector import CloudConnector
+from .base_connector import CloudConnector, STREAM_CHUNK_SIZE
 
 
 logger = logging.getLogger(__name__)
@@ -134,16 +135,12 @@ class DropboxConnector(CloudConnector):
             return {'success': False, 'error': f'File not found: {file_path}'}
         
         try:
-            # Calculate checksum
-            checksum = self._calculate_checksum(file_path)
+            # Read file once and checksum it from memory
+            file_data, checksum = self._read_with_checksum(file_path)
             
             # Prepare full remote path
             full_remote_path = self._get_full_path(remote_path)
             
-            # Read file
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
             # Upload file
             upload_result = self.dbx.files_upload(
                 file_data,
@@ -217,9 +214,11 @@ class DropboxConnector(CloudConnector):
             # Download file
             metadata, response = self.dbx.files_download(full_remote_path)
             
-            # Write to local file
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
+            # Write to local file, hashing as it streams rather than
+            # reading it back afterwards
+            hasher = hashlib.sha256() if self.checksum_algorithm == 'sha256' else None
+            self._stream_to_file(response.iter_content(STREAM_CHUNK_SIZE), local_path,
+                                 hasher=hasher)
             
             # Verify using content hash if available
             checksum_verified = False
@@ -227,7 +226,8 @@ class DropboxConnector(CloudConnector):
                 # Note: Dropbox uses a proprietary hash algorithm
                 # For full verification, you'd need to implement Dropbox's hashing
                 # Here we'll use our standard SHA-256
-                local_checksum = self._calculate_checksum(local_path)
+                local_checksum = (hasher.hexdigest() if hasher is not None
+                                  else self._calculate_checksum(local_path))
                 checksum_verified = True
                 logger.info(f"File checksum: {local_checksum}")
             
@@ -4,11 +4,18 @@ This module provides a connector for Microsoft OneDrive that implements
 the CloudConnector interface using Microsoft Graph API.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
-from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
+from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import io
 import logging
 import json
+import random
+import time
 
 try:
     import requests
@@ -18,17 +25,250 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# orjson is optional - parses large listing and $batch bodies faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 try:
     from msal import ConfidentialClientApplication, PublicClientApplication
     MSAL_AVAILABLE = True
 except ImportError:
     MSAL_AVAILABLE = False
 
-from .base_connector import CloudConnector
+from .base_connector import CloudConnector, STREAM_CHUNK_SIZE
 
 
 logger = logging.getLogger(__name__)
 
+# Graph throttling replies carry Retry-After; it is honored up to this many
+# seconds, and computed backoffs get up to RETRY_JITTER seconds of jitter so
+# throttled clients do not retry in lockstep
+RETRY_AFTER_MAX = 60
+RETRY_JITTER = 0.5
+
+# Status retry policy shared by the requests adapter and the HTTP/2 session
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+if REQUESTS_AVAILABLE:
+    class _GraphRetry(Retry):
+        """Retry policy with a capped Retry-After and jittered backoff.
+
+        POST (createUploadSession, copy, createLink, $batch) is not
+        idempotent, so it is only resent on a 429 with Retry-After, which
+        Graph returns before running the request.
+        """
+
+        def is_retry(self, method: str, status_code: int,
+                     has_retry_after: bool = False) -> bool:
+            if method.upper() == "POST":
+                return bool(self.total) and status_code == 429 and has_retry_after
+            return super().is_retry(method, status_code, has_retry_after)
+
+        def get_retry_after(self, response):
+            retry_after = super().get_retry_after(response)
+            if retry_after is None:
+                return None
+            return min(retry_after, RETRY_AFTER_MAX)
+
+        def get_backoff_time(self) -> float:
+            backoff = super().get_backoff_time()
+            return backoff + random.uniform(0, RETRY_JITTER) if backoff else backoff
+
+
+@lru_cache(maxsize=None)
+def _shared_adapter(pool_maxsize: int) -> 'HTTPAdapter':
+    """Return the process-wide HTTPS adapter for a pool size.
+
+    Sessions are per connector, but adapters are thread-safe and shared,
+    so new connectors reuse already-open keep-alive connections. With
+    pool_block, callers beyond pool_maxsize wait for a free connection
+    instead of opening one that is discarded afterwards.
+    """
+    retries = _GraphRetry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+        respect_retry_after_header=True
+    )
+    return HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+        pool_block=True
+    )
+
+
+def _json(response) -> Any:
+    """Parse a Graph response body, with orjson when it is installed.
+
+    Falls back to response.json() for bodies that are not plain bytes.
+    """
+    content = response.content
+    if ORJSON_AVAILABLE and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return response.json()
+
+
+class _HashingReader:
+    """Upload body that hashes a file as the transport reads it.
+
+    Exposes __len__ so requests sends a Content-Length rather than
+    buffering, and tell/seek so urllib3 can rewind it for a retry.
+    """
+
+    def __init__(self, file, size: int):
+        self._file = file
+        self._size = size
+        self._hasher = hashlib.sha256()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._hasher.update(data)
+        return data
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if (offset, whence) != (0, io.SEEK_SET):
+            raise io.UnsupportedOperation("can only rewind to the start")
+        self._hasher = hashlib.sha256()
+        return self._file.seek(0)
+
+    def hexdigest(self) -> str:
+        """Return the SHA-256 of the file, hashing anything left unread."""
+        for chunk in iter(lambda: self.read(STREAM_CHUNK_SIZE), b""):
+            pass
+        return self._hasher.hexdigest()
+
+
+class _ResponseStream(io.RawIOBase):
+    """Readable file over the body chunks of a streamed httpx response."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+        # httpx always decodes; kept for parity with urllib3's response.raw
+        self.decode_content = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class _Http2Session:
+    """The subset of requests.Session used by OneDriveConnector, over HTTP/2.
+
+    Every request is multiplexed over one keep-alive TLS connection per
+    host. The transport retries connection failures; throttled and 5xx
+    responses are retried here with the same policy as _GraphRetry.
+    """
+
+    def __init__(self, pool_size: int):
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size
+                )
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+        self.headers = self._client.headers
+
+    def get(self, url: str, stream: bool = False, **kwargs):
+        if not stream:
+            return self._send("GET", lambda attempt: self._client.get(url, **kwargs))
+
+        def send(attempt: int):
+            request = self._client.build_request("GET", url, **kwargs)
+            response = self._client.send(request, stream=True)
+            response.raw = _ResponseStream(response.iter_bytes(STREAM_CHUNK_SIZE))
+            return response
+
+        return self._send("GET", send)
+
+    def put(self, url: str, data=None, **kwargs):
+        # httpx treats non-bytes content as an iterator of chunks
+        reader = None
+        if isinstance(data, (memoryview, bytearray)):
+            data = bytes(data)
+        elif hasattr(data, "read"):
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.setdefault("Content-Length", str(len(data)))
+            kwargs["headers"] = headers
+            reader = data
+
+        def send(attempt: int):
+            content = data
+            if reader is not None:
+                if attempt:
+                    reader.seek(0)
+                content = iter(lambda: reader.read(STREAM_CHUNK_SIZE), b"")
+            return self._client.put(url, content=content, **kwargs)
+
+        return self._send("PUT", send)
+
+    def post(self, url: str, **kwargs):
+        return self._send("POST", lambda attempt: self._client.post(url, **kwargs))
+
+    def delete(self, url: str, **kwargs):
+        return self._send("DELETE", lambda attempt: self._client.delete(url, **kwargs))
+
+    def _send(self, method: str, send: Callable[[int], Any]):
+        """Call send(attempt) until it returns a response not worth retrying."""
+        for attempt in range(RETRY_TOTAL + 1):
+            response = send(attempt)
+            retry_after = self._retry_after(response)
+            if attempt == RETRY_TOTAL or response.status_code not in RETRY_STATUS_CODES:
+                return response
+            if method == "POST" and (response.status_code != 429 or retry_after is None):
+                return response
+            if retry_after is None:
+                retry_after = (RETRY_BACKOFF_FACTOR * 2 ** attempt
+                               + random.uniform(0, RETRY_JITTER))
+            response.close()
+            time.sleep(retry_after)
+
+    @staticmethod
+    def _retry_after(response) -> Optional[float]:
+        """Return the response's Retry-After in seconds, capped, if it has one."""
+        try:
+            return min(float(response.headers["Retry-After"]), RETRY_AFTER_MAX)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def close(self) -> None:
+        self._client.close()
+
 
 class OneDriveConnector(CloudConnector):
     """Microsoft OneDrive cloud connector.
@@ -56,6 +296,16 @@ class OneDriveConnector(CloudConnector):
     AUTHORITY_BASE = "https://login.microsoftonline.com"
     SCOPES = ["https://graph.microsoft.com/.default"]
     USER_SCOPES = ["Files.ReadWrite.All", "User.Read"]
+    # Maximum requests Graph accepts in one JSON $batch call
+    BATCH_SIZE = 20
+    # Raw bytes per batched upload request; base64 grows this by a third,
+    # which keeps the body under Graph's 4 MB $batch limit
+    BATCH_UPLOAD_BYTES = 3 * 1024 * 1024
+    # Access tokens are renewed once they are this close to expiring
+    TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+    # Largest children page Graph serves, and only the fields list_files reads
+    LIST_PAGE_SIZE = 999
+    LIST_SELECT = "id,name,size,lastModifiedDateTime,folder,file,webUrl"
 
     def __init__(
         self,
@@ -65,7 +315,8 @@ class OneDriveConnector(CloudConnector):
         access_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
         drive_id: Optional[str] = None,
-        rate_limiter=None
+        rate_limiter=None,
+        use_http2: bool = False
     ):
         """Initialize OneDrive connector.
 
@@ -77,6 +328,7 @@ class OneDriveConnector(CloudConnector):
             refresh_token: Refresh token for token renewal (optional).
             drive_id: Specific drive ID to use (optional, uses default drive if not set).
             rate_limiter: Optional RateLimiter instance for API throttling.
+            use_http2: Talk to Graph over HTTP/2 through httpx (optional).
 
         Raises:
             ImportError: If required packages are not installed.
@@ -86,6 +338,11 @@ class OneDriveConnector(CloudConnector):
                 "requests package is required for OneDrive. "
                 "Install with: pip install requests"
             )
+        if use_http2 and not HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx package is required for HTTP/2. "
+                "Install with: pip install 'httpx[http2]'"
+            )
 
         super().__init__(rate_limiter=rate_limiter)
 
@@ -95,6 +352,10 @@ class OneDriveConnector(CloudConnector):
         self.access_token = access_token
         self.refresh_token = refresh_token
         self.drive_id = drive_id
+        self.use_http2 = use_http2
+        self._item_path_prefix: Tuple[Optional[str], str] = (
+            None, f"{self.GRAPH_API_BASE}/me/drive/root:/"
+        )
 
         self._session: Optional[requests.Session] = None
         self._msal_app = None
@@ -107,14 +368,12 @@ class OneDriveConnector(CloudConnector):
             bool: True if connection successful, False otherwise.
         """
         try:
-            # Create session with retry logic
-            self._session = requests.Session()
-            retries = Retry(
-                total=3,
-                backoff_factor=0.5,
-                status_forcelist=[429, 500, 502, 503, 504]
-            )
-            self._session.mount("https://", HTTPAdapter(max_retries=retries))
+            if self.use_http2:
+                self._session = _Http2Session(self._http_pool_size())
+            else:
+                # Create session over the shared, retrying connection pool
+                self._session = requests.Session()
+                self._session.mount("https://", _shared_adapter(self._http_pool_size()))
 
             # Get access token if not provided
             if not self.access_token:
@@ -130,7 +389,7 @@ class OneDriveConnector(CloudConnector):
             # Test connection
             response = self._session.get(f"{self.GRAPH_API_BASE}/me/drive")
             if response.status_code == 200:
-                drive_info = response.json()
+                drive_info = _json(response)
                 self.drive_id = self.drive_id or drive_info.get("id")
                 logger.info(f"Connected to OneDrive: {drive_info.get('name', 'Unknown')}")
                 self._connected = True
@@ -192,8 +451,7 @@ class OneDriveConnector(CloudConnector):
                     result = self._msal_app.acquire_token_by_device_flow(flow)
 
             if "access_token" in result:
-                self.access_token = result["access_token"]
-                self.refresh_token = result.get("refresh_token")
+                self._store_token(result)
                 logger.info("Successfully authenticated with Microsoft Graph")
                 return True
             else:
@@ -204,15 +462,55 @@ class OneDriveConnector(CloudConnector):
             logger.error(f"Authentication error: {e}")
             return False
 
+    def _store_token(self, result: Dict[str, Any]) -> None:
+        """Keep the tokens and expiry time from an MSAL token response."""
+        self.access_token = result["access_token"]
+        self.refresh_token = result.get("refresh_token", self.refresh_token)
+        self._token_expiry = datetime.now(timezone.utc) + timedelta(
+            seconds=int(result.get("expires_in", 3600))
+        )
+
+    def _ensure_token(self) -> None:
+        """Renew the access token if it is within TOKEN_REFRESH_MARGIN of expiry.
+
+        Renewal goes through MSAL's token cache and refresh token, so it
+        never prompts. Tokens passed in by the caller have no known expiry
+        and are used as-is. A failed renewal keeps the current token.
+        """
+        if self._token_expiry is None or self._msal_app is None:
+            return
+        if self._token_expiry - datetime.now(timezone.utc) > self.TOKEN_REFRESH_MARGIN:
+            return
+
+        try:
+            if self.client_secret:
+                result = self._msal_app.acquire_token_for_client(scopes=self.SCOPES)
+            else:
+                accounts = self._msal_app.get_accounts()
+                result = self._msal_app.acquire_token_silent(
+                    self.USER_SCOPES,
+                    account=accounts[0]
+                ) if accounts else None
+        except Exception as e:
+            logger.warning(f"Access token refresh error: {e}")
+            return
+
+        if not result or "access_token" not in result:
+            logger.warning("Access token refresh failed; keeping current token")
+            return
+
+        self._store_token(result)
+        if self._session:
+            self._session.headers.update({"Authorization": f"Bearer {self.access_token}"})
+        logger.debug("Refreshed Microsoft Graph access token")
+
     def disconnect(self) -> bool:
         """Disconnect from OneDrive.
 
         Returns:
             bool: True if disconnection successful.
         """
-        if self._session:
-            self._session.close()
-            self._session = None
+        self._close_session()
         self._connected = False
         logger.info("Disconnected from OneDrive")
         return True
@@ -225,7 +523,14 @@ class OneDriveConnector(CloudConnector):
             self.access_token = None
         if hasattr(self, 'refresh_token') and self.refresh_token:
             self.refresh_token = None
-        if hasattr(self, '_session') and self._session:
+        if hasattr(self, '_session'):
+            self._close_session()
+
+    def _close_session(self) -> None:
+        """Close the session without closing the shared HTTPS adapter."""
+        if self._session:
+            if not isinstance(self._session, _Http2Session):
+                self._session.adapters.pop("https://", None)
             self._session.close()
             self._session = None
 
@@ -238,19 +543,24 @@ class OneDriveConnector(CloudConnector):
         Returns:
             Graph API path string.
         """
-        # Remove leading slash
-        remote_path = remote_path.lstrip("/")
+        # The drive prefix is rebuilt only when drive_id changes
+        drive_id, prefix = self._item_path_prefix
+        if drive_id != self.drive_id:
+            if self.drive_id:
+                prefix = f"{self.GRAPH_API_BASE}/drives/{self.drive_id}/root:/"
+            else:
+                prefix = f"{self.GRAPH_API_BASE}/me/drive/root:/"
+            self._item_path_prefix = (self.drive_id, prefix)
 
-        if self.drive_id:
-            return f"{self.GRAPH_API_BASE}/drives/{self.drive_id}/root:/{remote_path}"
-        else:
-            return f"{self.GRAPH_API_BASE}/me/drive/root:/{remote_path}"
+        # Remove leading slash
+        return prefix + remote_path.lstrip("/")
 
     def upload_file(
         self,
         file_path: Union[str, Path],
         remote_path: str,
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        skip_unchanged: bool = False
     ) -> Dict[str, Any]:
         """Upload a file to OneDrive.
 
@@ -260,6 +570,9 @@ class OneDriveConnector(CloudConnector):
             file_path: Path to the local file.
             remote_path: OneDrive path for the file.
             metadata: Optional metadata (stored as file description).
+            skip_unchanged: Compare against the remote file's SHA-256 first
+                and skip the transfer if it matches. Otherwise the upload
+                only replaces the remote version that was compared against.
 
         Returns:
             Dictionary containing upload result information.
@@ -278,18 +591,43 @@ class OneDriveConnector(CloudConnector):
 
         try:
             self._check_rate_limit("upload_file")
+            self._ensure_token()
         except RuntimeError as e:
             return {'success': False, 'error': str(e)}
 
         try:
             file_size = file_path.stat().st_size
-            checksum = self._calculate_checksum(file_path)
+
+            # SHA-256 is computed from the bytes as they are read for the
+            # upload; other algorithms need their own pass
+            checksum = None
+            if self.checksum_algorithm != 'sha256':
+                checksum = self._calculate_checksum(file_path)
+
+            if_match = None
+            if skip_unchanged:
+                remote = self.get_file_metadata(remote_path)
+                if remote['success']:
+                    sha256 = self._calculate_checksum(file_path, algorithm='sha256')
+                    if (remote.get('checksum') or '').lower() == sha256:
+                        logger.info(f"Skipping unchanged upload of {file_path}: {remote_path}")
+                        return {
+                            'success': True,
+                            'skipped': True,
+                            'remote_path': remote_path,
+                            'checksum': checksum or sha256,
+                            'size': file_size,
+                            'item_id': remote.get('id'),
+                            'web_url': remote.get('web_url'),
+                            'timestamp': datetime.now(timezone.utc).isoformat()
+                        }
+                    if_match = remote.get('etag')
 
             # Use simple upload for small files (< 4MB)
             if file_size < 4 * 1024 * 1024:
-                return self._simple_upload(file_path, remote_path, checksum, metadata)
+                return self._simple_upload(file_path, remote_path, checksum, metadata, if_match)
             else:
-                return self._resumable_upload(file_path, remote_path, checksum, metadata)
+                return self._resumable_upload(file_path, remote_path, checksum, metadata, if_match)
 
         except Exception as e:
             logger.error(f"OneDrive upload failed: {e}")
@@ -299,28 +637,35 @@ class OneDriveConnector(CloudConnector):
         self,
         file_path: Path,
         remote_path: str,
-        checksum: str,
-        metadata: Optional[Dict[str, str]]
+        checksum: Optional[str],
+        metadata: Optional[Dict[str, str]],
+        if_match: Optional[str] = None
     ) -> Dict[str, Any]:
         """Simple upload for files < 4MB."""
         upload_url = f"{self._get_item_path(remote_path)}:/content"
+        file_size = file_path.stat().st_size
+
+        headers = {"Content-Type": "application/octet-stream"}
+        if if_match:
+            headers["If-Match"] = if_match
 
+        # Stream the file handle as the body, hashing it on the way out,
+        # rather than holding the whole payload in memory
         with open(file_path, 'rb') as f:
-            response = self._session.put(
-                upload_url,
-                data=f,
-                headers={"Content-Type": "application/octet-stream"}
-            )
+            body = _HashingReader(f, file_size)
+            response = self._session.put(upload_url, data=body, headers=headers)
+            if checksum is None:
+                checksum = body.hexdigest()
 
         if response.status_code in (200, 201):
-            result = response.json()
+            result = _json(response)
             logger.info(f"Successfully uploaded {file_path} to OneDrive: {remote_path}")
 
             return {
                 'success': True,
                 'remote_path': remote_path,
                 'checksum': checksum,
-                'size': file_path.stat().st_size,
+                'size': file_size,
                 'item_id': result.get('id'),
                 'web_url': result.get('webUrl'),
                 'timestamp': datetime.now(timezone.utc).isoformat()
@@ -335,8 +680,9 @@ class OneDriveConnector(CloudConnector):
         self,
         file_path: Path,
         remote_path: str,
-        checksum: str,
-        metadata: Optional[Dict[str, str]]
+        checksum: Optional[str],
+        metadata: Optional[Dict[str, str]],
+        if_match: Optional[str] = None
     ) -> Dict[str, Any]:
         """Resumable upload for large files (> 4MB)."""
         # Create upload session
@@ -348,7 +694,8 @@ class OneDriveConnector(CloudConnector):
                 "item": {
                     "@microsoft.graph.conflictBehavior": "replace"
                 }
-            }
+            },
+            headers={"If-Match": if_match} if if_match else None
         )
 
         if session_response.status_code != 200:
@@ -357,15 +704,49 @@ class OneDriveConnector(CloudConnector):
                 'error': f"Failed to create upload session: {session_response.text}"
             }
 
-        upload_url = session_response.json().get('uploadUrl')
+        upload_url = _json(session_response).get('uploadUrl')
         file_size = file_path.stat().st_size
         chunk_size = 10 * 1024 * 1024  # 10MB chunks
 
-        with open(file_path, 'rb') as f:
+        sha256_hash = hashlib.sha256()
+
+        # Graph requires fragments in order, so rather than sending ranges
+        # in parallel, the next chunk is read on one helper thread and the
+        # current one hashed on another while it is on the wire (hashlib
+        # releases the GIL for large updates). Chunks alternate between two
+        # reused buffers and are sent as memoryviews, so no per-chunk bytes
+        # objects are allocated.
+        buffer_size = min(chunk_size, file_size)
+        buffers = [memoryview(bytearray(buffer_size)) for _ in range(2)]
+
+        with open(file_path, 'rb') as f, \
+                ThreadPoolExecutor(max_workers=1) as reader, \
+                ThreadPoolExecutor(max_workers=1) as hasher:
+            def read_chunk(index: int, offset: int) -> memoryview:
+                buffer = buffers[index % 2][:min(buffer_size, file_size - offset)]
+                return buffer[:f.readinto(buffer)]
+
+            pending = reader.submit(read_chunk, 0, 0)
+            hashed = None
             offset = 0
+            index = 0
             while offset < file_size:
-                chunk = f.read(chunk_size)
-                chunk_end = min(offset + len(chunk), file_size)
+                chunk = pending.result()
+                if not chunk:
+                    return {
+                        'success': False,
+                        'error': f"File changed during upload: {file_path}"
+                    }
+                # The previous chunk's buffer is refilled next, so its hash
+                # must be done first
+                if hashed is not None:
+                    hashed.result()
+                hashed = hasher.submit(sha256_hash.update, chunk)
+
+                chunk_end = offset + len(chunk)
+                index += 1
+                if chunk_end < file_size:
+                    pending = reader.submit(read_chunk, index, chunk_end)
 
                 headers = {
                     "Content-Length": str(len(chunk)),
@@ -382,6 +763,11 @@ class OneDriveConnector(CloudConnector):
 
                 offset = chunk_end
 
+            hashed.result()
+
+        if checksum is None:
+            checksum = sha256_hash.hexdigest()
+
         logger.info(f"Successfully uploaded large file {file_path} to OneDrive")
 
         return {
@@ -392,6 +778,124 @@ class OneDriveConnector(CloudConnector):
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
 
+    def upload_files(
+        self,
+        items: Iterable[Tuple[Union[str, Path], str]]
+    ) -> List[Dict[str, Any]]:
+        """Upload many small files using Graph JSON batching.
+
+        Files are sent base64-encoded, up to 20 per $batch request and
+        BATCH_UPLOAD_BYTES of content per request, so bulk uploads of
+        small files cost one round trip per batch instead of one per file.
+        Files too large for a batch go through upload_file().
+
+        Args:
+            items: (file_path, remote_path) pairs.
+
+        Returns:
+            One result per input pair, in order, shaped like upload_file()
+            results.
+        """
+        items = [(Path(file_path), remote_path) for file_path, remote_path in items]
+        if not self._connected:
+            return [
+                {'success': False, 'error': 'Not connected to OneDrive'}
+                for _ in items
+            ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        small = []
+        validate = self._validate_remote_path
+        for i, (file_path, remote_path) in enumerate(items):
+            try:
+                validate(remote_path)
+                size = file_path.stat().st_size
+            except ValueError as e:
+                results[i] = {'success': False, 'error': str(e)}
+                continue
+            except FileNotFoundError:
+                results[i] = {'success': False, 'error': f'File not found: {file_path}'}
+                continue
+            if size > self.BATCH_UPLOAD_BYTES:
+                results[i] = self.upload_file(file_path, remote_path)
+            else:
+                small.append((i, file_path, remote_path, size))
+
+        # One rate-limit token covers the whole batch
+        if small:
+            try:
+                self._check_rate_limit("upload_files")
+                self._ensure_token()
+            except RuntimeError as e:
+                return [
+                    result or {'success': False, 'error': str(e)}
+                    for result in results
+                ]
+
+        batch: List[Tuple[int, Path, str]] = []
+        batch_bytes = 0
+        for i, file_path, remote_path, size in small:
+            if batch and (len(batch) == self.BATCH_SIZE
+                          or batch_bytes + size > self.BATCH_UPLOAD_BYTES):
+                self._upload_batch(batch, results)
+                batch, batch_bytes = [], 0
+            batch.append((i, file_path, remote_path))
+            batch_bytes += size
+        if batch:
+            self._upload_batch(batch, results)
+
+        return results
+
+    def _upload_batch(
+        self,
+        batch: List[Tuple[int, Path, str]],
+        results: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """Send one $batch of small-file PUTs, filling results in place."""
+        checksums = {}
+        batch_requests = []
+        try:
+            for i, file_path, remote_path in batch:
+                data, checksum = self._read_with_checksum(file_path)
+                if self.checksum_algorithm != 'sha256':
+                    checksum = self._calculate_checksum(file_path)
+                checksums[i] = (checksum, len(data))
+                batch_requests.append({
+                    'method': 'PUT',
+                    'url': f"{self._get_item_path(remote_path)}:/content",
+                    'headers': {"Content-Type": "application/octet-stream"},
+                    'body': base64.b64encode(data).decode('ascii')
+                })
+
+            responses = self._graph_batch(batch_requests)
+
+        except Exception as e:
+            logger.error(f"OneDrive batch upload failed: {e}")
+            for i, _, _ in batch:
+                results[i] = {'success': False, 'error': str(e)}
+            return
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for (i, file_path, remote_path), response in zip(batch, responses):
+            status = response.get('status', 0)
+            if status in (200, 201):
+                item = response.get('body') or {}
+                checksum, size = checksums[i]
+                results[i] = {
+                    'success': True,
+                    'remote_path': remote_path,
+                    'checksum': checksum,
+                    'size': size,
+                    'item_id': item.get('id'),
+                    'web_url': item.get('webUrl'),
+                    'timestamp': timestamp
+                }
+            else:
+                results[i] = {
+                    'success': False,
+                    'error': f"Upload failed: {status} - {remote_path}"
+                }
+
     def download_file(
         self,
         remote_path: str,
@@ -421,6 +925,7 @@ class OneDriveConnector(CloudConnector):
 
         try:
             self._check_rate_limit("download_file")
+            self._ensure_token()
         except RuntimeError as e:
             return {'success': False, 'error': str(e)}
 
@@ -428,31 +933,39 @@ class OneDriveConnector(CloudConnector):
             # Get file content
             download_url = f"{self._get_item_path(remote_path)}:/content"
             response = self._session.get(download_url, stream=True)
+            try:
+                if response.status_code == 200:
+                    # Copy straight from the (decompressed) socket stream, hashing
+                    # while writing rather than reading the file back
+                    hasher = hashlib.sha256() if self.checksum_algorithm == 'sha256' else None
+                    response.raw.decode_content = True
+                    self._stream_to_file(response.raw, local_path, hasher=hasher)
 
-            if response.status_code == 200:
-                with open(local_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-                logger.info(f"Successfully downloaded {remote_path} to {local_path}")
+                    logger.info(f"Successfully downloaded {remote_path} to {local_path}")
 
-                # Calculate checksum
-                local_checksum = self._calculate_checksum(local_path)
+                    local_checksum = (hasher.hexdigest() if hasher is not None
+                                      else self._calculate_checksum(local_path))
 
-                return {
-                    'success': True,
-                    'local_path': str(local_path),
-                    'size': local_path.stat().st_size,
-                    'checksum': local_checksum,
-                    'checksum_verified': verify_checksum
-                }
-            elif response.status_code == 404:
-                return {'success': False, 'error': f'File not found: {remote_path}'}
-            else:
-                return {
-                    'success': False,
-                    'error': f"Download failed: {response.status_code} - {response.text}"
-                }
+                    return {
+                        'success': True,
+                        'local_path': str(local_path),
+                        'size': local_path.stat().st_size,
+                        'checksum': local_checksum,
+                        'checksum_verified': verify_checksum
+                    }
+                elif response.status_code == 404:
+                    return {'success': False, 'error': f'File not found: {remote_path}'}
+                else:
+                    if isinstance(self._session, _Http2Session):
+                        # httpx refuses .text on a streamed body until it is read
+                        response.read()
+                    return {
+                        'success': False,
+                        'error': f"Download failed: {response.status_code} - {response.text}"
+                    }
+            finally:
+                # Release the pooled connection whatever the status
+                response.close()
 
         except Exception as e:
             logger.error(f"OneDrive download failed: {e}")
@@ -477,6 +990,7 @@ class OneDriveConnector(CloudConnector):
 
         try:
             self._check_rate_limit("delete_file")
+            self._ensure_token()
         except RuntimeError as e:
             return {'success': False, 'error': str(e)}
 
@@ -503,45 +1017,205 @@ class OneDriveConnector(CloudConnector):
             logger.error(f"OneDrive delete failed: {e}")
             return {'success': False, 'error': str(e)}
 
+    def delete_files(self, remote_paths: List[str]) -> List[Dict[str, Any]]:
+        """Delete many files using Graph JSON batching.
+
+        Sends up to 20 deletes per HTTP request instead of one request per
+        file. Invalid paths are reported without being sent.
+
+        Args:
+            remote_paths: OneDrive paths of the files to delete.
+
+        Returns:
+            One result per input path, in order, shaped like delete_file()
+            results.
+        """
+        results = self._batch_items(
+            remote_paths, 'DELETE', "delete_files", self._delete_result
+        )
+        logger.info(
+            f"Batch deleted {sum(1 for r in results if r['success'])} of "
+            f"{len(remote_paths)} files from OneDrive"
+        )
+        return results
+
+    @staticmethod
+    def _delete_result(remote_path: str, status_code: int,
+                       body: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert one batched DELETE sub-response into a delete result."""
+        if status_code == 204:
+            return {'success': True, 'remote_path': remote_path}
+        if status_code == 404:
+            return {
+                'success': True,
+                'remote_path': remote_path,
+                'warning': 'File did not exist'
+            }
+        return {
+            'success': False,
+            'error': f"Delete failed: {status_code} - {remote_path}"
+        }
+
+    def _batch_items(
+        self,
+        remote_paths: List[str],
+        method: str,
+        operation: str,
+        to_result: Callable[[str, int, Optional[Dict[str, Any]]], Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Apply one Graph request per drive item, BATCH_SIZE per $batch call.
+
+        Args:
+            remote_paths: OneDrive paths of the items.
+            method: HTTP method for each item request.
+            operation: Name of the operation for rate limiting.
+            to_result: Builds a result from (remote_path, status, body).
+
+        Returns:
+            One result per input path, in order.
+        """
+        if not self._connected:
+            return [
+                {'success': False, 'error': 'Not connected to OneDrive'}
+                for _ in remote_paths
+            ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(remote_paths)
+        to_send = []
+        validate = self._validate_remote_path
+        for i, remote_path in enumerate(remote_paths):
+            try:
+                validate(remote_path)
+                to_send.append((i, remote_path))
+            except ValueError as e:
+                results[i] = {'success': False, 'error': str(e)}
+
+        # One rate-limit token covers the whole batch
+        try:
+            self._check_rate_limit(operation)
+            self._ensure_token()
+        except RuntimeError as e:
+            return [
+                result or {'success': False, 'error': str(e)}
+                for result in results
+            ]
+
+        for start in range(0, len(to_send), self.BATCH_SIZE):
+            batch = to_send[start:start + self.BATCH_SIZE]
+            try:
+                responses = self._graph_batch([
+                    {'method': method, 'url': self._get_item_path(path)}
+                    for _, path in batch
+                ])
+                for (i, path), response in zip(batch, responses):
+                    results[i] = to_result(path, response.get('status', 0), response.get('body'))
+            except Exception as e:
+                logger.error(f"OneDrive batch {operation} failed: {e}")
+                for i, _ in batch:
+                    if results[i] is None:
+                        results[i] = {'success': False, 'error': str(e)}
+
+        return results
+
+    def _graph_batch(self, batch_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send up to BATCH_SIZE Graph requests in one JSON $batch call.
+
+        Args:
+            batch_requests: Dictionaries with 'method' and absolute 'url',
+                plus optional 'headers' and 'body'.
+
+        Returns:
+            Sub-responses ('status', 'body', ...) in the order of
+            batch_requests.
+
+        Raises:
+            RuntimeError: If the $batch request itself fails.
+        """
+        base_length = len(self.GRAPH_API_BASE)
+        response = self._session.post(
+            f"{self.GRAPH_API_BASE}/$batch",
+            json={
+                "requests": [
+                    dict(request, id=str(i), url=request['url'][base_length:])
+                    for i, request in enumerate(batch_requests)
+                ]
+            }
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"Batch request failed: {response.status_code}")
+
+        # Graph may return sub-responses in any order
+        by_id = {item.get('id'): item for item in _json(response).get('responses', [])}
+        return [by_id.get(str(i), {}) for i in range(len(batch_requests))]
+
     def list_files(self, prefix: str = '') -> List[Dict[str, Any]]:
         """List files in OneDrive folder.
 
+        Builds the whole listing in memory; use iter_files() to stream
+        large folders.
+
         Args:
             prefix: Folder path to list (empty for root).
 
         Returns:
             List of file information dictionaries.
         """
+        try:
+            return list(self.iter_files(prefix))
+
+        except Exception as e:
+            logger.error(f"OneDrive list failed: {e}")
+            return []
+
+    def iter_files(self, prefix: str = '') -> Iterator[Dict[str, Any]]:
+        """Stream files in a OneDrive folder one page at a time.
+
+        Pages hold up to LIST_PAGE_SIZE items, and the next page is
+        fetched in the background while the current one is consumed.
+        Graph's skip tokens are opaque, so pages cannot be requested
+        further ahead than that.
+
+        Args:
+            prefix: Folder path to list (empty for root).
+
+        Yields:
+            File information dictionaries, as returned by list_files().
+        """
         if not self._connected:
             logger.error("Not connected to OneDrive")
-            return []
+            return
 
         try:
             self._check_rate_limit("list_files")
+            self._ensure_token()
         except RuntimeError as e:
             logger.error(f"Rate limit exceeded: {e}")
-            return []
+            return
 
-        try:
-            if prefix:
-                list_url = f"{self._get_item_path(prefix)}:/children"
-            else:
-                if self.drive_id:
-                    list_url = f"{self.GRAPH_API_BASE}/drives/{self.drive_id}/root/children"
-                else:
-                    list_url = f"{self.GRAPH_API_BASE}/me/drive/root/children"
+        if prefix:
+            list_url = f"{self._get_item_path(prefix)}:/children"
+        elif self.drive_id:
+            list_url = f"{self.GRAPH_API_BASE}/drives/{self.drive_id}/root/children"
+        else:
+            list_url = f"{self.GRAPH_API_BASE}/me/drive/root/children"
 
-            files = []
-            next_link = list_url
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            page = prefetch.submit(self._session.get, list_url, params={
+                "$top": self.LIST_PAGE_SIZE,
+                "$select": self.LIST_SELECT
+            })
 
-            while next_link:
-                response = self._session.get(next_link)
+            while page is not None:
+                response = page.result()
 
                 if response.status_code != 200:
                     logger.error(f"List failed: {response.status_code}")
-                    break
+                    return
 
-                data = response.json()
+                data = _json(response)
+                next_link = data.get('@odata.nextLink')
+                # nextLink already carries $top and $select
+                page = prefetch.submit(self._session.get, next_link) if next_link else None
 
                 for item in data.get('value', []):
                     file_info = {
@@ -556,15 +1230,7 @@ class OneDriveConnector(CloudConnector):
                     if 'file' in item and 'hashes' in item['file']:
                         file_info['checksum'] = item['file']['hashes'].get('sha256Hash')
 
-                    files.append(file_info)
-
-                next_link = data.get('@odata.nextLink')
-
-            return files
-
-        except Exception as e:
-            logger.error(f"OneDrive list failed: {e}")
-            return []
+                    yield file_info
 
     def get_file_metadata(self, remote_path: str) -> Dict[str, Any]:
         """Get metadata for a file in OneDrive.
@@ -584,35 +1250,60 @@ class OneDriveConnector(CloudConnector):
             return {'success': False, 'error': str(e)}
 
         try:
+            self._ensure_token()
             metadata_url = self._get_item_path(remote_path)
             response = self._session.get(metadata_url)
 
-            if response.status_code == 200:
-                item = response.json()
-                return {
-                    'success': True,
-                    'id': item.get('id'),
-                    'name': item.get('name'),
-                    'size': item.get('size'),
-                    'last_modified': item.get('lastModifiedDateTime'),
-                    'created': item.get('createdDateTime'),
-                    'web_url': item.get('webUrl'),
-                    'is_folder': 'folder' in item,
-                    'mime_type': item.get('file', {}).get('mimeType'),
-                    'checksum': item.get('file', {}).get('hashes', {}).get('sha256Hash')
-                }
-            elif response.status_code == 404:
-                return {'success': False, 'error': f'File not found: {remote_path}'}
-            else:
-                return {
-                    'success': False,
-                    'error': f"Metadata fetch failed: {response.status_code}"
-                }
+            body = _json(response) if response.status_code == 200 else None
+            return self._metadata_result(remote_path, response.status_code, body)
 
         except Exception as e:
             logger.error(f"Failed to get OneDrive metadata: {e}")
             return {'success': False, 'error': str(e)}
 
+    def get_files_metadata(self, remote_paths: List[str]) -> List[Dict[str, Any]]:
+        """Get metadata for many files using Graph JSON batching.
+
+        Sends up to 20 lookups per HTTP request instead of one request per
+        file. Invalid paths are reported without being sent.
+
+        Args:
+            remote_paths: OneDrive paths of the files.
+
+        Returns:
+            One result per input path, in order, shaped like
+            get_file_metadata() results.
+        """
+        return self._batch_items(
+            remote_paths, 'GET', "get_files_metadata", self._metadata_result
+        )
+
+    @staticmethod
+    def _metadata_result(remote_path: str, status_code: int,
+                         item: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert a drive item response into a metadata result."""
+        if status_code == 200:
+            file_facet = item.get('file', {})
+            return {
+                'success': True,
+                'id': item.get('id'),
+                'name': item.get('name'),
+                'size': item.get('size'),
+                'last_modified': item.get('lastModifiedDateTime'),
+                'created': item.get('createdDateTime'),
+                'web_url': item.get('webUrl'),
+                'is_folder': 'folder' in item,
+                'mime_type': file_facet.get('mimeType'),
+                'checksum': file_facet.get('hashes', {}).get('sha256Hash'),
+                'etag': item.get('eTag')
+            }
+        if status_code == 404:
+            return {'success': False, 'error': f'File not found: {remote_path}'}
+        return {
+            'success': False,
+            'error': f"Metadata fetch failed: {status_code}"
+        }
+
     def create_sharing_link(
         self,
         remote_path: str,
@@ -633,6 +1324,7 @@ class OneDriveConnector(CloudConnector):
             return {'success': False, 'error': 'Not connected to OneDrive'}
 
         try:
+            self._ensure_token()
             share_url = f"{self._get_item_path(remote_path)}:/createLink"
 
             body = {
@@ -641,14 +1333,13 @@ class OneDriveConnector(CloudConnector):
             }
 
             if expiry_hours:
-                from datetime import timedelta
                 expiry = datetime.now(timezone.utc) + timedelta(hours=expiry_hours)
                 body["expirationDateTime"] = expiry.isoformat()
 
             response = self._session.post(share_url, json=body)
 
             if response.status_code in (200, 201):
-                result = response.json()
+                result = _json(response)
                 link = result.get('link', {})
                 return {
                     'success': True,
@@ -684,6 +1375,7 @@ class OneDriveConnector(CloudConnector):
             return {'success': False, 'error': 'Not connected to OneDrive'}
 
         try:
+            self._ensure_token()
             # Get destination folder and name
             dest_path = Path(destination_path)
             dest_folder = str(dest_path.parent).lstrip("/")
@@ -703,7 +1395,7 @@ class OneDriveConnector(CloudConnector):
                 return {'success': False, 'error': 'Destination folder not found'}
 
             parent_ref = {
-                "id": folder_response.json().get('id')
+                "id": _json(folder_response).get('id')
             }
 
             # Perform copy
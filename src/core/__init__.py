@@ -7,6 +7,7 @@ This package provides core infrastructure components:
 - secure_transfer: Core secure transfer pipeline
 - audit_logger: Compliance-ready audit logging
 - key_exchange: Secure key exchange mechanisms
+- file_io: Page-cache hints for large sequential file I/O
 """
 
 from .encryption import MediaEncryptor
@@ -7,6 +7,8 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 import secrets
 
+from .file_io import fadvise_sequential, fadvise_dontneed
+
 
 class MediaEncryptor:
     """Handle encryption and decryption of media files."""
@@ -72,12 +74,15 @@ class MediaEncryptor:
             return key
     
     def encrypt_file(self, input_path: Union[str, Path], 
-                     output_path: Union[str, Path]) -> dict:
+                     output_path: Union[str, Path],
+                     fadvise: bool = False) -> dict:
         """Encrypt a media file.
         
         Args:
             input_path: Path to the file to encrypt.
             output_path: Path where encrypted file will be saved.
+            fadvise: Hint sequential access and drop the input from the
+                page cache once it has been read.
             
         Returns:
             Dictionary containing encryption metadata.
@@ -87,7 +92,11 @@ class MediaEncryptor:
         
         # Read the file
         with open(input_path, 'rb') as f:
+            if fadvise:
+                fadvise_sequential(f)
             plaintext = f.read()
+            if fadvise:
+                fadvise_dontneed(f)
         
         # Generate a random nonce (96 bits for GCM)
         nonce = secrets.token_bytes(12)
@@ -98,9 +107,13 @@ class MediaEncryptor:
         # Create output directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write encrypted file: nonce + ciphertext
+        # Write encrypted file: nonce + ciphertext (written separately to
+        # avoid copying the whole ciphertext into a concatenated buffer)
         with open(output_path, 'wb') as f:
-            f.write(nonce + ciphertext)
+            if fadvise:
+                fadvise_sequential(f)
+            f.write(nonce)
+            f.write(ciphertext)
         
         return {
             'original_size': len(plaintext),
@@ -110,12 +123,15 @@ class MediaEncryptor:
         }
     
     def decrypt_file(self, input_path: Union[str, Path], 
-                     output_path: Union[str, Path]) -> dict:
+                     output_path: Union[str, Path],
+                     fadvise: bool = False) -> dict:
         """Decrypt a media file.
         
         Args:
             input_path: Path to the encrypted file.
             output_path: Path where decrypted file will be saved.
+            fadvise: Hint sequential access and drop the input from the
+                page cache once it has been read.
             
         Returns:
             Dictionary containing decryption metadata.
@@ -123,13 +139,15 @@ class MediaEncryptor:
         input_path = Path(input_path)
         output_path = Path(output_path)
         
-        # Read encrypted file
+        # Read nonce and ciphertext directly rather than slicing one
+        # buffer, which would copy the entire ciphertext
         with open(input_path, 'rb') as f:
-            data = f.read()
-        
-        # Extract nonce and ciphertext
-        nonce = data[:12]
-        ciphertext = data[12:]
+            if fadvise:
+                fadvise_sequential(f)
+            nonce = f.read(12)
+            ciphertext = f.read()
+            if fadvise:
+                fadvise_dontneed(f)
         
         # Decrypt the data
         plaintext = self.cipher.decrypt(nonce, ciphertext, None)
@@ -139,10 +157,12 @@ class MediaEncryptor:
         
         # Write decrypted file
         with open(output_path, 'wb') as f:
+            if fadvise:
+                fadvise_sequential(f)
             f.write(plaintext)
         
         return {
-            'encrypted_size': len(data),
+            'encrypted_size': len(nonce) + len(ciphertext),
             'decrypted_size': len(plaintext),
             'algorithm': 'AES-256-GCM'
         }
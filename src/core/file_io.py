@@ -0,0 +1,83 @@
+"""
+File I/O helpers for large sequential reads and writes.
+
+Encrypted blobs are written once and rarely re-read, so letting them
+linger in the page cache only evicts data that is actually hot. These
+helpers wrap posix_fadvise and degrade to no-ops on platforms that do
+not provide it (macOS, Windows).
+
+copy_file copies inside the kernel with copy_file_range where available,
+so staging a file never passes its bytes through userspace buffers.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import IO, Union
+
+FADVISE_AVAILABLE = hasattr(os, 'posix_fadvise')
+
+
+def fadvise_sequential(fileobj: IO) -> None:
+    """Hint that the whole file will be accessed sequentially.
+
+    Args:
+        fileobj: Open file object backed by a real file descriptor.
+    """
+    _fadvise(fileobj, 'POSIX_FADV_SEQUENTIAL')
+
+
+def fadvise_dontneed(fileobj: IO) -> None:
+    """Hint that the file's cached pages will not be needed again.
+
+    Args:
+        fileobj: Open file object backed by a real file descriptor.
+    """
+    _fadvise(fileobj, 'POSIX_FADV_DONTNEED')
+
+
+def _fadvise(fileobj: IO, advice_name: str) -> None:
+    """Apply a posix_fadvise hint to the whole file, ignoring failures."""
+    if not FADVISE_AVAILABLE:
+        return
+
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, getattr(os, advice_name))
+    except (OSError, AttributeError, ValueError):
+        # Hints are best-effort; unsupported filesystems must not break I/O
+        pass
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> int:
+    """Copy a file's contents without buffering them in userspace.
+
+    Uses copy_file_range (Linux), which can also share extents on
+    reflink-capable filesystems, and falls back to shutil.copyfile, which
+    itself uses sendfile or fcopyfile where the platform has them.
+
+    Args:
+        src: File to copy from.
+        dst: File to create or overwrite.
+
+    Returns:
+        Number of bytes copied.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if hasattr(os, 'copy_file_range'):
+            copied = 0
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                # Unsupported filesystem or kernel (e.g. EXDEV, ENOSYS);
+                # restart with the portable copy below
+                copied = -1
+            if copied == size:
+                return size
+
+    shutil.copyfile(src, dst)
+    return os.path.getsize(dst)
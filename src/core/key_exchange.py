@@ -120,6 +120,9 @@ class KeyExchangeManager:
         self._hsm = hsm_provider
         self._keys: Dict[str, KeyPair] = {}
         self._session_keys: Dict[str, DerivedKey] = {}
+        # Decrypted, parsed private keys by key ID, so repeated exchanges
+        # with one key skip the AES-GCM unwrap and PEM parse
+        self._private_keys: Dict[str, Any] = {}
 
         # Create key store with restricted permissions
         self._key_store_path.mkdir(parents=True, exist_ok=True)
@@ -238,6 +241,7 @@ class KeyExchangeManager:
         )
 
         self._keys[key_id] = key_pair
+        self._private_keys.pop(key_id, None)
         logger.info(f"Imported public key: {key_id}")
         return key_id
 
@@ -266,15 +270,8 @@ class KeyExchangeManager:
         if local_key_id not in self._keys:
             raise KeyError(f"Key not found: {local_key_id}")
 
-        key_pair = self._keys[local_key_id]
-
         # Load our private key
-        private_key_pem = self._decrypt_key_material(key_pair.private_key_encrypted)
-        private_key = serialization.load_pem_private_key(
-            private_key_pem,
-            password=None,
-            backend=default_backend()
-        )
+        private_key = self._load_private_key(local_key_id)
 
         # Load their public key
         from cryptography.hazmat.primitives.serialization import load_pem_public_key
@@ -435,6 +432,7 @@ class KeyExchangeManager:
                 key_file.unlink()
 
             del self._keys[key_id]
+            self._private_keys.pop(key_id, None)
             logger.info(f"Destroyed key: {key_id}")
 
     # Private methods
@@ -444,6 +442,21 @@ class KeyExchangeManager:
         import uuid
         return str(uuid.uuid4())[:12]
 
+    def _load_private_key(self, key_id: str) -> Any:
+        """Decrypt and parse a stored private key, once per key ID."""
+        private_key = self._private_keys.get(key_id)
+        if private_key is None:
+            private_key_pem = self._decrypt_key_material(
+                self._keys[key_id].private_key_encrypted
+            )
+            private_key = serialization.load_pem_private_key(
+                private_key_pem,
+                password=None,
+                backend=default_backend()
+            )
+            self._private_keys[key_id] = private_key
+        return private_key
+
     def _derive_master_key(self, password: str) -> bytes:
         """Derive master key from password using PBKDF2."""
         salt = self._get_or_create_salt()
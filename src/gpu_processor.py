@@ -5,6 +5,6 @@ New code should import from src.processing instead.
 """
 
 # Re-export from new location for backward compatibility
-from src.processing.gpu import GPUMediaProcessor, ImageDimensions, FilterConfig
+from src.processing.gpu import GPUMediaProcessor, ImageDimensions, FilterConfig, probe_device
 
-__all__ = ['GPUMediaProcessor', 'ImageDimensions', 'FilterConfig']
+__all__ = ['GPUMediaProcessor', 'ImageDimensions', 'FilterConfig', 'probe_device']
@@ -5,6 +5,20 @@ New code should import from src.licensing instead.
 """
 
 # Re-export from new location for backward compatibility
-from src.licensing.manager import LicenseManager, License, LicenseType, FeatureFlags
+from src.licensing.manager import (
+    LicenseManager,
+    License,
+    LicenseType,
+    FeatureFlags,
+    get_license_manager,
+    require_feature,
+)
 
-__all__ = ['LicenseManager', 'License', 'LicenseType', 'FeatureFlags']
+__all__ = [
+    'LicenseManager',
+    'License',
+    'LicenseType',
+    'FeatureFlags',
+    'get_license_manager',
+    'require_feature',
+]
@@ -16,6 +16,14 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+# orjson is optional - parses and serializes the license file faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 class LicenseType(Enum):
     """License tier types."""
@@ -100,6 +108,8 @@ class LicenseManager:
         self.license_cache_dir = Path.home() / '.secure-media-processor'
         self.license_file = self.license_cache_dir / 'license.json'
         self.license_cache_dir.mkdir(parents=True, exist_ok=True)
+        # (path, mtime_ns, size) of the license file and the License parsed from it
+        self._license_cache = None
 
     def _generate_secret(self) -> str:
         """Generate a random secret key if none provided."""
@@ -328,8 +338,14 @@ class LicenseManager:
         # Set restrictive permissions (owner only)
         self.license_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.license_file, 'w') as f:
-            json.dump(license.to_dict(), f, indent=2)
+        if ORJSON_AVAILABLE:
+            self.license_file.write_bytes(
+                orjson.dumps(license.to_dict(), option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(self.license_file, 'w') as f:
+                json.dump(license.to_dict(), f, indent=2)
+        self._license_cache = None
 
         # Set file permissions to 0600 (owner read/write only)
         os.chmod(self.license_file, 0o600)
@@ -340,30 +356,38 @@ class LicenseManager:
         Returns:
             License object if valid license exists, None otherwise.
         """
-        if not self.license_file.exists():
-            return None
-
         try:
-            with open(self.license_file, 'r') as f:
-                data = json.load(f)
-
-            license = License.from_dict(data)
+            stat = self.license_file.stat()
+        except FileNotFoundError:
+            self._license_cache = None
+            return None
 
-            # Validate license is still valid
-            if not license.is_valid():
+        # Reuse the parsed license until the file on disk changes
+        cache_key = (str(self.license_file), stat.st_mtime_ns, stat.st_size)
+        if self._license_cache is not None and self._license_cache[0] == cache_key:
+            license = self._license_cache[1]
+        else:
+            try:
+                raw = self.license_file.read_bytes()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                license = License.from_dict(data)
+            except (json.JSONDecodeError, KeyError, ValueError, TypeError):
                 return None
+            self._license_cache = (cache_key, license)
 
-            return license
-
-        except (json.JSONDecodeError, KeyError, ValueError):
+        # Validate license is still valid
+        if not license.is_valid():
             return None
 
+        return license
+
     def deactivate_license(self) -> bool:
         """Deactivate license on this device.
 
         Returns:
             True if license was deactivated, False otherwise.
         """
+        self._license_cache = None
         if self.license_file.exists():
             self.license_file.unlink()
             return True
@@ -30,7 +30,7 @@ Example (Full Pipeline):
 from .pipeline import MedicalPipeline, MedicalStudyResult, ProcessingOperation, create_medical_pipeline
 
 # DICOM processing
-from .dicom import DICOMProcessor, DICOMMetadata, DICOMVolumeData
+from .dicom import DICOMProcessor, DICOMMetadata, DICOMVolumeData, DICOMLazyVolume
 
 # Preprocessing
 from .preprocessing import BreastMRIPreprocessor, PreprocessingResult
@@ -56,6 +56,7 @@ __all__ = [
     'DICOMProcessor',
     'DICOMMetadata',
     'DICOMVolumeData',
+    'DICOMLazyVolume',
     # Preprocessing
     'BreastMRIPreprocessor',
     'PreprocessingResult',
@@ -17,6 +17,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 import json
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -43,6 +45,65 @@ try:
 except ImportError:
     logger.info("pydicom not installed - DICOM support disabled. Install with: pip install pydicom")
 
+# nvImageCodec is optional - batched GPU decode of compressed pixel data
+NVIMGCODEC_AVAILABLE = False
+nvimgcodec = None
+
+try:
+    from nvidia import nvimgcodec as _nvimgcodec
+
+    nvimgcodec = _nvimgcodec
+    NVIMGCODEC_AVAILABLE = True
+    logger.debug("nvImageCodec available for GPU DICOM decoding")
+except ImportError:
+    pass
+
+# Fields removed or replaced by anonymize_dicom (HIPAA Safe Harbor), in
+# reporting order; built once rather than on every call
+HIPAA_ANONYMIZE_TAGS = (
+    'PatientName',
+    'PatientID',
+    'PatientBirthDate',
+    'PatientAddress',
+    'PatientTelephoneNumbers',
+    'InstitutionName',
+    'InstitutionAddress',
+    'ReferringPhysicianName',
+    'PhysiciansOfRecord',
+    'PerformingPhysicianName',
+    'OperatorsName',
+    'OtherPatientIDs',
+    'OtherPatientNames',
+    'PatientBirthName',
+    'PatientMotherBirthName',
+    'MedicalRecordLocator',
+    'EthnicGroup',
+    'Occupation',
+    'AdditionalPatientHistory',
+    'PatientComments',
+    'ResponsiblePerson',
+    'ResponsibleOrganization',
+)
+
+# Header reads are I/O bound, so series scans overlap many of them
+HEADER_SCAN_WORKERS = 16
+
+# Tags get_series_list needs; everything else in the header is skipped
+SERIES_LIST_TAGS = ['SeriesInstanceUID', 'Modality', 'SeriesDescription', 'PatientID', 'StudyDate']
+
+# Transfer syntaxes whose frames nvImageCodec can decode directly
+GPU_DECODE_TRANSFER_SYNTAXES = frozenset({
+    '1.2.840.10008.1.2.4.50',   # JPEG Baseline
+    '1.2.840.10008.1.2.4.51',   # JPEG Extended
+    '1.2.840.10008.1.2.4.57',   # JPEG Lossless
+    '1.2.840.10008.1.2.4.70',   # JPEG Lossless SV1
+    '1.2.840.10008.1.2.4.90',   # JPEG 2000 Lossless
+    '1.2.840.10008.1.2.4.91',   # JPEG 2000
+    '1.2.840.10008.1.2.4.201',  # HTJ2K Lossless
+    '1.2.840.10008.1.2.4.202',  # HTJ2K Lossless RPCL
+    '1.2.840.10008.1.2.4.203',  # HTJ2K
+})
+
 
 @dataclass
 class DICOMMetadata:
@@ -184,6 +245,117 @@ class DICOMVolume:
         )
 
 
+def _slice_sort_key(ds) -> float:
+    """Order slices by location, instance number or patient position."""
+    if hasattr(ds, 'SliceLocation'):
+        return float(ds.SliceLocation)
+    if hasattr(ds, 'InstanceNumber'):
+        return int(ds.InstanceNumber)
+    if hasattr(ds, 'ImagePositionPatient'):
+        return float(ds.ImagePositionPatient[2])
+    return 0
+
+
+def _rescaled_pixels(ds, pixels: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return a dataset's pixel data as float32 with rescale applied.
+
+    Args:
+        ds: DICOM dataset
+        pixels: Already decoded pixel data (decoded from ds if not given)
+    """
+    if pixels is None:
+        pixels = ds.pixel_array
+    arr = pixels.astype(np.float32)
+
+    # Apply rescale if present (common in CT/MRI)
+    if hasattr(ds, 'RescaleSlope') and hasattr(ds, 'RescaleIntercept'):
+        arr = arr * ds.RescaleSlope + ds.RescaleIntercept
+
+    return arr
+
+
+def _decode_series_gpu(slices: List[Any]) -> Optional[List[np.ndarray]]:
+    """Decode single-frame compressed slices in one nvImageCodec batch.
+
+    Args:
+        slices: DICOM datasets with encapsulated pixel data
+
+    Returns:
+        Decoded pixel arrays in slice order, or None if the series cannot
+        be decoded on the GPU and should use pydicom instead.
+    """
+    if not NVIMGCODEC_AVAILABLE or not slices:
+        return None
+
+    for ds in slices:
+        syntax = getattr(getattr(ds, 'file_meta', None), 'TransferSyntaxUID', None)
+        if str(syntax) not in GPU_DECODE_TRANSFER_SYNTAXES:
+            return None
+        if int(getattr(ds, 'NumberOfFrames', 1) or 1) != 1:
+            return None
+        # The decoder hands back stored values as unsigned, single-channel
+        # data, so signed (e.g. CT in HU), color and inverted series
+        # stay on pydicom
+        if (getattr(ds, 'PixelRepresentation', None) != 0
+                or getattr(ds, 'SamplesPerPixel', None) != 1
+                or getattr(ds, 'PhotometricInterpretation', None) != 'MONOCHROME2'):
+            return None
+
+    try:
+        from pydicom.encaps import generate_frames
+    except ImportError:  # pydicom < 3.0
+        from pydicom.encaps import generate_pixel_data_frame as generate_frames
+
+    try:
+        encoded = [next(generate_frames(ds.PixelData)) for ds in slices]
+        params = nvimgcodec.DecodeParams(
+            allow_any_depth=True,
+            color_spec=nvimgcodec.ColorSpec.UNCHANGED
+        )
+        images = nvimgcodec.Decoder().decode(encoded, params=params)
+        if any(img is None for img in images):
+            return None
+        # One device-to-host copy per slice, after the whole batch decoded
+        return [np.asarray(img.cpu()).reshape(ds.Rows, ds.Columns)
+                for img, ds in zip(images, slices)]
+    except Exception as e:
+        logger.debug(f"GPU decode unavailable, falling back to pydicom: {e}")
+        return None
+
+
+class DICOMLazyVolume:
+    """Sorted DICOM series whose slices are decoded on first access.
+
+    Only headers are read up front; pixel data for a slice is read when
+    it is indexed, and the most recently used slices are kept in memory.
+    """
+
+    def __init__(self,
+                 paths: List[Path],
+                 slice_metadata: List[DICOMMetadata],
+                 cache_size: int = 4):
+        """Initialize lazy volume.
+
+        Args:
+            paths: Slice files in volume order
+            slice_metadata: Header metadata for each slice
+            cache_size: Number of decoded slices to keep in memory
+        """
+        self.paths = paths
+        self.slice_metadata = slice_metadata
+        self._read_slice = lru_cache(maxsize=cache_size)(self._load_slice)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """Get a specific slice, reading it from disk if not cached."""
+        return self._read_slice(range(len(self.paths))[index])
+
+    def _load_slice(self, index: int) -> np.ndarray:
+        return _rescaled_pixels(dcmread(str(self.paths[index])))
+
+
 class DICOMProcessor:
     """Process DICOM medical imaging files.
 
@@ -335,12 +507,15 @@ class DICOMProcessor:
 
     def read_dicom_series(self,
                           directory: Union[str, Path],
-                          series_uid: Optional[str] = None) -> DICOMVolume:
+                          series_uid: Optional[str] = None,
+                          gpu_decode: bool = False) -> DICOMVolume:
         """Read a series of DICOM files as a 3D volume.
 
         Args:
             directory: Directory containing DICOM files
             series_uid: Optional series UID to filter by
+            gpu_decode: Batch-decode JPEG / JPEG 2000 slices with
+                nvImageCodec when it is installed
 
         Returns:
             DICOMVolume containing 3D data
@@ -350,10 +525,10 @@ class DICOMProcessor:
 
         directory = Path(directory)
 
-        # Find all DICOM files
-        dicom_files = []
+        # Find all DICOM files ('*' also matches the named extensions)
+        dicom_files = {}
         for ext in ['*.dcm', '*.DCM', '*.dicom', '*.DICOM', '*']:
-            dicom_files.extend(directory.glob(ext))
+            dicom_files.update(dict.fromkeys(directory.glob(ext)))
 
         # Filter and read valid DICOM files
         slices = []
@@ -378,16 +553,7 @@ class DICOMProcessor:
             raise ValueError(f"No valid DICOM files found in {directory}")
 
         # Sort by slice location or instance number
-        def get_sort_key(ds):
-            if hasattr(ds, 'SliceLocation'):
-                return float(ds.SliceLocation)
-            if hasattr(ds, 'InstanceNumber'):
-                return int(ds.InstanceNumber)
-            if hasattr(ds, 'ImagePositionPatient'):
-                return float(ds.ImagePositionPatient[2])
-            return 0
-
-        slices.sort(key=get_sort_key)
+        slices.sort(key=_slice_sort_key)
 
         # Log access
         patient_id = getattr(slices[0], 'PatientID', None)
@@ -397,14 +563,12 @@ class DICOMProcessor:
         pixel_arrays = []
         slice_metadata = []
 
-        for ds in slices:
-            arr = ds.pixel_array.astype(np.float32)
-
-            # Apply rescale
-            if hasattr(ds, 'RescaleSlope') and hasattr(ds, 'RescaleIntercept'):
-                arr = arr * ds.RescaleSlope + ds.RescaleIntercept
+        decoded = _decode_series_gpu(slices) if gpu_decode else None
+        if decoded is None:
+            decoded = [None] * len(slices)
 
-            pixel_arrays.append(arr)
+        for ds, pixels in zip(slices, decoded):
+            pixel_arrays.append(_rescaled_pixels(ds, pixels))
             slice_metadata.append(self._extract_metadata(ds))
 
         volume_data = np.stack(pixel_arrays, axis=0)
@@ -425,6 +589,67 @@ class DICOMProcessor:
             orientation=self._determine_orientation(slice_metadata[0])
         )
 
+    def open_dicom_series(self,
+                          directory: Union[str, Path],
+                          series_uid: Optional[str] = None,
+                          cache_size: int = 4) -> DICOMLazyVolume:
+        """Open a series of DICOM files without reading pixel data.
+
+        Headers are read with stop_before_pixels to filter and order the
+        slices; pixel data is only read for the slices that are accessed.
+
+        Args:
+            directory: Directory containing DICOM files
+            series_uid: Optional series UID to filter by
+            cache_size: Number of decoded slices to keep in memory
+
+        Returns:
+            DICOMLazyVolume over the sorted slices
+        """
+        if not PYDICOM_AVAILABLE:
+            raise RuntimeError("pydicom not installed. Install with: pip install pydicom")
+
+        directory = Path(directory)
+
+        # Find all DICOM files ('*' also matches the named extensions)
+        dicom_files = {}
+        for ext in ['*.dcm', '*.DCM', '*.dicom', '*.DICOM', '*']:
+            dicom_files.update(dict.fromkeys(directory.glob(ext)))
+
+        # Read headers only and keep image slices
+        headers = []
+        for f in dicom_files:
+            try:
+                ds = dcmread(str(f), stop_before_pixels=True)
+
+                # Filter by series UID if specified
+                if series_uid and getattr(ds, 'SeriesInstanceUID', None) != series_uid:
+                    continue
+
+                # Must describe an image
+                if not hasattr(ds, 'Rows'):
+                    continue
+
+                headers.append((f, ds))
+            except Exception as e:
+                logger.debug(f"Skipping {f}: {e}")
+                continue
+
+        if not headers:
+            raise ValueError(f"No valid DICOM files found in {directory}")
+
+        headers.sort(key=lambda item: _slice_sort_key(item[1]))
+
+        # Log access
+        patient_id = getattr(headers[0][1], 'PatientID', None)
+        self._log_access('open_series', directory, patient_id)
+
+        return DICOMLazyVolume(
+            paths=[f for f, _ in headers],
+            slice_metadata=[self._extract_metadata(ds) for _, ds in headers],
+            cache_size=cache_size
+        )
+
     def _determine_orientation(self, metadata: DICOMMetadata) -> Optional[str]:
         """Determine volume orientation from image orientation."""
         if metadata.image_orientation is None:
@@ -479,36 +704,11 @@ class DICOMProcessor:
 
         self._log_access('anonymize', input_path, original_patient_id)
 
-        # Fields to anonymize (HIPAA Safe Harbor)
-        anonymize_tags = [
-            'PatientName',
-            'PatientID',
-            'PatientBirthDate',
-            'PatientAddress',
-            'PatientTelephoneNumbers',
-            'InstitutionName',
-            'InstitutionAddress',
-            'ReferringPhysicianName',
-            'PhysiciansOfRecord',
-            'PerformingPhysicianName',
-            'OperatorsName',
-            'OtherPatientIDs',
-            'OtherPatientNames',
-            'PatientBirthName',
-            'PatientMotherBirthName',
-            'MedicalRecordLocator',
-            'EthnicGroup',
-            'Occupation',
-            'AdditionalPatientHistory',
-            'PatientComments',
-            'ResponsiblePerson',
-            'ResponsibleOrganization',
-        ]
-
         removed_fields = []
 
-        for tag in anonymize_tags:
-            if hasattr(ds, tag):
+        for tag in HIPAA_ANONYMIZE_TAGS:
+            # Keyword membership avoids decoding the element's value
+            if tag in ds:
                 removed_fields.append(tag)
                 if tag == 'PatientName':
                     ds.PatientName = 'ANONYMOUS'
@@ -545,7 +745,8 @@ class DICOMProcessor:
                        output_path: Union[str, Path],
                        window_center: Optional[float] = None,
                        window_width: Optional[float] = None,
-                       normalize: bool = True) -> Dict[str, Any]:
+                       normalize: bool = True,
+                       compress_level: int = 6) -> Dict[str, Any]:
         """Convert DICOM to PNG image.
 
         Args:
@@ -554,14 +755,55 @@ class DICOMProcessor:
             window_center: Window center for contrast adjustment
             window_width: Window width for contrast adjustment
             normalize: Whether to normalize to 0-255
+            compress_level: zlib level 0-9; lower encodes faster but
+                writes larger files
 
         Returns:
             Conversion metadata
         """
-        from PIL import Image
-
         pixel_array, metadata = self.read_dicom(input_path)
 
+        output_path = self.save_png(
+            pixel_array, output_path,
+            window_center=window_center,
+            window_width=window_width,
+            normalize=normalize,
+            compress_level=compress_level
+        )
+
+        return {
+            'input': str(input_path),
+            'output': str(output_path),
+            'size': pixel_array.shape,
+            'modality': metadata.modality
+        }
+
+    def save_png(self,
+                 pixel_array: np.ndarray,
+                 output_path: Union[str, Path],
+                 window_center: Optional[float] = None,
+                 window_width: Optional[float] = None,
+                 normalize: bool = True,
+                 compress_level: int = 6) -> Path:
+        """Save already-read DICOM pixel data as a PNG image.
+
+        Lets callers that also need the metadata reuse a single read_dicom
+        call instead of parsing the file again in convert_to_png.
+
+        Args:
+            pixel_array: Pixel data from read_dicom
+            output_path: Path to save PNG
+            window_center: Window center for contrast adjustment
+            window_width: Window width for contrast adjustment
+            normalize: Whether to normalize to 0-255
+            compress_level: zlib level 0-9; lower encodes faster but
+                writes larger files
+
+        Returns:
+            Path the PNG was written to
+        """
+        from PIL import Image
+
         # Apply windowing if specified
         if window_center is not None and window_width is not None:
             min_val = window_center - window_width / 2
@@ -581,18 +823,14 @@ class DICOMProcessor:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         img = Image.fromarray(pixel_array)
-        img.save(str(output_path))
+        img.save(str(output_path), compress_level=compress_level)
 
-        return {
-            'input': str(input_path),
-            'output': str(output_path),
-            'size': pixel_array.shape,
-            'modality': metadata.modality
-        }
+        return output_path
 
     def convert_to_nifti(self,
                          dicom_dir: Union[str, Path],
-                         output_path: Union[str, Path]) -> Dict[str, Any]:
+                         output_path: Union[str, Path],
+                         gpu_decode: bool = False) -> Dict[str, Any]:
         """Convert DICOM series to NIfTI format.
 
         NIfTI is commonly used in neuroimaging and medical ML research.
@@ -600,6 +838,7 @@ class DICOMProcessor:
         Args:
             dicom_dir: Directory containing DICOM series
             output_path: Path to save .nii.gz file
+            gpu_decode: Batch-decode compressed slices on the GPU
 
         Returns:
             Conversion metadata
@@ -610,7 +849,7 @@ class DICOMProcessor:
             raise RuntimeError("nibabel not installed. Install with: pip install nibabel")
 
         # Read DICOM series
-        volume = self.read_dicom_series(dicom_dir)
+        volume = self.read_dicom_series(dicom_dir, gpu_decode=gpu_decode)
 
         # Create affine transformation matrix
         affine = np.eye(4)
@@ -650,29 +889,37 @@ class DICOMProcessor:
         directory = Path(directory)
         series_dict = {}
 
-        for f in directory.rglob('*'):
-            if f.is_file():
-                try:
-                    ds = dcmread(str(f), stop_before_pixels=True)
-                    series_uid = getattr(ds, 'SeriesInstanceUID', 'unknown')
-
-                    if series_uid not in series_dict:
-                        series_dict[series_uid] = {
-                            'series_uid': series_uid,
-                            'modality': getattr(ds, 'Modality', 'unknown'),
-                            'series_description': getattr(ds, 'SeriesDescription', ''),
-                            'patient_id': getattr(ds, 'PatientID', 'unknown'),
-                            'study_date': getattr(ds, 'StudyDate', ''),
-                            'num_slices': 0,
-                            'files': []
-                        }
-
-                    series_dict[series_uid]['num_slices'] += 1
-                    series_dict[series_uid]['files'].append(str(f))
-
-                except Exception:
+        def read_header(f: Path):
+            try:
+                return dcmread(str(f), stop_before_pixels=True, specific_tags=SERIES_LIST_TAGS)
+            except Exception:
+                return None
+
+        files = [f for f in directory.rglob('*') if f.is_file()]
+
+        with ThreadPoolExecutor(max_workers=HEADER_SCAN_WORKERS) as executor:
+            headers = executor.map(read_header, files)
+
+            for f, ds in zip(files, headers):
+                if ds is None:
                     continue
 
+                series_uid = getattr(ds, 'SeriesInstanceUID', 'unknown')
+
+                if series_uid not in series_dict:
+                    series_dict[series_uid] = {
+                        'series_uid': series_uid,
+                        'modality': getattr(ds, 'Modality', 'unknown'),
+                        'series_description': getattr(ds, 'SeriesDescription', ''),
+                        'patient_id': getattr(ds, 'PatientID', 'unknown'),
+                        'study_date': getattr(ds, 'StudyDate', ''),
+                        'num_slices': 0,
+                        'files': []
+                    }
+
+                series_dict[series_uid]['num_slices'] += 1
+                series_dict[series_uid]['files'].append(str(f))
+
         return list(series_dict.values())
 
 
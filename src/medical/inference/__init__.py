@@ -25,6 +25,7 @@ Example:
 from .config import (
     ModelType,
     PredictionType,
+    QuantizationMode,
     ModelConfig,
     PredictionResult,
     check_ml_available,
@@ -47,6 +48,7 @@ __all__ = [
     # Config
     'ModelType',
     'PredictionType',
+    'QuantizationMode',
     'ModelConfig',
     'PredictionResult',
     'check_ml_available',
@@ -20,6 +20,13 @@ class ModelType(Enum):
     TORCHSCRIPT = "torchscript"
 
 
+class QuantizationMode(Enum):
+    """Reduced-precision inference modes."""
+    NONE = "none"
+    INT8 = "int8"  # Dynamic int8 weight quantization (CPU)
+    FP16 = "fp16"  # Half-precision weights
+
+
 class PredictionType(Enum):
     """Types of predictions."""
     BINARY = "binary"  # Cancer / No Cancer
@@ -50,6 +57,10 @@ class ModelConfig:
     # Processing
     use_gpu: bool = True
     batch_size: int = 1
+    quantization: QuantizationMode = QuantizationMode.NONE
+    # Trade ONNX Runtime's retained memory arenas for a smaller footprint
+    # in processes that run a single prediction and exit
+    ort_single_shot: bool = False
 
 
 @dataclass
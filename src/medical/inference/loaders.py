@@ -12,7 +12,7 @@ from typing import List, Optional, Any
 from abc import ABC, abstractmethod
 import numpy as np
 
-from .config import ModelConfig, PredictionResult, PredictionType, ModelType
+from .config import ModelConfig, PredictionResult, PredictionType, ModelType, QuantizationMode
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +77,7 @@ class PyTorchInference(BaseModelInference):
         self.config = config
         self.model = None
         self.device = None
+        self.half_precision = False
 
         self._setup_device()
 
@@ -104,6 +105,15 @@ class PyTorchInference(BaseModelInference):
         if not path.exists():
             raise FileNotFoundError(f"Model not found: {path}")
 
+        if (self.config.model_type == ModelType.TORCHSCRIPT
+                and self.config.quantization == QuantizationMode.INT8):
+            # quantize_dynamic rewrites nn.Linear modules, which a
+            # ScriptModule no longer exposes
+            raise ValueError(
+                "int8 quantization is not supported for TorchScript models. "
+                "Quantize the model before scripting it, or use fp16."
+            )
+
         if self.config.model_type == ModelType.TORCHSCRIPT:
             self.model = torch.jit.load(str(path), map_location=self.device)
         else:
@@ -118,8 +128,32 @@ class PyTorchInference(BaseModelInference):
                 )
 
         self.model.eval()
+        self._apply_quantization()
         logger.info(f"Loaded model from {path}")
 
+    def _apply_quantization(self) -> None:
+        """Convert the loaded model to the configured reduced precision."""
+        mode = self.config.quantization
+
+        if mode == QuantizationMode.INT8:
+            # Dynamically quantized kernels only run on CPU
+            if self.device.type != 'cpu':
+                logger.warning("int8 quantization runs on CPU; moving model off the GPU")
+                self.device = torch.device('cpu')
+                self.model.to(self.device)
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("Applied dynamic int8 quantization")
+
+        elif mode == QuantizationMode.FP16:
+            if self.device.type == 'cpu':
+                logger.warning("fp16 inference is not accelerated on CPU; keeping fp32")
+                return
+            self.model.half()
+            self.half_precision = True
+            logger.info("Converted model to fp16")
+
     def _preprocess(self, image: np.ndarray) -> Any:
         """Preprocess image for model input.
 
@@ -147,6 +181,14 @@ class PyTorchInference(BaseModelInference):
         if self.config.normalize_input:
             tensor = (tensor - self.config.input_mean) / self.config.input_std
 
+        # Match half-precision weights
+        if self.half_precision:
+            tensor = tensor.half()
+
+        if self.device.type == 'cuda':
+            # Page-locked source lets the host-to-device copy run as async DMA
+            return tensor.pin_memory().to(self.device, non_blocking=True)
+
         return tensor.to(self.device)
 
     def predict(self, image: np.ndarray) -> PredictionResult:
@@ -166,7 +208,7 @@ class PyTorchInference(BaseModelInference):
 
         # Inference
         with torch.no_grad():
-            output = self.model(input_tensor)
+            output = self.model(input_tensor).float()
 
             # Handle different output types
             if self.config.prediction_type == PredictionType.BINARY:
@@ -236,7 +278,7 @@ class PyTorchInference(BaseModelInference):
             batch_tensor = torch.cat(tensors, dim=0)
 
             with torch.no_grad():
-                outputs = self.model(batch_tensor)
+                outputs = self.model(batch_tensor).float()
 
             # Process each output
             for j in range(outputs.shape[0]):
@@ -346,13 +388,33 @@ class ONNXInference(BaseModelInference):
             raise FileNotFoundError(f"Model not found: {path}")
 
         # Configure session
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        use_cuda = (self.config.use_gpu
+                    and 'CUDAExecutionProvider' in ort.get_available_providers())
+
         providers = ['CPUExecutionProvider']
-        if self.config.use_gpu:
-            if 'CUDAExecutionProvider' in ort.get_available_providers():
-                providers.insert(0, 'CUDAExecutionProvider')
-                logger.info("Using CUDA for ONNX inference")
+        if use_cuda:
+            providers.insert(0, 'CUDAExecutionProvider')
+            logger.info("Using CUDA for ONNX inference")
+
+        if self.config.ort_single_shot:
+            # Allocate exactly what each run asks for instead of growing
+            # arenas that are only worth keeping across many runs; the
+            # options follow the provider actually selected, so a GPU
+            # request that falls back to CPU still drops the CPU arena
+            if use_cuda:
+                providers[0] = ('CUDAExecutionProvider', {'arena_extend_strategy': 'kSameAsRequested'})
+            else:
+                sess_options.enable_cpu_mem_arena = False
+                sess_options.add_session_config_entry(
+                    'session.use_device_allocator_for_initializers', '1'
+                )
+
+        if self.config.quantization != QuantizationMode.NONE:
+            path = self._quantized_model_path(path)
 
-        self.session = ort.InferenceSession(str(path), providers=providers)
+        self.session = ort.InferenceSession(str(path), sess_options=sess_options, providers=providers)
 
         # Get input/output names
         self.input_name = self.session.get_inputs()[0].name
@@ -360,6 +422,43 @@ class ONNXInference(BaseModelInference):
 
         logger.info(f"Loaded ONNX model from {path}")
 
+    def _quantized_model_path(self, path: Path) -> Path:
+        """Return a reduced-precision copy of an ONNX model.
+
+        The converted model is written next to the original and reused
+        until the original is modified.
+
+        Args:
+            path: Path to the float32 .onnx model
+
+        Returns:
+            Path to the int8 or fp16 model
+        """
+        mode = self.config.quantization
+        quantized_path = path.with_name(f"{path.stem}.{mode.value}{path.suffix}")
+
+        if quantized_path.exists() and quantized_path.stat().st_mtime >= path.stat().st_mtime:
+            return quantized_path
+
+        if mode == QuantizationMode.INT8:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            quantize_dynamic(str(path), str(quantized_path), weight_type=QuantType.QInt8)
+
+        elif mode == QuantizationMode.FP16:
+            try:
+                import onnx
+                from onnxconverter_common import float16
+            except ImportError:
+                raise RuntimeError(
+                    "fp16 ONNX conversion requires onnxconverter-common. "
+                    "Install with: pip install onnxconverter-common"
+                )
+            model = float16.convert_float_to_float16(onnx.load(str(path)), keep_io_types=True)
+            onnx.save(model, str(quantized_path))
+
+        logger.info(f"Wrote {mode.value} ONNX model to {quantized_path}")
+        return quantized_path
+
     def _preprocess(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image for model input."""
         image = image.astype(np.float32)
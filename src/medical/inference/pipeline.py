@@ -54,7 +54,8 @@ class CancerPredictionPipeline:
         """Predict cancer probability for single image.
 
         Args:
-            image: Input MRI image (2D slice or preprocessed)
+            image: Input MRI image (2D slice or preprocessed). Integer
+                images are cast to float32 by the preprocessor or model.
             generate_heatmap: Whether to generate attention heatmap
 
         Returns:
@@ -13,10 +13,13 @@ Features:
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, Optional, List, Dict, Any, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import numpy as np
 
 logger = logging.getLogger(__name__)
@@ -46,6 +49,31 @@ try:
 except ImportError:
     logger.debug("opencv not installed - some preprocessing features disabled")
 
+# GPU preprocessing (optional) - cuCIM provides CuPy ports of skimage filters.
+# Importing CuPy initializes CUDA, so both are bound by _load_cucim() the
+# first time GPU preprocessing is requested rather than at import.
+cp = None
+cucim_exposure = None
+
+
+@lru_cache(maxsize=None)
+def _load_cucim() -> bool:
+    """Import cuCIM and CuPy on first use.
+
+    Returns:
+        True if GPU preprocessing is available.
+    """
+    global cp, cucim_exposure
+    try:
+        import cupy
+        from cucim.skimage import exposure
+    except ImportError:
+        logger.debug("cucim not installed - GPU preprocessing disabled")
+        return False
+
+    cp, cucim_exposure = cupy, exposure
+    return True
+
 
 class NormalizationMethod(Enum):
     """Normalization methods for medical images."""
@@ -87,6 +115,7 @@ class PreprocessingConfig:
     # Contrast enhancement
     enhance_contrast: bool = False
     clahe_clip_limit: float = 2.0
+    use_gpu: bool = False  # Run CLAHE with cuCIM when available
 
     # Resampling
     resample: bool = False
@@ -171,15 +200,21 @@ class MedicalImagePreprocessor:
 
         # 4. Normalization
         if cfg.normalize:
+            # result is a float32 array owned by this pipeline
             result = self.normalize(result, method=cfg.normalization_method,
                                     percentile_low=cfg.percentile_low,
-                                    percentile_high=cfg.percentile_high)
+                                    percentile_high=cfg.percentile_high,
+                                    in_place=True)
             steps_applied.append(f'normalize_{cfg.normalization_method.value}')
 
         # 5. Contrast enhancement
         if cfg.enhance_contrast:
-            result = self.enhance_contrast_clahe(result, clip_limit=cfg.clahe_clip_limit)
-            steps_applied.append('clahe')
+            if cfg.use_gpu and _load_cucim():
+                result = self.enhance_contrast_clahe_gpu(result, clip_limit=cfg.clahe_clip_limit)
+                steps_applied.append('clahe_gpu')
+            else:
+                result = self.enhance_contrast_clahe(result, clip_limit=cfg.clahe_clip_limit)
+                steps_applied.append('clahe')
 
         # 6. Resampling
         if cfg.resample and cfg.target_spacing is not None:
@@ -198,7 +233,8 @@ class MedicalImagePreprocessor:
                   image: np.ndarray,
                   method: NormalizationMethod = NormalizationMethod.ZSCORE,
                   percentile_low: float = 1.0,
-                  percentile_high: float = 99.0) -> np.ndarray:
+                  percentile_high: float = 99.0,
+                  in_place: bool = False) -> np.ndarray:
         """Normalize image intensities.
 
         Args:
@@ -206,6 +242,8 @@ class MedicalImagePreprocessor:
             method: Normalization method to use
             percentile_low: Lower percentile for clipping
             percentile_high: Upper percentile for clipping
+            in_place: Overwrite a float image for min-max and z-score
+                instead of allocating intermediates
 
         Returns:
             Normalized image
@@ -213,6 +251,11 @@ class MedicalImagePreprocessor:
         if method == NormalizationMethod.MINMAX:
             min_val = image.min()
             max_val = image.max()
+            if in_place:
+                image -= min_val
+                if max_val > min_val:
+                    image /= (max_val - min_val)
+                return image
             if max_val > min_val:
                 return (image - min_val) / (max_val - min_val)
             return image - min_val
@@ -221,8 +264,15 @@ class MedicalImagePreprocessor:
             # Exclude background (zeros) from statistics
             mask = image > 0
             if mask.any():
-                mean = image[mask].mean()
-                std = image[mask].std()
+                # Gather the foreground once for both reductions
+                foreground = image[mask]
+                mean = foreground.mean()
+                std = foreground.std()
+                if in_place:
+                    image -= mean
+                    if std > 0:
+                        image /= std
+                    return image
                 if std > 0:
                     return (image - mean) / std
                 return image - mean
@@ -239,12 +289,30 @@ class MedicalImagePreprocessor:
         elif method == NormalizationMethod.HISTOGRAM:
             if SKIMAGE_AVAILABLE:
                 return exposure.equalize_hist(image)
-            else:
-                logger.warning("scikit-image not available, falling back to minmax")
-                return self.normalize(image, NormalizationMethod.MINMAX)
+            return self.equalize_histogram(image)
 
         return image
 
+    def equalize_histogram(self, image: np.ndarray, nbins: int = 256) -> np.ndarray:
+        """Global histogram equalization without scikit-image.
+
+        Builds the normalized CDF once and maps every pixel through it
+        with a vectorized interpolation (a searchsorted LUT lookup),
+        matching skimage.exposure.equalize_hist.
+
+        Args:
+            image: Input image
+            nbins: Number of histogram bins
+
+        Returns:
+            Equalized image in [0, 1]
+        """
+        hist, edges = np.histogram(image, bins=nbins)
+        cdf = np.cumsum(hist, dtype=np.float64)
+        cdf /= cdf[-1]
+        centers = (edges[:-1] + edges[1:]) / 2
+        return np.interp(image, centers, cdf).astype(np.float32)
+
     def reduce_noise(self,
                      image: np.ndarray,
                      method: NoiseReductionMethod = NoiseReductionMethod.NLM,
@@ -413,13 +481,18 @@ class MedicalImagePreprocessor:
     def enhance_contrast_clahe(self,
                                image: np.ndarray,
                                clip_limit: float = 2.0,
-                               tile_grid_size: Tuple[int, int] = (8, 8)) -> np.ndarray:
+                               tile_grid_size: Tuple[int, int] = (8, 8),
+                               max_workers: Optional[int] = None) -> np.ndarray:
         """Apply CLAHE (Contrast Limited Adaptive Histogram Equalization).
 
+        3D volumes are equalized slice by slice on a thread pool; OpenCV
+        releases the GIL while applying CLAHE, so slices run in parallel.
+
         Args:
-            image: Input image (2D)
+            image: Input image (2D) or volume (slices, height, width)
             clip_limit: Contrast limit
             tile_grid_size: Size of grid for histogram equalization
+            max_workers: Threads for volumes (defaults to CPU count)
 
         Returns:
             Contrast-enhanced image
@@ -428,8 +501,17 @@ class MedicalImagePreprocessor:
             # Normalize to 0-255 for CLAHE
             normalized = ((image - image.min()) / (image.max() - image.min() + 1e-10) * 255).astype(np.uint8)
 
-            clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
-            enhanced = clahe.apply(normalized)
+            def apply_clahe(plane: np.ndarray) -> np.ndarray:
+                # CLAHE objects keep scratch buffers, so each call gets its own
+                clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid_size)
+                return clahe.apply(plane)
+
+            if normalized.ndim == 3:
+                workers = min(max_workers or os.cpu_count() or 1, len(normalized))
+                with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+                    enhanced = np.stack(list(executor.map(apply_clahe, normalized)), axis=0)
+            else:
+                enhanced = apply_clahe(normalized)
 
             return enhanced.astype(np.float32) / 255.0
 
@@ -439,6 +521,39 @@ class MedicalImagePreprocessor:
         logger.warning("No CLAHE implementation available")
         return image
 
+    def enhance_contrast_clahe_gpu(self,
+                                   image: np.ndarray,
+                                   clip_limit: float = 2.0,
+                                   tile_grid_size: Tuple[int, int] = (8, 8)) -> np.ndarray:
+        """Apply CLAHE on the GPU with cuCIM.
+
+        Volumes are equalized per slice, matching the CPU implementation,
+        and copied back to the host once at the end.
+
+        Args:
+            image: Input image (2D) or volume (slices, height, width)
+            clip_limit: Contrast limit (OpenCV scale, as for the CPU path)
+            tile_grid_size: Size of grid for histogram equalization
+
+        Returns:
+            Contrast-enhanced image
+        """
+        if not _load_cucim():
+            raise RuntimeError("cucim not installed. Install with: pip install cucim cupy")
+
+        data = cp.asarray(image, dtype=cp.float32)
+        data -= data.min()
+        data /= data.max() + 1e-10
+
+        # One tile grid per slice; never pool histograms across slices
+        kernel_size = tuple(max(dim // tiles, 1) for dim, tiles in zip(data.shape[-2:], tile_grid_size))
+        if data.ndim == 3:
+            kernel_size = (1,) + kernel_size
+
+        enhanced = cucim_exposure.equalize_adapthist(data, kernel_size=kernel_size,
+                                                     clip_limit=clip_limit / 10)
+        return cp.asnumpy(enhanced).astype(np.float32, copy=False)
+
     def resample_volume(self,
                         volume: np.ndarray,
                         current_spacing: Tuple[float, float, float],
@@ -9,6 +9,7 @@ from src.medical.inference import (
     # Enums
     ModelType,
     PredictionType,
+    QuantizationMode,
     # Config
     ModelConfig,
     PredictionResult,
@@ -28,6 +29,7 @@ from src.medical.inference import (
 __all__ = [
     'ModelType',
     'PredictionType',
+    'QuantizationMode',
     'ModelConfig',
     'PredictionResult',
     'BaseModelInference',
@@ -9,10 +9,11 @@ Example:
     >>> result = processor.resize(image, 800, 600)
 """
 
-from .gpu import GPUMediaProcessor, ImageDimensions, FilterConfig
+from .gpu import GPUMediaProcessor, ImageDimensions, FilterConfig, probe_device
 
 __all__ = [
     'GPUMediaProcessor',
     'ImageDimensions',
     'FilterConfig',
+    'probe_device',
 ]
@@ -120,48 +120,36 @@ class GPUMediaProcessor:
             logger.info("GPU disabled by user, using CPU")
             return
 
-        # Try NVIDIA CUDA first (most common)
-        if torch.cuda.is_available():
+        self.device_type, self.device_name = _detect_device(device_id)
+
+        if self.device_type == 'cpu':
+            self.device = torch.device('cpu')
+            logger.info("No GPU detected, using CPU")
+            logger.info("Supported GPUs: NVIDIA (CUDA), Apple (Metal), AMD (ROCm), Intel (Arc)")
+            return
+
+        self.gpu_enabled = True
+
+        if self.device_type == 'cuda':
             self.device = torch.device(f'cuda:{device_id}')
-            self.gpu_enabled = True
-            self.device_type = 'cuda'
-            self.device_name = torch.cuda.get_device_name(device_id)
             gpu_memory = torch.cuda.get_device_properties(device_id).total_memory / 1e9
             logger.info(f"NVIDIA GPU detected: {self.device_name}")
             logger.info(f"GPU memory: {gpu_memory:.2f} GB")
 
-        # Try Apple Metal (M1/M2/M3 Macs)
-        elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+        elif self.device_type == 'mps':
             self.device = torch.device('mps')
-            self.gpu_enabled = True
-            self.device_type = 'mps'
-            self.device_name = 'Apple Metal GPU'
             logger.info(f"Apple Metal GPU detected: {self.device_name}")
             logger.info("Apple Silicon unified memory")
 
-        # Try Intel oneAPI (Arc GPUs)
-        elif hasattr(torch, 'xpu') and torch.xpu.is_available():
+        elif self.device_type == 'xpu':
             self.device = torch.device(f'xpu:{device_id}')
-            self.gpu_enabled = True
-            self.device_type = 'xpu'
-            self.device_name = f'Intel XPU {device_id}'
             logger.info(f"Intel GPU detected: {self.device_name}")
 
-        # Try AMD ROCm (if available)
-        elif hasattr(torch.version, 'hip') and torch.version.hip is not None:
+        elif self.device_type == 'rocm':
             # ROCm uses CUDA-compatible API
             self.device = torch.device(f'cuda:{device_id}')
-            self.gpu_enabled = True
-            self.device_type = 'rocm'
-            self.device_name = 'AMD ROCm GPU'
             logger.info(f"AMD GPU detected: {self.device_name}")
 
-        # Fallback to CPU
-        else:
-            self.device = torch.device('cpu')
-            logger.info("No GPU detected, using CPU")
-            logger.info("Supported GPUs: NVIDIA (CUDA), Apple (Metal), AMD (ROCm), Intel (Arc)")
-
     def _clear_gpu_cache(self):
         """Clear GPU memory cache based on device type."""
         if not self.gpu_enabled or not self._torch_available:
@@ -584,46 +572,150 @@ class GPUMediaProcessor:
         Returns:
             Dictionary containing device information.
         """
-        base_info = {
-            'device': self.device_type.upper(),
-            'name': self.device_name,
-            'backend': self.device_type
-        }
+        return _describe_device(
+            self.device_type, self.device_name, self.gpu_enabled, self._torch_available
+        )
 
-        # Add PyTorch availability info
-        if not self._torch_available:
-            base_info['pytorch_available'] = False
-            base_info['note'] = 'Install PyTorch for GPU support: pip install secure-media-processor[gpu]'
-            return base_info
 
-        base_info['pytorch_available'] = True
+def _detect_device(device_id: int = 0) -> Tuple[str, str]:
+    """Detect the best available GPU backend.
 
-        if not self.gpu_enabled:
-            return base_info
+    Only queries backend availability; no tensors or allocator state are
+    created. Requires PyTorch to be installed.
 
-        # Add GPU-specific information based on type
-        if self.device_type == 'cuda':
-            base_info.update({
-                'vendor': 'NVIDIA',
-                'memory_total': torch.cuda.get_device_properties(0).total_memory / 1e9,
-                'memory_allocated': torch.cuda.memory_allocated(0) / 1e9,
-                'memory_cached': torch.cuda.memory_reserved(0) / 1e9,
-                'cuda_version': torch.version.cuda
-            })
-        elif self.device_type == 'rocm':
-            base_info.update({
-                'vendor': 'AMD',
-                'rocm_version': torch.version.hip if hasattr(torch.version, 'hip') else 'N/A'
-            })
-        elif self.device_type == 'mps':
-            base_info.update({
-                'vendor': 'Apple',
-                'architecture': 'Apple Silicon (M1/M2/M3)'
-            })
-        elif self.device_type == 'xpu':
-            base_info.update({
-                'vendor': 'Intel',
-                'architecture': 'Arc GPU'
-            })
+    Args:
+        device_id: Device ID to query (for multi-GPU systems).
+
+    Returns:
+        Tuple of (device_type, device_name), falling back to 'cpu'.
+    """
+    # Try NVIDIA CUDA first (most common)
+    if torch.cuda.is_available():
+        return 'cuda', torch.cuda.get_device_name(device_id)
+
+    # Try Apple Metal (M1/M2/M3 Macs)
+    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+        return 'mps', 'Apple Metal GPU'
+
+    # Try Intel oneAPI (Arc GPUs)
+    if hasattr(torch, 'xpu') and torch.xpu.is_available():
+        return 'xpu', f'Intel XPU {device_id}'
+
+    # Try AMD ROCm (if available)
+    if hasattr(torch.version, 'hip') and torch.version.hip is not None:
+        return 'rocm', 'AMD ROCm GPU'
+
+    return 'cpu', 'CPU Processing'
 
+
+def _describe_device(device_type: str, device_name: str,
+                     gpu_enabled: bool, torch_available: bool,
+                     memory_total: Optional[float] = None) -> dict:
+    """Build the device information dictionary shared by processors and probes.
+
+    memory_total (in GB) is read from the CUDA device properties unless
+    given; querying the properties creates a CUDA context.
+    """
+    base_info = {
+        'device': device_type.upper(),
+        'name': device_name,
+        'backend': device_type
+    }
+
+    # Add PyTorch availability info
+    if not torch_available:
+        base_info['pytorch_available'] = False
+        base_info['note'] = 'Install PyTorch for GPU support: pip install secure-media-processor[gpu]'
         return base_info
+
+    base_info['pytorch_available'] = True
+
+    if not gpu_enabled:
+        return base_info
+
+    # Add GPU-specific information based on type
+    if device_type == 'cuda':
+        base_info.update({
+            'vendor': 'NVIDIA',
+            'memory_total': (memory_total if memory_total is not None
+                             else torch.cuda.get_device_properties(0).total_memory / 1e9),
+            'memory_allocated': torch.cuda.memory_allocated(0) / 1e9,
+            'memory_cached': torch.cuda.memory_reserved(0) / 1e9,
+            'cuda_version': torch.version.cuda
+        })
+    elif device_type == 'rocm':
+        base_info.update({
+            'vendor': 'AMD',
+            'rocm_version': torch.version.hip if hasattr(torch.version, 'hip') else 'N/A'
+        })
+    elif device_type == 'mps':
+        base_info.update({
+            'vendor': 'Apple',
+            'architecture': 'Apple Silicon (M1/M2/M3)'
+        })
+    elif device_type == 'xpu':
+        base_info.update({
+            'vendor': 'Intel',
+            'architecture': 'Arc GPU'
+        })
+
+    return base_info
+
+
+def _nvml_device_info(device_id: int = 0) -> Optional[Tuple[str, float]]:
+    """Read a CUDA device's name and total memory (GB) through NVML.
+
+    NVML talks to the driver directly, so unlike torch.cuda it creates no
+    CUDA context. Returns None when pynvml (nvidia-ml-py) is not installed
+    or NVML cannot be initialized.
+    """
+    try:
+        import pynvml
+    except ImportError:
+        return None
+
+    try:
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    try:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(device_id)
+        name = pynvml.nvmlDeviceGetName(handle)
+        total = pynvml.nvmlDeviceGetMemoryInfo(handle).total
+    except Exception:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+
+    if isinstance(name, bytes):
+        name = name.decode()
+    return name, total / 1e9
+
+
+def probe_device(device_id: int = 0) -> dict:
+    """Describe the best available device without creating a processor.
+
+    Returns the same dictionary as GPUMediaProcessor.get_device_info() but
+    skips processor construction, so inspecting the system does not pay
+    for processor setup. CUDA devices are described through NVML when
+    nvidia-ml-py is installed, which avoids creating a CUDA context;
+    without it the name and memory queries still create one.
+
+    Args:
+        device_id: Device ID to query (for multi-GPU systems).
+
+    Returns:
+        Dictionary containing device information.
+    """
+    if not TORCH_AVAILABLE:
+        return _describe_device('cpu', 'CPU Processing', False, False)
+
+    if torch.cuda.is_available():
+        nvml_info = _nvml_device_info(device_id)
+        if nvml_info is not None:
+            device_name, memory_total = nvml_info
+            return _describe_device('cuda', device_name, True, True,
+                                    memory_total=memory_total)
+
+    device_type, device_name = _detect_device(device_id)
+    return _describe_device(device_type, device_name, device_type != 'cpu', True)
@@ -3,9 +3,12 @@
 These tests use mocking to avoid requiring actual Azure credentials.
 """
 
+import asyncio
+import hashlib
+from datetime import datetime, timezone
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import tempfile
 import os
 
@@ -135,9 +138,54 @@ class TestAzureBlobConnector:
             assert 'checksum' in result
             mock_blob.upload_blob.assert_called_once()
 
+            # Small files go up in one Put Blob with the checksum attached
+            metadata = mock_blob.upload_blob.call_args.kwargs['metadata']
+            assert metadata['checksum'] == result['checksum']
+            mock_blob.set_blob_metadata.assert_not_called()
+
         finally:
             os.unlink(temp_path)
 
+    def test_upload_file_copies_staging_source(self, connector):
+        """Test a staging source is copied to the spool path and uploaded."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "source.dcm"
+            source.write_bytes(b"staged content")
+            spool = Path(temp_dir) / "spool" / "source.dcm"
+            spool.parent.mkdir()
+
+            mock_blob = Mock()
+            connector.container_client.get_blob_client.return_value = mock_blob
+
+            result = connector.upload_file(spool, "remote/source.dcm", staging_source=source)
+
+            assert result['success'] is True
+            assert spool.read_bytes() == b"staged content"
+            assert mock_blob.upload_blob.call_args.args[0] == b"staged content"
+
+    def test_upload_blocks_failure_releases_mapping(self, connector):
+        """Test a failed block upload is reported instead of a BufferError."""
+        class FakeAzureError(Exception):
+            pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "large.bin"
+            source.write_bytes(os.urandom(4 * 1024 * 1024))
+
+            mock_blob = Mock()
+            mock_blob.stage_block.side_effect = [None, FakeAzureError("stage failed"), None, None]
+            connector.container_client.get_blob_client.return_value = mock_blob
+            connector.single_put_threshold = 1024
+            connector._block_size = 1024 * 1024
+            connector.max_concurrency = 2
+
+            with patch('src.connectors.azure_blob_connector.AzureError', FakeAzureError):
+                result = connector.upload_file(source, "remote/large.bin")
+
+            assert result['success'] is False
+            assert 'stage failed' in result['error']
+            mock_blob.commit_block_list.assert_not_called()
+
     def test_download_file_success(self, connector):
         """Test successful file download."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -146,11 +194,14 @@ class TestAzureBlobConnector:
             # Mock blob client and download
             mock_blob = Mock()
             mock_properties = Mock()
-            mock_properties.metadata = {'checksum': 'abc123'}
+            mock_properties.metadata = {
+                'checksum': hashlib.sha256(b"test content").hexdigest()
+            }
+            mock_properties.content_settings.content_md5 = None
             mock_blob.get_blob_properties.return_value = mock_properties
 
             mock_stream = Mock()
-            mock_stream.readall.return_value = b"test content"
+            mock_stream.chunks.return_value = iter([b"test ", b"content"])
             mock_blob.download_blob.return_value = mock_stream
 
             connector.container_client.get_blob_client.return_value = mock_blob
@@ -158,7 +209,60 @@ class TestAzureBlobConnector:
             result = connector.download_file("remote/test.txt", str(local_path))
 
             assert result['success'] is True
-            assert local_path.exists()
+            assert result['checksum_verified'] is True
+            assert local_path.read_bytes() == b"test content"
+
+    def test_download_file_uses_content_md5(self, connector):
+        """Test blobs with a Content-MD5 are validated by the SDK."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = Path(temp_dir) / "downloaded.txt"
+
+            mock_blob = Mock()
+            mock_properties = Mock()
+            mock_properties.metadata = {'checksum': 'unused'}
+            mock_properties.content_settings.content_md5 = bytearray(16)
+            mock_blob.get_blob_properties.return_value = mock_properties
+
+            mock_stream = Mock()
+            mock_stream.readinto.side_effect = lambda f: f.write(b"test content")
+            mock_blob.download_blob.return_value = mock_stream
+
+            connector.container_client.get_blob_client.return_value = mock_blob
+
+            result = connector.download_file("remote/test.txt", str(local_path))
+
+            assert result['success'] is True
+            assert result['checksum_verified'] is True
+            assert mock_blob.download_blob.call_args.kwargs['validate_content'] is True
+            mock_stream.chunks.assert_not_called()
+
+    def test_block_size_adapts_to_throughput(self, connector):
+        """Test block size grows on fast blocks and shrinks on slow ones."""
+        from src.connectors.azure_blob_connector import MIN_BLOCK_SIZE
+
+        start = connector._block_size
+        connector._record_block_throughput(10.0)
+        assert connector._block_size == start
+
+        connector._record_block_throughput(20.0)
+        assert connector._block_size > start
+
+        for _ in range(100):
+            connector._record_block_throughput(0.001)
+        assert connector._block_size == MIN_BLOCK_SIZE
+
+    def test_block_size_respects_block_count_limit(self, connector):
+        """Test small adaptive blocks are raised to stay under 50,000 blocks."""
+        from src.connectors.azure_blob_connector import MAX_BLOCKS_PER_BLOB, MIN_BLOCK_SIZE
+
+        connector._block_size = MIN_BLOCK_SIZE
+        assert connector._next_block_size(10 * 1024 * 1024, 0) == MIN_BLOCK_SIZE
+
+        remaining = 20 * 1024 ** 3
+        size = connector._next_block_size(remaining, 10000)
+        assert size > MIN_BLOCK_SIZE
+        assert size * (MAX_BLOCKS_PER_BLOB - 10000) >= remaining
+        assert connector._next_block_size(remaining, MAX_BLOCKS_PER_BLOB - 1) == remaining
 
     def test_delete_file_success(self, connector):
         """Test successful file deletion."""
@@ -170,6 +274,19 @@ class TestAzureBlobConnector:
         assert result['success'] is True
         mock_blob.delete_blob.assert_called_once()
 
+    def test_delete_files_batches_requests(self, connector):
+        """Test batch delete maps sub-responses back to paths."""
+        responses = [Mock(status_code=202), Mock(status_code=404), Mock(status_code=403)]
+        connector.container_client.delete_blobs.return_value = iter(responses)
+
+        results = connector.delete_files(["a.dcm", "../escape", "b.dcm", "c.dcm"])
+
+        connector.container_client.delete_blobs.assert_called_once_with(
+            "a.dcm", "b.dcm", "c.dcm", raise_on_any_failure=False
+        )
+        assert [r['success'] for r in results] == [True, False, True, False]
+        assert results[2]['warning'] == 'Blob did not exist'
+
     def test_list_files(self, connector):
         """Test listing files."""
         mock_blob = Mock()
@@ -179,7 +296,7 @@ class TestAzureBlobConnector:
         mock_blob.etag = '"abc123"'
         mock_blob.content_settings = None
 
-        connector.container_client.list_blobs.return_value = [mock_blob]
+        connector.container_client.list_blobs.return_value.by_page.return_value = [[mock_blob]]
 
         files = connector.list_files()
 
@@ -187,6 +304,93 @@ class TestAzureBlobConnector:
         assert files[0]['path'] == "test.txt"
         assert files[0]['size'] == 1024
 
+    def test_iter_files_requests_metadata_only_when_asked(self, connector):
+        """Test metadata is an opt-in listing dataset."""
+        mock_blob = Mock()
+        mock_blob.name = "scan.dcm"
+        mock_blob.size = 10
+        mock_blob.last_modified = None
+        mock_blob.etag = None
+        mock_blob.content_settings = None
+        mock_blob.metadata = {'checksum': 'abc'}
+        list_blobs = connector.container_client.list_blobs
+        list_blobs.return_value.by_page.side_effect = lambda: iter([[mock_blob]])
+
+        plain = list(connector.iter_files("scans/"))
+        assert list_blobs.call_args.kwargs['include'] is None
+        assert 'metadata' not in plain[0]
+
+        detailed = list(connector.iter_files("scans/", include_metadata=True))
+        assert list_blobs.call_args.kwargs['include'] == ['metadata']
+        assert detailed[0]['metadata'] == {'checksum': 'abc'}
+
+    def test_iter_file_names_skips_blob_properties(self, connector):
+        """Test name-only listings use list_blob_names instead of list_blobs."""
+        connector.container_client.list_blob_names.return_value = iter(["a.dcm", "b.dcm"])
+
+        names = list(connector.iter_file_names("scans/", page_size=50))
+
+        assert names == ["a.dcm", "b.dcm"]
+        connector.container_client.list_blob_names.assert_called_once_with(
+            name_starts_with="scans/", results_per_page=50
+        )
+        connector.container_client.list_blobs.assert_not_called()
+
+    def test_rate_limit_timeout_returns_error(self, connector):
+        """Test a limiter timeout fails the call before any request."""
+        connector._rate_limiter = Mock()
+        connector._rate_limiter.acquire.return_value = False
+
+        result = connector.get_file_metadata("remote/test.txt")
+
+        assert result['success'] is False
+        assert 'rate limit' in result['error'].lower()
+        connector.container_client.get_blob_client.assert_not_called()
+
+    def test_generate_sas_url_encodes_and_caches(self, connector):
+        """Test SAS URLs encode the blob name and are reused."""
+        with patch('src.connectors.azure_blob_connector.generate_blob_sas',
+                   return_value='sig=abc') as mock_sas:
+            first = connector.generate_sas_url("scans/a b#1.dcm")
+            second = connector.generate_sas_url("scans/a b#1.dcm")
+
+        assert first['success'] is True
+        assert first['sas_url'].endswith("/test-container/scans/a%20b%231.dcm?sig=abc")
+        assert second['sas_url'] == first['sas_url']
+        mock_sas.assert_called_once()
+
+    def test_generate_sas_url_never_shortens_lifetime(self, connector):
+        """Test a lifetime shorter than the rounding step is still in the future."""
+        from src.connectors.azure_blob_connector import SAS_EXPIRY_GRANULARITY
+
+        before = datetime.now(timezone.utc)
+        with patch('src.connectors.azure_blob_connector.generate_blob_sas',
+                   return_value='sig=abc') as mock_sas:
+            result = connector.generate_sas_url("scans/a.dcm", expiry_hours=0)
+
+        expiry = datetime.fromisoformat(result['expiry'])
+        assert before < expiry <= before + SAS_EXPIRY_GRANULARITY
+        assert mock_sas.call_args.kwargs['expiry'] == expiry
+
+    def test_copy_blob_uses_synchronous_copy(self, connector):
+        """Test copy completes in one call when the source can be signed."""
+        source_blob = Mock()
+        dest_blob = Mock()
+        dest_blob.start_copy_from_url.return_value = {
+            'copy_id': 'copy-1',
+            'copy_status': 'success'
+        }
+        connector.container_client.get_blob_client.side_effect = [source_blob, dest_blob]
+
+        with patch.object(connector, '_copy_source_url', return_value='https://src?sig'):
+            result = connector.copy_blob("a/source.dcm", "b/dest.dcm")
+
+        assert result['success'] is True
+        assert result['copy_id'] == 'copy-1'
+        assert result['copy_status'] == 'success'
+        dest_blob.start_copy_from_url.assert_called_once_with('https://src?sig', requires_sync=True)
+        dest_blob.get_blob_properties.assert_not_called()
+
     def test_path_validation(self, connector):
         """Test path validation prevents traversal attacks."""
         result = connector.upload_file("test.txt", "../../../etc/passwd")
@@ -202,6 +406,115 @@ class TestAzureBlobConnector:
         assert connector._connected is False
 
 
+class TestAsyncAzureBlobConnector:
+    """Test suite for AsyncAzureBlobConnector."""
+
+    @pytest.fixture
+    def connector(self):
+        """Create an async connector with a mocked container client."""
+        with patch('src.connectors.azure_blob_connector.AZURE_AIO_AVAILABLE', True):
+            from src.connectors.azure_blob_connector import AsyncAzureBlobConnector
+
+            connector = AsyncAzureBlobConnector(
+                container_name="test-container",
+                connection_string="DefaultEndpointsProtocol=https;AccountName=test;AccountKey=key"
+            )
+            connector._connected = True
+            connector.container_client = Mock()
+            connector._async_transfer_semaphore = asyncio.Semaphore(1)
+
+            yield connector
+
+    def test_upload_file_success(self, connector):
+        """Test upload hashes the file while the SDK reads it."""
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"test content")
+            temp_path = f.name
+
+        async def read_all(data, **kwargs):
+            while data.read(4):
+                pass
+
+        try:
+            mock_blob = Mock()
+            mock_blob.upload_blob = AsyncMock(side_effect=read_all)
+            mock_blob.set_blob_metadata = AsyncMock()
+            connector.container_client.get_blob_client.return_value = mock_blob
+            # Force the multi-block path for a tiny file
+            connector.single_put_threshold = 4
+
+            result = asyncio.run(connector.upload_file(temp_path, "remote/test.txt"))
+
+            assert result['success'] is True
+            assert result['checksum'] == hashlib.sha256(b"test content").hexdigest()
+            mock_blob.set_blob_metadata.assert_awaited_once()
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_small_file_reads_off_event_loop(self, connector):
+        """Test the single-put read and hash run on an executor thread."""
+        import threading
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"test content")
+            temp_path = f.name
+
+        read_threads = []
+        read_with_checksum = connector._read_with_checksum
+
+        def tracking_read(path):
+            read_threads.append(threading.current_thread())
+            return read_with_checksum(path)
+
+        try:
+            mock_blob = Mock()
+            mock_blob.upload_blob = AsyncMock()
+            connector.container_client.get_blob_client.return_value = mock_blob
+
+            with patch.object(connector, '_read_with_checksum', side_effect=tracking_read):
+                result = asyncio.run(connector.upload_file(temp_path, "remote/test.txt"))
+
+            assert result['success'] is True
+            assert result['checksum'] == hashlib.sha256(b"test content").hexdigest()
+            assert mock_blob.upload_blob.await_args.args[0] == b"test content"
+            assert read_threads and read_threads[0] is not threading.main_thread()
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_copy_blob_polls_pending_copy_without_blocking(self, connector):
+        """Test the fallback copy poll awaits between status checks."""
+        mock_source = Mock(url="https://test.blob.core.windows.net/c/src")
+        mock_dest = Mock()
+        mock_dest.start_copy_from_url = AsyncMock(
+            return_value={'copy_id': 'copy-1', 'copy_status': 'pending'}
+        )
+        mock_dest.get_blob_properties = AsyncMock(
+            return_value=Mock(copy=Mock(id='copy-1', status='success'))
+        )
+        connector.container_client.get_blob_client.side_effect = [mock_source, mock_dest]
+
+        with patch.object(connector, '_copy_source_url', return_value=None), \
+                patch('src.connectors.azure_blob_connector.asyncio.sleep', new=AsyncMock()) as sleep, \
+                patch('src.connectors.azure_blob_connector.time.sleep',
+                      side_effect=AssertionError("blocking sleep")):
+            result = asyncio.run(connector.copy_blob("src", "dst"))
+
+        assert result['success'] is True
+        assert result['copy_status'] == 'success'
+        sleep.assert_awaited_once()
+
+    def test_upload_file_not_connected(self, connector):
+        """Test upload fails when not connected."""
+        connector._connected = False
+
+        result = asyncio.run(connector.upload_file("test.txt", "remote/test.txt"))
+
+        assert result['success'] is False
+        assert 'Not connected' in result['error']
+
+
 class TestAzureConnectorImportError:
     """Test behavior when Azure SDK is not installed."""
 
@@ -219,3 +532,15 @@ class TestAzureConnectorImportError:
                         container_name="test",
                         connection_string="test"
                     )
+
+    def test_probe_tolerates_mocked_sdk_modules(self):
+        """Test the SDK probe survives modules in sys.modules without a spec."""
+        import importlib
+        import src.connectors.azure_blob_connector as module
+
+        try:
+            with patch.dict('sys.modules', {'azure.storage.blob': Mock()}):
+                importlib.reload(module)
+                assert module.AZURE_AVAILABLE is False
+        finally:
+            importlib.reload(module)
@@ -0,0 +1,260 @@
+"""Test suite for the shared CloudConnector transfer and checksum helpers."""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import tempfile
+
+from src.connectors.base_connector import CloudConnector
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestCloudConnectorBatchTransfers:
+    """Test concurrent transfer helpers on CloudConnector."""
+
+    class _Connector(CloudConnector):
+        def connect(self): return True
+        def disconnect(self): return True
+        def upload_file(self, file_path, remote_path, metadata=None):
+            if remote_path == 'bad':
+                raise RuntimeError("upload exploded")
+            return {'success': True, 'remote_path': remote_path}
+        def download_file(self, remote_path, local_path, verify_checksum=True):
+            return {'success': True, 'local_path': str(local_path),
+                    'checksum_verified': verify_checksum}
+        def delete_file(self, remote_path): pass
+        def list_files(self, prefix=''): pass
+        def get_file_metadata(self, remote_path): pass
+
+    def test_upload_many(self):
+        """Test every upload is reported, including ones that raise."""
+        connector = self._Connector()
+
+        results = dict(connector.upload_many(
+            [('a.txt', 'remote/a'), ('b.txt', 'remote/b'), ('c.txt', 'bad')]
+        ))
+
+        assert results['remote/a']['success'] is True
+        assert results['remote/b']['success'] is True
+        assert results['bad'] == {'success': False, 'error': 'upload exploded'}
+
+    def test_download_many(self):
+        """Test downloads are keyed by remote path."""
+        connector = self._Connector()
+
+        results = dict(connector.download_many(
+            [('remote/a', 'a.txt'), ('remote/b', 'b.txt')],
+            max_workers=2,
+            verify_checksum=False
+        ))
+
+        assert results['remote/a']['local_path'] == 'a.txt'
+        assert results['remote/b']['checksum_verified'] is False
+
+
+class TestCloudConnectorMultipartUpload:
+    """Test the multipart upload driver on CloudConnector."""
+
+    class _Connector(TestCloudConnectorBatchTransfers._Connector):
+        def __init__(self):
+            super().__init__()
+            self._connected = True
+            self.parts = {}
+            self.completed = None
+
+        def _mpu_create(self, remote_path, metadata):
+            return 'upload-1'
+
+        def _mpu_put_part(self, remote_path, upload_id, part_number, data):
+            self.parts[part_number] = data
+            return f'etag-{part_number}'
+
+        def _mpu_complete(self, remote_path, upload_id, parts):
+            self.completed = parts
+
+    def test_parts_cover_file_in_order(self, temp_dir):
+        """Test each part is read at its own offset and completed in order."""
+        file_path = temp_dir / "large.bin"
+        file_path.write_bytes(b"a" * 10 + b"b" * 10 + b"c" * 5)
+        connector = self._Connector()
+
+        result = connector.upload_file_multipart(file_path, 'remote/large.bin',
+                                                 part_size=10, max_parallel=3)
+
+        assert result['success'] is True
+        assert result['size'] == 25
+        assert connector.parts == {1: b"a" * 10, 2: b"b" * 10, 3: b"c" * 5}
+        assert connector.completed == [(1, 'etag-1'), (2, 'etag-2'), (3, 'etag-3')]
+
+    def test_part_size_grows_to_stay_within_part_limit(self, temp_dir):
+        """Test parts are enlarged so the upload never exceeds the part cap."""
+        file_path = temp_dir / "large.bin"
+        file_path.write_bytes(b"x" * 25)
+        connector = self._Connector()
+
+        with patch('src.connectors.base_connector.MULTIPART_MAX_PARTS', 2):
+            result = connector.upload_file_multipart(file_path, 'remote/large.bin',
+                                                     part_size=10)
+
+        assert result['success'] is True
+        assert {n: len(data) for n, data in connector.parts.items()} == {1: 13, 2: 12}
+
+    def test_small_files_use_upload_file(self, temp_dir):
+        """Test files that fit in one part skip the multipart hooks."""
+        file_path = temp_dir / "small.bin"
+        file_path.write_bytes(b"tiny")
+        connector = self._Connector()
+
+        result = connector.upload_file_multipart(file_path, 'remote/small.bin', part_size=10)
+
+        assert result == {'success': True, 'remote_path': 'remote/small.bin'}
+        assert connector.parts == {}
+
+
+class TestCloudConnectorChecksumCache:
+    """Test the stat-keyed checksum cache on CloudConnector."""
+
+    def test_checksum_reused_until_file_changes(self, temp_dir):
+        """Test settled files are hashed once and rehashed after a change."""
+        import hashlib
+        import time
+        from src.connectors import base_connector
+
+        file_path = temp_dir / "settled.bin"
+        file_path.write_bytes(b"first")
+        CloudConnector.clear_checksum_cache()
+        connector = TestCloudConnectorBatchTransfers._Connector()
+        later = time.time_ns() + 60 * 10**9
+
+        with patch.object(base_connector, '_hash_file',
+                          wraps=base_connector._hash_file) as mock_hash:
+            with patch.object(base_connector.time, 'time_ns', return_value=later):
+                first = connector._calculate_checksum(file_path)
+                assert connector._calculate_checksum(file_path) == first
+                assert mock_hash.call_count == 1
+
+            # A fresh same-size write is never served from the cache
+            file_path.write_bytes(b"other")
+            assert connector._calculate_checksum(file_path) == hashlib.sha256(b"other").hexdigest()
+
+        CloudConnector.clear_checksum_cache()
+
+    def test_checksums_batch_preserves_order(self, temp_dir):
+        """Test batch checksums match per-file results in input order."""
+        import hashlib
+
+        paths = []
+        for i in range(5):
+            path = temp_dir / f"small{i}.bin"
+            path.write_bytes(b"x" * i)
+            paths.append(path)
+        connector = TestCloudConnectorBatchTransfers._Connector()
+
+        assert connector._calculate_checksums_batch(paths, max_workers=3) == [
+            hashlib.sha256(b"x" * i).hexdigest() for i in range(5)
+        ]
+
+    def test_verify_checksum_uses_stored_algorithm(self, temp_dir):
+        """Test BLAKE3 and SHA-256 checksums both verify on one connector."""
+        pytest.importorskip('blake3')
+        import hashlib
+
+        file_path = temp_dir / "data.bin"
+        file_path.write_bytes(b"payload")
+        connector = TestCloudConnectorBatchTransfers._Connector()
+        connector.checksum_algorithm = 'blake3'
+
+        checksum = connector._calculate_checksum(file_path)
+
+        assert checksum.startswith('blake3:')
+        assert connector._verify_checksum(file_path, checksum)
+        assert connector._verify_checksum(file_path, hashlib.sha256(b"payload").hexdigest())
+
+
+class TestCloudConnectorStreamToFile:
+    """Test CloudConnector._stream_to_file."""
+
+    def test_streams_file_objects_and_chunk_iterables(self, temp_dir):
+        """Test both source kinds are written in full."""
+        import io
+
+        source = temp_dir / "source.bin"
+        source.write_bytes(b"x" * 3000)
+        connector = TestCloudConnectorBatchTransfers._Connector()
+
+        with open(source, 'rb') as f:
+            f.read(1000)
+            written = connector._stream_to_file(f, temp_dir / "a.bin", chunk_size=512)
+            assert f.read() == b""
+        assert written == 2000
+        assert (temp_dir / "a.bin").read_bytes() == b"x" * 2000
+
+        assert connector._stream_to_file(io.BytesIO(b"body"), temp_dir / "b.bin") == 4
+        assert connector._stream_to_file(iter([b"ab", b"cd"]), temp_dir / "c.bin") == 4
+        assert (temp_dir / "c.bin").read_bytes() == b"abcd"
+
+    def test_file_copy_uses_sendfile_when_supported(self, temp_dir):
+        """Test regular-file sources are copied with os.sendfile."""
+        import os
+
+        if not hasattr(os, 'sendfile'):
+            pytest.skip("os.sendfile not available")
+        source = temp_dir / "source.bin"
+        source.write_bytes(b"y" * 5000)
+        connector = TestCloudConnectorBatchTransfers._Connector()
+
+        with open(source, 'rb') as f, \
+                patch('os.sendfile', wraps=os.sendfile) as mock_sendfile:
+            written = connector._stream_to_file(f, temp_dir / "out.bin", chunk_size=1024)
+
+        assert written == 5000
+        assert mock_sendfile.called
+        assert (temp_dir / "out.bin").read_bytes() == b"y" * 5000
+
+    def test_file_copy_falls_back_when_sendfile_fails(self, temp_dir):
+        """Test a sendfile error (e.g. macOS file-to-file) falls back to copying."""
+        import errno
+        import os
+
+        source = temp_dir / "source.bin"
+        source.write_bytes(b"z" * 5000)
+        connector = TestCloudConnectorBatchTransfers._Connector()
+        calls = []
+
+        def failing_sendfile(out_fd, in_fd, offset, count):
+            # Fail after one successful chunk to exercise the restart
+            if calls:
+                raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+            calls.append(offset)
+            return os.pwrite(out_fd, os.pread(in_fd, count, offset), 0)
+
+        with open(source, 'rb') as f:
+            f.read(1000)
+            with patch('os.sendfile', failing_sendfile, create=True):
+                written = connector._stream_to_file(f, temp_dir / "out.bin", chunk_size=1024)
+
+        assert written == 4000
+        assert (temp_dir / "out.bin").read_bytes() == b"z" * 4000
+
+    def test_hashes_while_writing(self, temp_dir):
+        """Test the tee hash lets verification skip re-reading the file."""
+        import hashlib
+        import io
+
+        connector = TestCloudConnectorBatchTransfers._Connector()
+        local_path = temp_dir / "teed.bin"
+        hasher = hashlib.sha256()
+
+        connector._stream_to_file(io.BytesIO(b"payload"), local_path, chunk_size=3, hasher=hasher)
+        expected = hashlib.sha256(b"payload").hexdigest()
+
+        assert hasher.hexdigest() == expected
+        with patch.object(connector, '_calculate_checksum') as mock_checksum:
+            assert connector._verify_checksum(local_path, expected, actual=hasher.hexdigest())
+            mock_checksum.assert_not_called()
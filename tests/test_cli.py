@@ -6,6 +6,7 @@ This module tests all CLI commands including:
 - resize/filter-image commands (license gated)
 - info command
 - license activate/status/deactivate commands
+- medical command helpers
 - Error handling and edge cases
 """
 
@@ -289,6 +290,82 @@ class TestDecryptCommand:
             assert 'Decryption failed' in result.output
 
 
+# =============================================================================
+# BATCH ENCRYPT/DECRYPT COMMAND TESTS
+# =============================================================================
+
+class TestBatchCryptoCommands:
+    """Test encrypt-batch and decrypt-batch commands."""
+
+    def test_encrypt_batch_requires_license(self, runner, sample_file, temp_dir):
+        """Test encrypt-batch requires the batch processing feature."""
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = False
+
+            result = runner.invoke(cli, [
+                'encrypt-batch', str(sample_file),
+                '--out-dir', str(temp_dir / "enc"),
+                '--key-path', str(temp_dir / "test.key")
+            ])
+
+            assert result.exit_code == 1
+            assert 'Batch operations require' in result.output
+
+    def test_batch_roundtrip(self, runner, temp_dir):
+        """Test files encrypted in a batch decrypt back to the originals."""
+        inputs = []
+        for i in range(3):
+            path = temp_dir / f"file{i}.bin"
+            path.write_bytes(bytes([i]) * 1000)
+            inputs.append(str(path))
+        key_path = str(temp_dir / "test.key")
+
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = True
+
+            result = runner.invoke(cli, [
+                'encrypt-batch', *inputs,
+                '--out-dir', str(temp_dir / "enc"),
+                '--key-path', key_path, '--workers', '2'
+            ])
+            assert result.exit_code == 0
+            assert 'Processed 3/3' in result.output
+
+            encrypted = sorted(str(p) for p in (temp_dir / "enc").glob('*.enc'))
+            result = runner.invoke(cli, [
+                'decrypt-batch', *encrypted,
+                '--out-dir', str(temp_dir / "dec"),
+                '--key-path', key_path
+            ])
+            assert result.exit_code == 0
+
+        for i in range(3):
+            assert (temp_dir / "dec" / f"file{i}.bin").read_bytes() == bytes([i]) * 1000
+
+
+    def test_batch_rejects_colliding_outputs(self, runner, temp_dir):
+        """Test inputs sharing a basename are rejected before any work starts."""
+        inputs = []
+        for folder in ("a", "b"):
+            (temp_dir / folder).mkdir()
+            path = temp_dir / folder / "scan.bin"
+            path.write_bytes(b"data")
+            inputs.append(str(path))
+
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = True
+
+            result = runner.invoke(cli, [
+                'encrypt-batch', *inputs,
+                '--out-dir', str(temp_dir / "enc"),
+                '--key-path', str(temp_dir / "test.key")
+            ])
+
+        assert result.exit_code == 1
+        assert 'would all be written to' in result.output
+        assert not (temp_dir / "enc").exists()
+
+
 # =============================================================================
 # UPLOAD COMMAND TESTS (LICENSE GATED)
 # =============================================================================
@@ -639,6 +716,87 @@ class TestFilterImageCommand:
         # Click validates choice before command runs
 
 
+# =============================================================================
+# BATCH-RESIZE COMMAND TESTS
+# =============================================================================
+
+class TestBatchResizeCommand:
+    """Test batch-resize command."""
+
+    def test_batch_resize_requires_license(self, runner, sample_image, temp_dir):
+        """Test batch-resize requires the batch processing feature."""
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = False
+
+            result = runner.invoke(cli, [
+                'batch-resize', str(sample_image),
+                '--output-dir', str(temp_dir / "out"),
+                '--width', '50', '--height', '50'
+            ])
+
+            assert result.exit_code == 1
+            assert 'Batch operations require' in result.output
+
+    def test_batch_resize_reuses_processor(self, runner, temp_dir):
+        """Test all matched files go through a single cached processor."""
+        for name in ('a.png', 'b.png'):
+            (temp_dir / name).write_bytes(b'png')
+
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = True
+
+            with patch('src.cli.media._processor') as mock_processor:
+                result = runner.invoke(cli, [
+                    'batch-resize', str(temp_dir / '*.png'),
+                    '--output-dir', str(temp_dir / "out"),
+                    '--width', '50', '--height', '50', '--no-gpu'
+                ])
+
+                assert result.exit_code == 0
+                assert 'Resized 2/2' in result.output
+                mock_processor.assert_called_once_with(False)
+                assert mock_processor.return_value.resize_image.call_count == 2
+
+
+    def test_batch_resize_creates_output_dir(self, runner, temp_dir):
+        """Test a missing output directory is created before resizing."""
+        (temp_dir / 'a.png').write_bytes(b'png')
+        out_dir = temp_dir / "new" / "out"
+
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = True
+
+            with patch('src.cli.media._processor'):
+                result = runner.invoke(cli, [
+                    'batch-resize', str(temp_dir / '*.png'),
+                    '--output-dir', str(out_dir),
+                    '--width', '50', '--height', '50', '--no-gpu'
+                ])
+
+        assert result.exit_code == 0
+        assert out_dir.is_dir()
+
+    def test_batch_resize_rejects_colliding_outputs(self, runner, temp_dir):
+        """Test images sharing a basename are rejected instead of overwritten."""
+        for folder in ('x', 'y'):
+            (temp_dir / folder).mkdir()
+            (temp_dir / folder / 'scan.png').write_bytes(b'png')
+
+        with patch('src.license_manager.get_license_manager') as mock_getter:
+            mock_getter.return_value.check_feature.return_value = True
+
+            with patch('src.cli.media._processor') as mock_processor:
+                result = runner.invoke(cli, [
+                    'batch-resize', str(temp_dir / '*' / 'scan.png'),
+                    '--output-dir', str(temp_dir / "out"),
+                    '--width', '50', '--height', '50', '--no-gpu'
+                ])
+
+        assert result.exit_code == 1
+        assert 'would all be written to' in result.output
+        mock_processor.return_value.resize_image.assert_not_called()
+
+
 # =============================================================================
 # INFO COMMAND TESTS
 # =============================================================================
@@ -1141,3 +1299,50 @@ class TestEdgeCases:
         ])
 
         assert result.exit_code == 0
+
+
+# =============================================================================
+# Medical Command Helper Tests
+# =============================================================================
+
+class TestMedicalHelpers:
+    """Tests for helpers used by the medical commands."""
+
+    def test_to_uint8_matches_reference_scaling(self):
+        """Test in-place scaling matches the straightforward expression."""
+        import numpy as np
+        from src.cli.medical import _to_uint8
+
+        image = np.random.default_rng(0).normal(100.0, 25.0, (32, 48))
+        expected = ((image - image.min()) / (image.max() - image.min() + 1e-8) * 255).astype(np.uint8)
+
+        result = _to_uint8(image)
+
+        assert result.dtype == np.uint8
+        assert result.shape == image.shape
+        assert np.abs(result.astype(int) - expected.astype(int)).max() <= 1
+
+    def test_to_uint8_constant_image(self):
+        """Test a constant image maps to zeros instead of dividing by zero."""
+        import numpy as np
+        from src.cli.medical import _to_uint8
+
+        result = _to_uint8(np.full((4, 4), 7.0))
+
+        assert not result.any()
+
+    def test_load_grayscale_matches_pil(self, temp_dir):
+        """Test OpenCV grayscale load matches PIL's luma conversion."""
+        import numpy as np
+        from PIL import Image
+        from src.cli.medical import _load_grayscale
+
+        path = temp_dir / "rgb.png"
+        Image.fromarray(np.random.default_rng(0).integers(0, 256, (20, 30, 3), dtype=np.uint8)).save(path)
+        expected = np.array(Image.open(path).convert('L'), dtype=np.float32)
+
+        result = _load_grayscale(str(path))
+
+        assert result.dtype == np.float32
+        assert result.shape == (20, 30)
+        assert np.abs(result - expected).max() <= 1
@@ -21,8 +21,8 @@ def mock_boto3(monkeypatch):
     def mock_boto3_resource(*args, **kwargs):
         return mock_resource
 
-    monkeypatch.setattr('src.cloud_storage.boto3.client', mock_boto3_client)
-    monkeypatch.setattr('src.cloud_storage.boto3.resource', mock_boto3_resource)
+    monkeypatch.setattr('src.cloud.legacy.boto3.client', mock_boto3_client)
+    monkeypatch.setattr('src.cloud.legacy.boto3.resource', mock_boto3_resource)
 
     return {'client': mock_client, 'resource': mock_resource}
 
@@ -85,7 +85,7 @@ class TestUploadFile:
         assert result['remote_key'] == 'test.txt'
         assert 'checksum' in result
         assert 'size' in result
-        mock_boto3['client'].upload_file.assert_called_once()
+        mock_boto3['client'].upload_fileobj.assert_called_once()
 
     def test_upload_file_with_custom_key(self, mock_boto3, tmp_path):
         """Test upload with custom remote key."""
@@ -111,7 +111,7 @@ class TestUploadFile:
 
         assert result['success'] is True
         # Verify metadata was passed to upload
-        call_args = mock_boto3['client'].upload_file.call_args
+        call_args = mock_boto3['client'].upload_fileobj.call_args
         extra_args = call_args[1]['ExtraArgs']
         assert 'custom_key' in extra_args['Metadata']
 
@@ -127,9 +127,9 @@ class TestUploadFile:
         test_file = tmp_path / "test.txt"
         test_file.write_text("test content")
 
-        mock_boto3['client'].upload_file.side_effect = ClientError(
+        mock_boto3['client'].upload_fileobj.side_effect = ClientError(
             {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}},
-            'upload_file'
+            'upload_fileobj'
         )
 
         manager = CloudStorageManager(bucket_name='test-bucket')
@@ -149,6 +149,47 @@ class TestUploadFile:
         assert 'checksum' in result
         assert len(result['checksum']) == 64  # SHA-256 hex length
 
+    def test_upload_small_file_single_read(self, mock_boto3, tmp_path):
+        """Test small files upload the same bytes that were hashed."""
+        import hashlib
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"single pass content")
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        result = manager.upload_file(str(test_file))
+
+        body = mock_boto3['client'].upload_fileobj.call_args[0][0]
+        assert body.getvalue() == b"single pass content"
+        assert result['checksum'] == hashlib.sha256(b"single pass content").hexdigest()
+        mock_boto3['client'].upload_file.assert_not_called()
+
+    def test_upload_file_uses_supplied_size(self, mock_boto3, tmp_path):
+        """Test a caller-supplied size is reported without re-statting."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test content")
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        with patch.object(Path, 'stat', side_effect=AssertionError("unexpected stat")):
+            result = manager.upload_file(str(test_file), file_size=12)
+
+        assert result['success'] is True
+        assert result['size'] == 12
+
+    def test_upload_large_file_streams_from_disk(self, mock_boto3, tmp_path, monkeypatch):
+        """Test files above the single-pass limit are uploaded by path."""
+        monkeypatch.setattr('src.cloud.legacy.SINGLE_PASS_UPLOAD_MAX', 4)
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("larger than four bytes")
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        result = manager.upload_file(str(test_file))
+
+        assert result['success'] is True
+        assert len(result['checksum']) == 64
+        mock_boto3['client'].upload_file.assert_called_once()
+        mock_boto3['client'].upload_fileobj.assert_not_called()
+
 
 class TestDownloadFile:
     """Test download_file functionality."""
@@ -209,6 +250,117 @@ class TestDownloadFile:
         assert 'error' in result
 
 
+    def _mock_ranged_object(self, mock_boto3, content, checksum):
+        """Serve content through head_object and ranged get_object calls."""
+        import io
+
+        mock_boto3['client'].head_object.return_value = {
+            'Metadata': {'checksum': checksum},
+            'ContentLength': len(content),
+            'ETag': '"etag-1"'
+        }
+
+        def get_object(Bucket, Key, Range, **kwargs):
+            start, end = map(int, Range[len('bytes='):].split('-'))
+            return {'Body': io.BytesIO(content[start:end + 1])}
+
+        mock_boto3['client'].get_object.side_effect = get_object
+
+    def test_download_large_file_uses_ranges(self, mock_boto3, tmp_path, monkeypatch):
+        """Test large verified downloads are fetched and hashed by range."""
+        import hashlib
+
+        monkeypatch.setattr('src.cloud.legacy.RANGE_DOWNLOAD_CHUNK', 4)
+        content = b"ranged download content"
+        self._mock_ranged_object(mock_boto3, content, hashlib.sha256(content).hexdigest())
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        download_path = tmp_path / "ranged.bin"
+        result = manager.download_file('remote.bin', str(download_path))
+
+        assert result['success'] is True
+        assert download_path.read_bytes() == content
+        assert mock_boto3['client'].get_object.call_count == 6
+        mock_boto3['client'].download_file.assert_not_called()
+        for call in mock_boto3['client'].get_object.call_args_list:
+            assert call.kwargs['IfMatch'] == '"etag-1"'
+
+    def test_download_ranges_complete_short_writes(self, mock_boto3, tmp_path, monkeypatch):
+        """Test a range is fully written even when pwrite writes partially."""
+        import hashlib
+        import os
+
+        monkeypatch.setattr('src.cloud.legacy.RANGE_DOWNLOAD_CHUNK', 8)
+        content = b"ranged download content"
+        self._mock_ranged_object(mock_boto3, content, hashlib.sha256(content).hexdigest())
+
+        real_pwrite = os.pwrite
+        monkeypatch.setattr(
+            'src.cloud.legacy.os.pwrite',
+            lambda fd, data, offset: real_pwrite(fd, bytes(data[:3]), offset)
+        )
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        download_path = tmp_path / "ranged.bin"
+        result = manager.download_file('remote.bin', str(download_path))
+
+        assert result['success'] is True
+        assert download_path.read_bytes() == content
+
+    def test_download_ranges_failure_leaves_no_partial_file(self, mock_boto3, tmp_path, monkeypatch):
+        """Test a failed range leaves neither a partial file nor its temp file."""
+        import hashlib
+
+        monkeypatch.setattr('src.cloud.legacy.RANGE_DOWNLOAD_CHUNK', 4)
+        content = b"ranged download content"
+        self._mock_ranged_object(mock_boto3, content, hashlib.sha256(content).hexdigest())
+        serve_range = mock_boto3['client'].get_object.side_effect
+
+        def get_object(Bucket, Key, Range, **kwargs):
+            if Range.startswith('bytes=8-'):
+                raise ClientError(
+                    {'Error': {'Code': 'PreconditionFailed', 'Message': 'Changed'}},
+                    'get_object'
+                )
+            return serve_range(Bucket, Key, Range, **kwargs)
+
+        mock_boto3['client'].get_object.side_effect = get_object
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        result = manager.download_file('remote.bin', str(tmp_path / "ranged.bin"))
+
+        assert result['success'] is False
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_ranges_honors_fadvise(self, mock_boto3, tmp_path, monkeypatch):
+        """Test ranged downloads drop the written file from the page cache."""
+        import hashlib
+
+        monkeypatch.setattr('src.cloud.legacy.RANGE_DOWNLOAD_CHUNK', 4)
+        content = b"ranged download content"
+        self._mock_ranged_object(mock_boto3, content, hashlib.sha256(content).hexdigest())
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        with patch('src.cloud.legacy.fadvise_dontneed') as dontneed:
+            result = manager.download_file('remote.bin', str(tmp_path / "ranged.bin"),
+                                           fadvise=True)
+
+        assert result['success'] is True
+        dontneed.assert_called_once()
+
+    def test_download_large_file_checksum_mismatch(self, mock_boto3, tmp_path, monkeypatch):
+        """Test a ranged download with a bad checksum removes the file."""
+        monkeypatch.setattr('src.cloud.legacy.RANGE_DOWNLOAD_CHUNK', 4)
+        self._mock_ranged_object(mock_boto3, b"ranged download content", 'deadbeef')
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        download_path = tmp_path / "ranged.bin"
+
+        with pytest.raises(ValueError, match="Checksum verification failed"):
+            manager.download_file('remote.bin', str(download_path))
+
+        assert not download_path.exists()
+
 class TestDeleteFile:
     """Test delete_file functionality."""
 
@@ -340,6 +492,20 @@ class TestSyncDirectory:
 
         assert result['uploaded_count'] == 2
 
+    def test_sync_directory_skips_dangling_symlink(self, mock_boto3, tmp_path):
+        """Test a dangling symlink is skipped instead of aborting the sync."""
+        (tmp_path / "file.txt").write_text("content")
+        try:
+            (tmp_path / "dangling").symlink_to(tmp_path / "missing.txt")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        manager = CloudStorageManager(bucket_name='test-bucket')
+        result = manager.sync_directory(str(tmp_path))
+
+        assert result['uploaded_count'] == 1
+        assert result['failed_count'] == 0
+
     def test_sync_directory_not_a_directory(self, mock_boto3, tmp_path):
         """Test sync with non-directory path."""
         file_path = tmp_path / "file.txt"
@@ -363,10 +529,10 @@ class TestSyncDirectory:
             if call_count[0] == 2:
                 raise ClientError(
                     {'Error': {'Code': 'Error', 'Message': 'Failed'}},
-                    'upload_file'
+                    'upload_fileobj'
                 )
 
-        mock_boto3['client'].upload_file.side_effect = upload_side_effect
+        mock_boto3['client'].upload_fileobj.side_effect = upload_side_effect
 
         manager = CloudStorageManager(bucket_name='test-bucket')
         result = manager.sync_directory(str(tmp_path))
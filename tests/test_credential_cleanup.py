@@ -221,6 +221,25 @@ class TestCredentialCleanup:
         except ImportError:
             pytest.skip("Dropbox SDK not installed")
 
+    def test_azure_credential_buffer_zeroed_on_del(self):
+        """Test that Azure connector zeroes its credential buffer."""
+        azure_module = pytest.importorskip("src.connectors.azure_blob_connector")
+        if not azure_module.AZURE_AVAILABLE:
+            pytest.skip("azure-storage-blob not installed")
+
+        connector = azure_module.AzureBlobConnector(
+            container_name="test",
+            account_name="testaccount",
+            account_key="fake_account_key"
+        )
+        buf = connector.__dict__['_account_key_buf']
+        assert connector.account_key == "fake_account_key"
+
+        connector.__del__()
+
+        assert bytes(buf) == b"\x00" * len("fake_account_key")
+        assert connector.account_key is None
+
 
 class TestCredentialMemorySafety:
     """Test suite for memory safety of credentials."""
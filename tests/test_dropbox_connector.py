@@ -21,7 +21,7 @@ def dropbox_monkeypatch(monkeypatch):
     metadata = MagicMock()
     metadata.content_hash = 'test_hash'
     file_response = MagicMock()
-    file_response.content = b"Downloaded content"
+    file_response.iter_content.return_value = [b"Downloaded content"]
     mock_dbx_global.files_download.return_value = (metadata, file_response)
     
     # Mock delete result
@@ -73,6 +73,17 @@ def test_encrypt_decrypt(encryptor, sample_file, temp_dir):
     assert sample_file.read_text() == decrypted_file.read_text()
 
 
+def test_encrypt_decrypt_with_fadvise(encryptor, sample_file, temp_dir):
+    """Test page-cache hints do not change the encrypted round trip."""
+    encrypted_file = temp_dir / "encrypted.bin"
+    decrypted_file = temp_dir / "decrypted.txt"
+
+    encryptor.encrypt_file(sample_file, encrypted_file, fadvise=True)
+    encryptor.decrypt_file(encrypted_file, decrypted_file, fadvise=True)
+
+    assert sample_file.read_text() == decrypted_file.read_text()
+
+
 def test_secure_delete(encryptor, temp_dir):
     """Test secure file deletion."""
     test_file = temp_dir / "to_delete.txt"
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 import tempfile
+from unittest.mock import MagicMock, patch
 import numpy as np
 from PIL import Image
 
@@ -107,3 +108,40 @@ def test_get_device_info(processor):
     assert 'device' in info
     assert 'name' in info
     assert info['device'] in ['CPU', 'GPU']
+
+
+def test_probe_device_matches_processor():
+    """Test the standalone probe reports the same device as a processor."""
+    from src.gpu_processor import probe_device
+
+    info = probe_device()
+    processor_info = GPUMediaProcessor().get_device_info()
+
+    assert info['device'] == processor_info['device']
+    assert info['name'] == processor_info['name']
+
+
+def test_probe_device_reads_cuda_through_nvml():
+    """Test the probe describes CUDA devices without creating a CUDA context."""
+    import sys
+    from src.processing import gpu
+
+    mock_torch = MagicMock()
+    mock_torch.cuda.is_available.return_value = True
+    mock_torch.cuda.memory_allocated.return_value = 0
+    mock_torch.cuda.memory_reserved.return_value = 0
+    mock_torch.version.cuda = '12.1'
+    nvml = MagicMock()
+    nvml.nvmlDeviceGetName.return_value = b'NVIDIA RTX 4090'
+    nvml.nvmlDeviceGetMemoryInfo.return_value.total = 24e9
+
+    with patch.multiple(gpu, torch=mock_torch, TORCH_AVAILABLE=True), \
+            patch.dict(sys.modules, {'pynvml': nvml}):
+        info = gpu.probe_device()
+
+    assert info['device'] == 'CUDA'
+    assert info['name'] == 'NVIDIA RTX 4090'
+    assert info['memory_total'] == 24.0
+    mock_torch.cuda.get_device_properties.assert_not_called()
+    mock_torch.cuda.get_device_name.assert_not_called()
+    nvml.nvmlShutdown.assert_called_once()
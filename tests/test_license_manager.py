@@ -312,6 +312,46 @@ class TestLicenseManager:
         retrieved = manager.get_active_license()
         assert retrieved is None
 
+    def test_get_active_license_is_cached(self, manager):
+        """Test the license file is parsed once until it changes."""
+        license = manager.create_license(
+            email="test@example.com",
+            license_type=LicenseType.PRO
+        )
+        manager._save_license(license)
+
+        first = manager.get_active_license()
+        with patch.object(Path, 'read_bytes', side_effect=AssertionError("re-read")):
+            second = manager.get_active_license()
+
+        assert second is first
+
+    def test_get_active_license_reloads_after_save(self, manager):
+        """Test saving a new license invalidates the cached one."""
+        manager._save_license(manager.create_license(
+            email="first@example.com",
+            license_type=LicenseType.PRO
+        ))
+        assert manager.get_active_license().email == "first@example.com"
+
+        manager._save_license(manager.create_license(
+            email="second@example.com",
+            license_type=LicenseType.PRO
+        ))
+        assert manager.get_active_license().email == "second@example.com"
+
+    def test_get_active_license_without_orjson(self, manager):
+        """Test the stdlib json fallback reads and writes licenses."""
+        with patch('src.licensing.manager.ORJSON_AVAILABLE', False):
+            license = manager.create_license(
+                email="test@example.com",
+                license_type=LicenseType.PRO
+            )
+            manager._save_license(license)
+            retrieved = manager.get_active_license()
+
+        assert retrieved.license_key == license.license_key
+
     def test_deactivate_license(self, manager):
         """Test deactivating license."""
         # Save a license first
@@ -416,7 +456,7 @@ class TestRequireFeatureDecorator:
         manager._save_license(license)
 
         # Mock global manager
-        with patch('src.license_manager.get_license_manager', return_value=manager):
+        with patch('src.licensing.manager.get_license_manager', return_value=manager):
             @require_feature(FeatureFlags.CLOUD_STORAGE)
             def test_function():
                 return "success"
@@ -176,6 +176,53 @@ class TestDICOMProcessor:
         # Original should be unchanged
         assert len(processor._audit_log) == 1
 
+    @staticmethod
+    def _compressed_slices(pixel_representation):
+        """Build JPEG 2000 slice headers with the given pixel signedness."""
+        pytest.importorskip('pydicom')
+        from pydicom.dataset import Dataset, FileMetaDataset
+
+        slices = []
+        for _ in range(2):
+            ds = Dataset()
+            ds.file_meta = FileMetaDataset()
+            ds.file_meta.TransferSyntaxUID = '1.2.840.10008.1.2.4.90'
+            ds.Rows = ds.Columns = 2
+            ds.SamplesPerPixel = 1
+            ds.PhotometricInterpretation = 'MONOCHROME2'
+            ds.PixelRepresentation = pixel_representation
+            ds.PixelData = b'encapsulated'
+            slices.append(ds)
+        return slices
+
+    def test_gpu_decode_skips_signed_series(self):
+        """Test signed pixel data is left to pydicom instead of the GPU."""
+        dicom = pytest.importorskip('src.medical.dicom')
+
+        slices = self._compressed_slices(pixel_representation=1)
+        with patch.object(dicom, 'NVIMGCODEC_AVAILABLE', True), \
+                patch.object(dicom, 'nvimgcodec') as mock_codec:
+            assert dicom._decode_series_gpu(slices) is None
+            mock_codec.Decoder.assert_not_called()
+
+    def test_gpu_decode_accepts_unsigned_monochrome2(self):
+        """Test unsigned MONOCHROME2 series are decoded on the GPU."""
+        dicom = pytest.importorskip('src.medical.dicom')
+
+        slices = self._compressed_slices(pixel_representation=0)
+        with patch.object(dicom, 'NVIMGCODEC_AVAILABLE', True), \
+                patch.object(dicom, 'nvimgcodec') as mock_codec, \
+                patch('pydicom.encaps.generate_frames',
+                      side_effect=lambda data: iter([b'frame']), create=True):
+            mock_codec.Decoder.return_value.decode.return_value = [
+                Mock(cpu=Mock(return_value=np.zeros(4, dtype=np.uint16)))
+                for _ in slices
+            ]
+            decoded = dicom._decode_series_gpu(slices)
+
+        assert decoded is not None
+        assert decoded[0].shape == (2, 2)
+
     @patch('src.dicom_processor.PYDICOM_AVAILABLE', False)
     def test_read_dicom_without_pydicom(self):
         """Test error when pydicom not available."""
@@ -331,6 +378,29 @@ class TestMedicalImagePreprocessor:
         assert 'normalize_zscore' in result.steps_applied
 
 
+    def test_cucim_imported_on_first_gpu_use(self):
+        """Test CuPy/cuCIM are imported when GPU CLAHE is first requested."""
+        import sys
+        preprocessing = pytest.importorskip('src.medical.preprocessing')
+
+        fake_cupy = Mock()
+        fake_skimage = Mock()
+        preprocessing._load_cucim.cache_clear()
+        try:
+            with patch.dict(sys.modules, {
+                'cupy': fake_cupy,
+                'cucim': Mock(),
+                'cucim.skimage': fake_skimage,
+            }):
+                assert preprocessing.cp is None
+                assert preprocessing._load_cucim() is True
+                assert preprocessing.cp is fake_cupy
+                assert preprocessing.cucim_exposure is fake_skimage.exposure
+        finally:
+            preprocessing._load_cucim.cache_clear()
+            preprocessing.cp = preprocessing.cucim_exposure = None
+
+
 class TestBreastMRIPreprocessor:
     """Test BreastMRIPreprocessor class."""
 
@@ -483,6 +553,217 @@ class TestMLInference:
             ONNXInference(config)
 
 
+class TestModelQuantization:
+    """Test reduced-precision model loading with mocked backends."""
+
+    @pytest.fixture
+    def torch_loaders(self):
+        """Return the loaders module with torch replaced by a mock."""
+        loaders = pytest.importorskip('src.medical.inference.loaders')
+        mock_torch = MagicMock()
+        mock_torch.device.side_effect = lambda kind: Mock(type=kind)
+        with patch.multiple(loaders, torch=mock_torch, nn=MagicMock(), TORCH_AVAILABLE=True):
+            yield loaders, mock_torch
+
+    @pytest.fixture
+    def onnx_loaders(self):
+        """Return the loaders module with ONNX Runtime reported available."""
+        loaders = pytest.importorskip('src.medical.inference.loaders')
+        with patch.object(loaders, 'ONNX_AVAILABLE', True):
+            yield loaders
+
+    @staticmethod
+    def _pytorch_inference(loaders, model_path, use_gpu, quantization,
+                           model_type=None):
+        """Build a PyTorchInference for a model file and load it."""
+        from src.medical.inference.config import ModelConfig, ModelType
+
+        config = ModelConfig(
+            model_path=str(model_path),
+            model_type=model_type or ModelType.PYTORCH,
+            use_gpu=use_gpu,
+            quantization=quantization
+        )
+        inference = loaders.PyTorchInference(config)
+        inference.load_model()
+        return inference
+
+    def test_int8_quantizes_on_cpu(self, torch_loaders, tmp_path):
+        """Test int8 moves a GPU model to CPU and quantizes its Linear layers."""
+        from src.medical.inference.config import QuantizationMode
+
+        loaders, mock_torch = torch_loaders
+        mock_torch.cuda.is_available.return_value = True
+        model_path = tmp_path / "model.pt"
+        model_path.write_bytes(b"weights")
+
+        inference = self._pytorch_inference(loaders, model_path, True, QuantizationMode.INT8)
+
+        model = mock_torch.load.return_value
+        model.to.assert_called_once_with(inference.device)
+        assert inference.device.type == 'cpu'
+        mock_torch.ao.quantization.quantize_dynamic.assert_called_once_with(
+            model, {loaders.nn.Linear}, dtype=mock_torch.qint8
+        )
+        assert inference.model is mock_torch.ao.quantization.quantize_dynamic.return_value
+
+    def test_int8_rejects_torchscript(self, torch_loaders, tmp_path):
+        """Test int8 is refused for TorchScript models quantize_dynamic cannot handle."""
+        from src.medical.inference.config import ModelType, QuantizationMode
+
+        loaders, mock_torch = torch_loaders
+        model_path = tmp_path / "model.pt"
+        model_path.write_bytes(b"weights")
+
+        with pytest.raises(ValueError, match="TorchScript"):
+            self._pytorch_inference(loaders, model_path, False, QuantizationMode.INT8,
+                                    model_type=ModelType.TORCHSCRIPT)
+
+        mock_torch.jit.load.assert_not_called()
+        mock_torch.ao.quantization.quantize_dynamic.assert_not_called()
+
+    def test_fp16_halves_gpu_model(self, torch_loaders, tmp_path):
+        """Test fp16 converts weights only when running on the GPU."""
+        from src.medical.inference.config import QuantizationMode
+
+        loaders, mock_torch = torch_loaders
+        mock_torch.cuda.is_available.return_value = True
+        model_path = tmp_path / "model.pt"
+        model_path.write_bytes(b"weights")
+
+        inference = self._pytorch_inference(loaders, model_path, True, QuantizationMode.FP16)
+        mock_torch.load.return_value.half.assert_called_once()
+        assert inference.half_precision is True
+
+        mock_torch.load.reset_mock()
+        inference = self._pytorch_inference(loaders, model_path, False, QuantizationMode.FP16)
+        mock_torch.load.return_value.half.assert_not_called()
+        assert inference.half_precision is False
+
+    def test_preprocess_pins_only_cuda_inputs(self, torch_loaders):
+        """Test inputs are page-locked for async copies to CUDA but not on CPU."""
+        from src.medical.inference.config import ModelConfig
+
+        loaders, mock_torch = torch_loaders
+        image = np.zeros((4, 4), dtype=np.float32)
+
+        mock_torch.cuda.is_available.return_value = True
+        inference = loaders.PyTorchInference(ModelConfig(
+            model_path="model.pt", use_gpu=True, normalize_input=False
+        ))
+        tensor = mock_torch.from_numpy.return_value
+        result = inference._preprocess(image)
+
+        assert inference.device.type == 'cuda'
+        tensor.pin_memory.assert_called_once_with()
+        tensor.pin_memory.return_value.to.assert_called_once_with(
+            inference.device, non_blocking=True
+        )
+        assert result is tensor.pin_memory.return_value.to.return_value
+
+        mock_torch.from_numpy.reset_mock()
+        inference = loaders.PyTorchInference(ModelConfig(
+            model_path="model.pt", use_gpu=False, normalize_input=False
+        ))
+        result = inference._preprocess(image)
+
+        assert inference.device.type == 'cpu'
+        tensor.pin_memory.assert_not_called()
+        tensor.to.assert_called_once_with(inference.device)
+        assert result is tensor.to.return_value
+
+    def test_onnx_int8_written_next_to_model(self, onnx_loaders, tmp_path):
+        """Test int8 ONNX models are written to <stem>.int8.onnx."""
+        from src.medical.inference.config import ModelConfig, ModelType, QuantizationMode
+
+        model_path = tmp_path / "model.onnx"
+        model_path.write_bytes(b"graph")
+        quantization = MagicMock()
+        inference = onnx_loaders.ONNXInference(ModelConfig(
+            model_path=str(model_path), model_type=ModelType.ONNX,
+            quantization=QuantizationMode.INT8
+        ))
+
+        with patch.dict('sys.modules', {'onnxruntime': MagicMock(),
+                                        'onnxruntime.quantization': quantization}):
+            quantized_path = inference._quantized_model_path(model_path)
+
+        assert quantized_path == tmp_path / "model.int8.onnx"
+        quantization.quantize_dynamic.assert_called_once_with(
+            str(model_path), str(quantized_path),
+            weight_type=quantization.QuantType.QInt8
+        )
+
+    def test_onnx_fp16_written_next_to_model(self, onnx_loaders, tmp_path):
+        """Test fp16 ONNX models are converted once and then reused."""
+        from src.medical.inference.config import ModelConfig, ModelType, QuantizationMode
+
+        model_path = tmp_path / "model.onnx"
+        model_path.write_bytes(b"graph")
+        onnx, converter = MagicMock(), MagicMock()
+        inference = onnx_loaders.ONNXInference(ModelConfig(
+            model_path=str(model_path), model_type=ModelType.ONNX,
+            quantization=QuantizationMode.FP16
+        ))
+
+        with patch.dict('sys.modules', {'onnx': onnx, 'onnxconverter_common': converter}):
+            quantized_path = inference._quantized_model_path(model_path)
+            converted = converter.float16.convert_float_to_float16.return_value
+            onnx.save.assert_called_once_with(converted, str(tmp_path / "model.fp16.onnx"))
+
+            # A converted copy newer than the original is reused as-is
+            quantized_path.write_bytes(b"fp16 graph")
+            assert inference._quantized_model_path(model_path) == quantized_path
+            onnx.save.assert_called_once()
+
+
+class TestONNXSessionOptions:
+    """Test ONNX Runtime session setup with a mocked runtime."""
+
+    def _load(self, tmp_path, use_gpu, available_providers):
+        """Load a single-shot ONNX model and return the mocked runtime."""
+        loaders = pytest.importorskip('src.medical.inference.loaders')
+        from src.medical.inference.config import ModelConfig, ModelType
+
+        model_path = tmp_path / "model.onnx"
+        model_path.write_bytes(b"graph")
+        ort = MagicMock()
+        ort.get_available_providers.return_value = available_providers
+
+        with patch.object(loaders, 'ONNX_AVAILABLE', True), \
+                patch.dict('sys.modules', {'onnxruntime': ort}):
+            loaders.ONNXInference(ModelConfig(
+                model_path=str(model_path), model_type=ModelType.ONNX,
+                use_gpu=use_gpu, ort_single_shot=True
+            )).load_model()
+
+        return ort
+
+    def test_single_shot_gpu_falls_back_to_cpu_options(self, tmp_path):
+        """Test a GPU request without CUDA still drops the CPU memory arena."""
+        ort = self._load(tmp_path, True, ['CPUExecutionProvider'])
+
+        options = ort.SessionOptions.return_value
+        assert ort.InferenceSession.call_args.kwargs['providers'] == ['CPUExecutionProvider']
+        assert ort.InferenceSession.call_args.kwargs['sess_options'] is options
+        assert options.enable_cpu_mem_arena is False
+        options.add_session_config_entry.assert_called_once_with(
+            'session.use_device_allocator_for_initializers', '1'
+        )
+
+    def test_single_shot_cuda_sizes_arena_per_request(self, tmp_path):
+        """Test a CUDA session grows its arena only as far as each run asks."""
+        ort = self._load(tmp_path, True, ['CUDAExecutionProvider', 'CPUExecutionProvider'])
+
+        options = ort.SessionOptions.return_value
+        assert ort.InferenceSession.call_args.kwargs['providers'] == [
+            ('CUDAExecutionProvider', {'arena_extend_strategy': 'kSameAsRequested'}),
+            'CPUExecutionProvider'
+        ]
+        assert options.enable_cpu_mem_arena is not False
+        options.add_session_config_entry.assert_not_called()
+
+
 class TestModelEnsemble:
     """Test ModelEnsemble class."""
 
@@ -577,6 +858,42 @@ class TestMedicalCLI:
         assert 'DICOM Support' in result.output
         assert 'ML Inference' in result.output
 
+    def test_input_path_errors_become_bad_parameter(self, tmp_path):
+        """Test unreadable inputs are reported as usage errors, not tracebacks."""
+        import click
+        from src.cli.medical import _input_is_dir
+
+        file_path = tmp_path / "scan.dcm"
+        file_path.write_bytes(b"data")
+
+        with pytest.raises(click.BadParameter, match="does not exist"):
+            _input_is_dir(str(tmp_path / "missing"), "INPUT")
+        with pytest.raises(click.BadParameter, match="cannot be accessed"):
+            _input_is_dir(str(file_path / "child"), "INPUT")
+        assert _input_is_dir(str(tmp_path), "INPUT") is True
+
+    def test_missing_inputs_reported_alike(self, tmp_path):
+        """Test every medical command rejects a missing input the same way."""
+        from src.cli import cli
+        from click.testing import CliRunner
+
+        missing = str(tmp_path / "missing.dcm")
+        out = str(tmp_path / "out")
+        runner = CliRunner()
+
+        def invoke(*args):
+            result = runner.invoke(cli, ['medical', *args])
+            assert result.exit_code == 2, args
+            assert f"Path '{missing}' does not exist." in result.output
+
+        invoke('predict', missing, '--model', missing)
+        invoke('segment', missing, out)
+        invoke('evaluate', missing, missing)
+
+        pytest.importorskip('src.dicom_processor')
+        with patch('src.dicom_processor.check_dicom_available', return_value=True):
+            invoke('anonymize', missing, out)
+
     def test_dicom_info_without_pydicom(self):
         """Test dicom-info command fails gracefully without pydicom."""
         from src.cli import cli
@@ -612,3 +929,32 @@ class TestMedicalCLI:
         assert result.exit_code == 0
         assert '--model' in result.output
         assert 'required' in result.output.lower() or 'PATH' in result.output
+
+    def test_serve_reuses_pipeline_for_each_path(self, tmp_path):
+        """Test serve loads the model once and predicts every stdin path."""
+        from src.cli import cli
+        from click.testing import CliRunner
+
+        model_path = tmp_path / "model.onnx"
+        model_path.write_bytes(b"model")
+
+        pipeline = MagicMock()
+        pipeline.predict_from_dicom.return_value = {
+            'final_probability': 0.9,
+            'predicted_label': 'Cancer'
+        }
+
+        runner = CliRunner()
+        with patch('src.cli.medical._check_model_runtime', return_value=False), \
+             patch('src.cli.medical._get_pipeline', return_value=pipeline) as get_pipeline:
+            result = runner.invoke(
+                cli,
+                ['medical', 'serve', '--model', str(model_path), '--model-type', 'onnx'],
+                input="a.dcm\n\nb.dcm\n"
+            )
+
+        assert result.exit_code == 0
+        get_pipeline.assert_called_once_with(str(model_path), 'onnx', False, 'none')
+        assert pipeline.predict_from_dicom.call_count == 2
+        assert "a.dcm\tCancer\t90.0%" in result.output
+        assert "b.dcm\tCancer\t90.0%" in result.output
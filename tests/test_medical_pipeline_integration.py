@@ -269,6 +269,25 @@ class TestKeyExchange:
         keys = km.list_keys()
         assert len(keys) == 2
 
+    def test_shared_key_reuses_unwrapped_private_key(self, temp_workspace):
+        """Test repeated exchanges decrypt the stored private key once."""
+        from src.core import KeyExchangeManager, KeyType
+
+        km = KeyExchangeManager(
+            key_store_path=os.path.join(temp_workspace, "keys")
+        )
+        local_id = km.generate_key_pair(key_type=KeyType.ECDH_P384)
+        remote_a = km.export_public_key(km.generate_key_pair(key_type=KeyType.ECDH_P384))
+        remote_b = km.export_public_key(km.generate_key_pair(key_type=KeyType.ECDH_P384))
+
+        with patch.object(km, '_decrypt_key_material',
+                          wraps=km._decrypt_key_material) as mock_decrypt:
+            key_a = km.derive_shared_key(local_id, remote_a)
+            key_b = km.derive_shared_key(local_id, remote_b)
+
+        assert mock_decrypt.call_count == 1
+        assert key_a.key_material != key_b.key_material
+
 
 class TestSecureDeletion:
     """Tests for secure file deletion."""
@@ -8,6 +8,8 @@ from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import os
+import io
+import hashlib
 import json
 
 
@@ -105,6 +107,162 @@ class TestOneDriveConnector:
         assert connector._connected is True
         assert connector.drive_id == 'drive-123'
 
+    def test_connectors_share_https_adapter(self, mock_requests):
+        """Test sessions mount one pooled adapter and leave it open."""
+        mock_req, mock_session = mock_requests
+
+        from src.connectors.onedrive_connector import OneDriveConnector
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': 'drive-123'}
+        mock_session.get.return_value = mock_response
+
+        first = OneDriveConnector(client_id="test-id", access_token="token-1")
+        second = OneDriveConnector(client_id="test-id", access_token="token-2")
+        assert first.connect() and second.connect()
+
+        adapters = [c.args[1] for c in mock_session.mount.call_args_list]
+        assert len(adapters) == 2
+        assert adapters[0] is adapters[1]
+
+        first.disconnect()
+        mock_session.adapters.pop.assert_called_with("https://", None)
+
+    def test_requests_reuse_one_keep_alive_session(self, connector, mock_requests):
+        """Test consecutive calls share the session opened at connect time."""
+        mock_req, mock_session = mock_requests
+
+        delete_response = Mock()
+        delete_response.status_code = 204
+        mock_session.delete.return_value = delete_response
+
+        connector.delete_file("a.txt")
+        connector.delete_file("b.txt")
+
+        assert mock_session.delete.call_count == 2
+        assert connector._session is mock_session
+        mock_req.Session.assert_not_called()
+
+    def test_http2_response_stream_reads_across_chunks(self):
+        """Test the HTTP/2 download stream refills reads from body chunks."""
+        from src.connectors.onedrive_connector import _ResponseStream
+
+        stream = _ResponseStream([b"abc", b"", b"defg"])
+        buffer = bytearray(5)
+        view = memoryview(buffer)
+
+        assert stream.readinto(view) == 3
+        assert stream.readinto(view) == 4
+        assert bytes(buffer[:4]) == b"defg"
+        assert stream.readinto(view) == 0
+
+    def test_http2_put_streams_hashing_reader(self):
+        """Test an HTTP/2 upload streams a file body and hashes it on the way."""
+        from src.connectors.onedrive_connector import _Http2Session, _HashingReader
+
+        content = b"x" * 100
+        session = object.__new__(_Http2Session)
+        session._client = Mock()
+        sent = {}
+
+        def put(url, content, **kwargs):
+            sent.update(body=b"".join(content), headers=kwargs['headers'])
+            return Mock(status_code=201, headers={})
+
+        session._client.put.side_effect = put
+
+        reader = _HashingReader(io.BytesIO(content), len(content))
+        session.put("https://graph/item:/content", data=reader)
+
+        assert sent['body'] == content
+        assert sent['headers']['Content-Length'] == "100"
+        assert reader.hexdigest() == hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def _http2_session(*statuses, retry_after=None):
+        """Build an HTTP/2 session whose client answers with the given statuses."""
+        from src.connectors.onedrive_connector import _Http2Session
+
+        session = object.__new__(_Http2Session)
+        session._client = Mock()
+        headers = {'Retry-After': retry_after} if retry_after else {}
+        responses = [Mock(status_code=status, headers=headers) for status in statuses]
+        for method in ('get', 'put', 'post', 'delete'):
+            getattr(session._client, method).side_effect = list(responses)
+        return session, responses
+
+    def test_http2_retries_throttled_requests(self):
+        """Test HTTP/2 requests honor a capped Retry-After on a 429."""
+        from src.connectors.onedrive_connector import RETRY_AFTER_MAX
+
+        session, responses = self._http2_session(429, 200, retry_after='1200')
+
+        with patch('src.connectors.onedrive_connector.time.sleep') as sleep:
+            response = session.get("https://graph/me/drive")
+
+        assert response is responses[1]
+        sleep.assert_called_once_with(RETRY_AFTER_MAX)
+        responses[0].close.assert_called_once()
+
+    def test_http2_retry_rewinds_streamed_upload(self):
+        """Test a retried HTTP/2 upload resends the whole file body."""
+        from src.connectors.onedrive_connector import _HashingReader
+
+        session, _ = self._http2_session()
+        bodies = []
+        answers = iter([Mock(status_code=503, headers={}), Mock(status_code=201, headers={})])
+
+        def put(url, content, **kwargs):
+            bodies.append(b"".join(content))
+            return next(answers)
+
+        session._client.put.side_effect = put
+        reader = _HashingReader(io.BytesIO(b"payload"), 7)
+
+        with patch('src.connectors.onedrive_connector.time.sleep'):
+            response = session.put("https://graph/item:/content", data=reader)
+
+        assert response.status_code == 201
+        assert bodies == [b"payload", b"payload"]
+        assert reader.hexdigest() == hashlib.sha256(b"payload").hexdigest()
+
+    def test_http2_only_resends_throttled_posts(self):
+        """Test HTTP/2 POSTs are retried only on 429 with Retry-After."""
+        session, responses = self._http2_session(503, 200)
+        with patch('src.connectors.onedrive_connector.time.sleep') as sleep:
+            assert session.post("https://graph/copy") is responses[0]
+        sleep.assert_not_called()
+
+        session, responses = self._http2_session(429, 202, retry_after='2')
+        with patch('src.connectors.onedrive_connector.time.sleep') as sleep:
+            assert session.post("https://graph/copy") is responses[1]
+        sleep.assert_called_once_with(2.0)
+
+    def test_retry_policy_caps_retry_after(self):
+        """Test throttling waits follow Retry-After up to the cap."""
+        from src.connectors.onedrive_connector import _shared_adapter, RETRY_AFTER_MAX
+
+        retries = _shared_adapter(4).max_retries
+        throttled = Mock()
+        throttled.headers = {'Retry-After': '1200'}
+
+        assert retries.respect_retry_after_header is True
+        assert retries.get_retry_after(throttled) == RETRY_AFTER_MAX
+
+    def test_retry_policy_only_resends_throttled_posts(self):
+        """Test non-idempotent POSTs are retried only on 429 with Retry-After."""
+        from src.connectors.onedrive_connector import _shared_adapter
+
+        retries = _shared_adapter(4).max_retries
+
+        assert retries.is_retry("GET", 503) is True
+        assert retries.is_retry("PUT", 429) is True
+        assert retries.is_retry("POST", 503) is False
+        assert retries.is_retry("POST", 429) is False
+        assert retries.is_retry("POST", 429, has_retry_after=True) is True
+        assert 'POST' not in retries.allowed_methods
+
     def test_connect_failure(self, mock_requests):
         """Test connection failure."""
         mock_req, mock_session = mock_requests
@@ -176,6 +334,198 @@ class TestOneDriveConnector:
         finally:
             os.unlink(temp_path)
 
+    def test_upload_small_file_streams_and_hashes_body(self, connector):
+        """Test small uploads stream the file handle and hash what is sent."""
+        content = b"small test content" * 1000
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        sent = []
+
+        def put(url, data=None, headers=None):
+            assert len(data) == len(content)
+            sent.append(b"".join(iter(lambda: data.read(4096), b"")))
+            response = Mock(status_code=201)
+            response.json.return_value = {'id': 'item-123'}
+            return response
+
+        try:
+            connector._session.put.side_effect = put
+
+            result = connector.upload_file(temp_path, "remote/test.txt")
+
+            assert result['success'] is True
+            assert sent == [content]
+            assert result['checksum'] == hashlib.sha256(content).hexdigest()
+            assert result['size'] == len(content)
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_skips_unchanged_file(self, connector):
+        """Test upload is skipped when the remote SHA-256 already matches."""
+        content = b"unchanged scan"
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            metadata_response = Mock(status_code=200)
+            metadata_response.json.return_value = {
+                'id': 'item-1',
+                'eTag': '"etag-1"',
+                'file': {'hashes': {'sha256Hash': hashlib.sha256(content).hexdigest().upper()}}
+            }
+            connector._session.get.return_value = metadata_response
+
+            result = connector.upload_file(temp_path, "remote/scan.dcm", skip_unchanged=True)
+
+            assert result['success'] is True
+            assert result['skipped'] is True
+            connector._session.put.assert_not_called()
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_changed_file_replaces_compared_version(self, connector):
+        """Test a changed file is uploaded with If-Match on the remote eTag."""
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"new contents")
+            temp_path = f.name
+
+        try:
+            metadata_response = Mock(status_code=200)
+            metadata_response.json.return_value = {
+                'id': 'item-1',
+                'eTag': '"etag-1"',
+                'file': {'hashes': {'sha256Hash': 'ABC123'}}
+            }
+            connector._session.get.return_value = metadata_response
+            upload_response = Mock(status_code=200)
+            upload_response.json.return_value = {'id': 'item-1'}
+            connector._session.put.return_value = upload_response
+
+            result = connector.upload_file(temp_path, "remote/scan.dcm", skip_unchanged=True)
+
+            assert result['success'] is True
+            assert 'skipped' not in result
+            headers = connector._session.put.call_args.kwargs['headers']
+            assert headers['If-Match'] == '"etag-1"'
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_large_file_hashes_uploaded_chunks(self, connector):
+        """Test resumable upload checksums the bytes it sends."""
+        content = b"x" * (5 * 1024 * 1024)
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            session_response = Mock()
+            session_response.status_code = 200
+            session_response.json.return_value = {'uploadUrl': 'https://upload.example/session'}
+            connector._session.post.return_value = session_response
+            chunk_response = Mock()
+            chunk_response.status_code = 201
+            connector._session.put.return_value = chunk_response
+
+            with patch.object(connector, '_calculate_checksum') as mock_checksum:
+                result = connector.upload_file(temp_path, "remote/large.bin")
+                mock_checksum.assert_not_called()
+
+            assert result['success'] is True
+            assert result['checksum'] == hashlib.sha256(content).hexdigest()
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_multi_chunk_file_hash_matches_content(self, connector):
+        """Test background hashing sees every chunk before its buffer is reused."""
+        content = os.urandom(25 * 1024 * 1024)
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            session_response = Mock(status_code=200)
+            session_response.json.return_value = {'uploadUrl': 'https://upload.example/session'}
+            connector._session.post.return_value = session_response
+            connector._session.put.return_value = Mock(status_code=202)
+
+            result = connector.upload_file(temp_path, "remote/large.bin")
+
+            assert result['success'] is True
+            assert connector._session.put.call_count == 3
+            assert result['checksum'] == hashlib.sha256(content).hexdigest()
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_large_file_sends_chunks_in_order(self, connector):
+        """Test read-ahead still sends fragments sequentially."""
+        mib = 1024 * 1024
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"a" * (10 * mib) + b"b" * (2 * mib))
+            temp_path = f.name
+
+        try:
+            session_response = Mock()
+            session_response.status_code = 200
+            session_response.json.return_value = {'uploadUrl': 'https://upload.example/session'}
+            connector._session.post.return_value = session_response
+            chunk_response = Mock()
+            chunk_response.status_code = 202
+            connector._session.put.return_value = chunk_response
+
+            result = connector.upload_file(temp_path, "remote/large.bin")
+
+            assert result['success'] is True
+            ranges = [c.kwargs['headers']['Content-Range']
+                      for c in connector._session.put.call_args_list]
+            assert ranges == [
+                f"bytes 0-{10 * mib - 1}/{12 * mib}",
+                f"bytes {10 * mib}-{12 * mib - 1}/{12 * mib}",
+            ]
+            assert connector._session.put.call_args_list[1].kwargs['data'] == b"b" * (2 * mib)
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_upload_files_batches_small_files(self, connector, tmp_path):
+        """Test small files share a $batch request with base64 bodies."""
+        import base64
+
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"small{i}.txt"
+            path.write_bytes(f"content {i}".encode())
+            paths.append(path)
+
+        batch_response = Mock()
+        batch_response.status_code = 200
+        batch_response.json.return_value = {'responses': [
+            {'id': '0', 'status': 201, 'body': {'id': 'item-0'}},
+            {'id': '1', 'status': 507},
+            {'id': '2', 'status': 200, 'body': {'id': 'item-2'}},
+        ]}
+        connector._session.post.return_value = batch_response
+
+        results = connector.upload_files([(p, f"remote/{p.name}") for p in paths])
+
+        assert connector._session.post.call_count == 1
+        sent = connector._session.post.call_args.kwargs['json']['requests']
+        assert sent[0]['method'] == 'PUT'
+        assert sent[0]['url'] == '/drives/drive-123/root:/remote/small0.txt:/content'
+        assert base64.b64decode(sent[0]['body']) == b"content 0"
+        assert results[0]['item_id'] == 'item-0'
+        assert results[0]['checksum'] == hashlib.sha256(b"content 0").hexdigest()
+        assert results[1]['success'] is False
+        assert results[2]['success'] is True
+        connector._session.put.assert_not_called()
+
     def test_download_file_success(self, connector):
         """Test successful file download."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -184,13 +534,14 @@ class TestOneDriveConnector:
             # Mock download response
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.iter_content.return_value = [b"test content"]
+            mock_response.raw = io.BytesIO(b"test content")
             connector._session.get.return_value = mock_response
 
             result = connector.download_file("remote/test.txt", str(local_path))
 
             assert result['success'] is True
-            assert local_path.exists()
+            assert local_path.read_bytes() == b"test content"
+            assert result['checksum'] == hashlib.sha256(b"test content").hexdigest()
 
     def test_download_file_not_found(self, connector):
         """Test download of non-existent file."""
@@ -206,6 +557,28 @@ class TestOneDriveConnector:
 
             assert result['success'] is False
             assert 'not found' in result['error'].lower()
+            mock_response.close.assert_called_once()
+
+    def test_download_file_error_reads_streamed_http2_body(self, connector):
+        """Test a failed HTTP/2 download reads the streamed body before its text."""
+        from src.connectors.onedrive_connector import _Http2Session
+
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.read.side_effect = lambda: setattr(mock_response, 'text', 'boom')
+        del mock_response.text
+        session = object.__new__(_Http2Session)
+        session.get = Mock(return_value=mock_response)
+        connector._session = session
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = connector.download_file("remote/test.txt",
+                                             str(Path(temp_dir) / "out.txt"))
+
+        assert result['success'] is False
+        assert result['error'] == "Download failed: 500 - boom"
+        mock_response.read.assert_called_once()
+        mock_response.close.assert_called_once()
 
     def test_delete_file_success(self, connector):
         """Test successful file deletion."""
@@ -228,6 +601,33 @@ class TestOneDriveConnector:
         assert result['success'] is True
         assert 'warning' in result
 
+    def test_delete_files_uses_json_batch(self, connector):
+        """Test bulk deletes share one $batch request per 20 paths."""
+        def batch_response(url, json):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {'responses': [
+                {'id': request['id'], 'status': 204 if request['id'] != '1' else 500}
+                for request in reversed(json['requests'])
+            ]}
+            return response
+
+        connector._session.post.side_effect = batch_response
+        paths = [f"remote/file{i}.txt" for i in range(21)] + ["../escape.txt"]
+
+        results = connector.delete_files(paths)
+
+        assert connector._session.post.call_count == 2
+        first_batch = connector._session.post.call_args_list[0].kwargs['json']['requests']
+        assert first_batch[0] == {'id': '0', 'method': 'DELETE',
+                                  'url': '/drives/drive-123/root:/remote/file0.txt'}
+        assert len(first_batch) == 20
+        assert results[0] == {'success': True, 'remote_path': 'remote/file0.txt'}
+        assert results[1]['success'] is False
+        assert results[20]['success'] is True
+        assert results[21]['success'] is False
+        connector._session.delete.assert_not_called()
+
     def test_list_files(self, connector):
         """Test listing files."""
         mock_response = Mock()
@@ -259,6 +659,37 @@ class TestOneDriveConnector:
         assert files[0]['is_folder'] is False
         assert files[1]['is_folder'] is True
 
+    def test_list_files_follows_next_link(self, connector):
+        """Test listing pages through @odata.nextLink in order."""
+        first_page = Mock(status_code=200)
+        first_page.json.return_value = {
+            'value': [{'name': 'a.dcm', 'id': 'item-1'}],
+            '@odata.nextLink': 'https://graph.microsoft.com/v1.0/next-page'
+        }
+        second_page = Mock(status_code=200)
+        second_page.json.return_value = {'value': [{'name': 'b.dcm', 'id': 'item-2'}]}
+        connector._session.get.side_effect = [first_page, second_page]
+
+        files = connector.list_files()
+
+        assert [f['path'] for f in files] == ['a.dcm', 'b.dcm']
+        first_call, second_call = connector._session.get.call_args_list
+        assert first_call.kwargs['params']['$top'] == connector.LIST_PAGE_SIZE
+        assert second_call.args[0] == 'https://graph.microsoft.com/v1.0/next-page'
+
+    def test_list_files_parses_with_orjson(self, connector):
+        """Test response bodies are parsed from raw content via orjson."""
+        mock_response = Mock(status_code=200)
+        mock_response.content = json.dumps({'value': [{'name': 'a.dcm'}]}).encode()
+        connector._session.get.return_value = mock_response
+
+        with patch('src.connectors.onedrive_connector.ORJSON_AVAILABLE', True), \
+                patch('src.connectors.onedrive_connector.orjson', json):
+            files = connector.list_files()
+
+        assert [f['path'] for f in files] == ['a.dcm']
+        mock_response.json.assert_not_called()
+
     def test_get_file_metadata(self, connector):
         """Test getting file metadata."""
         mock_response = Mock()
@@ -306,6 +737,47 @@ class TestOneDriveConnector:
 
         assert result['success'] is False
 
+    def test_token_refreshed_before_expiry(self, connector):
+        """Test an access token close to expiry is renewed before use."""
+        from datetime import datetime, timedelta, timezone
+
+        connector._msal_app = Mock()
+        connector._msal_app.acquire_token_for_client.return_value = {
+            'access_token': 'fresh-token',
+            'expires_in': 3600
+        }
+        connector._token_expiry = datetime.now(timezone.utc) + timedelta(minutes=1)
+        connector._session.delete.return_value = Mock(status_code=204)
+
+        connector.delete_file("a.txt")
+
+        assert connector.access_token == 'fresh-token'
+        assert connector._token_expiry > datetime.now(timezone.utc) + timedelta(minutes=30)
+        connector._session.headers.update.assert_called_with(
+            {"Authorization": "Bearer fresh-token"}
+        )
+
+    def test_token_not_refreshed_while_valid(self, connector):
+        """Test a token far from expiry is used without contacting MSAL."""
+        from datetime import datetime, timedelta, timezone
+
+        connector._msal_app = Mock()
+        connector._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        connector._session.delete.return_value = Mock(status_code=204)
+
+        connector.delete_file("a.txt")
+
+        connector._msal_app.acquire_token_for_client.assert_not_called()
+
+    def test_item_path_follows_drive_id(self, connector):
+        """Test the cached item path prefix is rebuilt when drive_id changes."""
+        assert connector._get_item_path("/a/b.txt") == \
+            "https://graph.microsoft.com/v1.0/drives/drive-123/root:/a/b.txt"
+
+        connector.drive_id = None
+        assert connector._get_item_path("a/b.txt") == \
+            "https://graph.microsoft.com/v1.0/me/drive/root:/a/b.txt"
+
     def test_disconnect(self, connector):
         """Test disconnect clears connection."""
         result = connector.disconnect()
@@ -346,3 +818,15 @@ class TestOneDriveConnectorImportError:
                         client_id="test",
                         access_token="test"
                     )
+
+    def test_httpx_not_available(self):
+        """Test error when HTTP/2 is requested without httpx."""
+        with patch('src.connectors.onedrive_connector.HTTPX_AVAILABLE', False):
+            from src.connectors.onedrive_connector import OneDriveConnector
+
+            with pytest.raises(ImportError, match="httpx"):
+                OneDriveConnector(
+                    client_id="test",
+                    access_token="test",
+                    use_http2=True
+                )
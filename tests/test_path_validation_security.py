@@ -255,3 +255,22 @@ class TestPathTraversalSecurity:
             # but documenting expected behavior
             with pytest.raises(ValueError):
                 connector._validate_remote_path(attack)
+
+    def test_decoded_backslash_traversal_rejected(self):
+        """Test '..' components separated by decoded backslashes are rejected."""
+        from src.connectors.base_connector import CloudConnector
+
+        class TestConnector(CloudConnector):
+            def connect(self): return True
+            def disconnect(self): return True
+            def upload_file(self, file_path, remote_path, metadata=None): pass
+            def download_file(self, remote_path, local_path, verify_checksum=True): pass
+            def delete_file(self, remote_path): pass
+            def list_files(self, prefix=''): pass
+            def get_file_metadata(self, remote_path): pass
+
+        connector = TestConnector()
+
+        for attack in ["%2e.%5csecret", "docs%5c.%2e%5ckeys"]:
+            with pytest.raises(ValueError, match="traversal"):
+                connector._validate_remote_path(attack)
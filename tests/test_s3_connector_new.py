@@ -228,6 +228,32 @@ def test_s3_list_files_success():
     assert mock_s3_client_global.list_objects_v2.call_count == 1
 
 
+def test_s3_iter_files_follows_continuation_tokens():
+    """Test that iter_files pages through truncated listings."""
+    from src.connectors.s3_connector import S3Connector
+    connector = S3Connector(
+        bucket_name="test-bucket",
+        access_key="AKIAFAKE",
+        secret_key="secret123"
+    )
+    connector.connect()
+    modified = datetime(2024, 1, 1, 12, 0, 0)
+    mock_s3_client_global.list_objects_v2.side_effect = [
+        {'Contents': [{'Key': 'a', 'Size': 1, 'LastModified': modified}],
+         'IsTruncated': True, 'NextContinuationToken': 'token-1'},
+        {'Contents': [{'Key': 'b', 'Size': 2, 'LastModified': modified}],
+         'IsTruncated': False},
+    ]
+    try:
+        paths = [entry['path'] for entry in connector.iter_files()]
+    finally:
+        mock_s3_client_global.list_objects_v2.side_effect = None
+
+    assert paths == ['a', 'b']
+    second_call = mock_s3_client_global.list_objects_v2.call_args_list[1]
+    assert second_call.kwargs['ContinuationToken'] == 'token-1'
+
+
 def test_s3_list_files_not_connected():
     """Test that list_files fails when not connected."""
     from src.connectors.s3_connector import S3Connector